@@ -9,8 +9,11 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 import logging
+import time
 import httpx
 import config
+from http_clients import post_to_endpoint
+from llm_gateway import PRIORITY_BACKGROUND
 
 logger = logging.getLogger(__name__)
 
@@ -24,24 +27,56 @@ class AgentLLMProcessRequest(BaseModel):
     system_prompt: Optional[str] = Field(None, description="System prompt for AI behavior/context")
     job_id: Optional[int] = Field(None, description="Job ID for logging/tracking")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional context for logging")
+    use_cache: bool = Field(True, description="Reuse the cached response to an identical prompt (false forces a fresh LLM call)")
 
 
 async def call_llm_service_process_single(
     prompt: str,
     system_prompt: Optional[str] = None,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+    priority: int = PRIORITY_BACKGROUND
 ) -> Dict[str, Any]:
     """
     Call LLM service /processSingle endpoint with prompt and optional system prompt.
     
+    Successful responses are cached by content (see llm_response_cache), so a
+    byte-identical prompt with the same model settings is answered from the cache.
+    
     Args:
         prompt: Complete formatted prompt
         system_prompt: Optional system prompt for AI behavior
-        metadata: Optional metadata for logging
+        metadata: Optional metadata for logging (not part of the cache key)
+        use_cache: Set False to skip the response cache and always call the LLM
+        priority: LLM gateway queue priority (agent jobs default to background;
+            user-triggered calls pass llm_gateway.PRIORITY_INTERACTIVE)
         
     Returns:
-        LLM service response dict
+        LLM service response dict ("cached": True when served from the cache)
+        
+    Raises:
+        HTTPException(429/503) with Retry-After when the LLM gateway is saturated
     """
+    from llm_response_cache import (
+        build_llm_response_cache_key,
+        get_cached_llm_response,
+        get_llm_response_settings,
+        record_llm_cache_bypass,
+        set_cached_llm_response,
+    )
+    
+    cache_key = None
+    if config.LLM_RESPONSE_CACHE_ENABLED:
+        if not use_cache:
+            record_llm_cache_bypass()
+        else:
+            settings = await get_llm_response_settings()
+            if settings is not None:
+                cache_key = build_llm_response_cache_key("llm_process_single", prompt, system_prompt, settings)
+                cached_response = get_cached_llm_response(cache_key)
+                if cached_response is not None:
+                    return {**cached_response, "cached": True}
+    
     llm_service_url = f"{config.LLM_SERVICE_URL}/processSingle"
     
     payload = {
@@ -62,10 +97,16 @@ async def call_llm_service_process_single(
     logger.debug(f"Payload keys: {list(payload.keys())}")
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:  # Longer timeout for agent jobs
-            response = await client.post(llm_service_url, json=payload)
-            response.raise_for_status()
-            return response.json()
+        started = time.perf_counter()
+        response = await post_to_endpoint("llm_process_single", json=payload, priority=priority)  # Longer timeout for agent jobs
+        response.raise_for_status()
+        llm_response = response.json()
+        if cache_key and llm_response.get("success"):
+            set_cached_llm_response(cache_key, llm_response, (time.perf_counter() - started) * 1000)
+        return llm_response
+    except HTTPException:
+        # LLM gateway backpressure (429/503 + Retry-After) goes to the caller as-is
+        raise
     except httpx.HTTPStatusError as e:
         logger.error(f"LLM service HTTP error: {e.response.status_code} - {e.response.text}")
         
@@ -167,7 +208,8 @@ async def agent_llm_process(request: AgentLLMProcessRequest):
         llm_response = await call_llm_service_process_single(
             prompt=request.prompt,
             system_prompt=request.system_prompt,
-            metadata=llm_metadata
+            metadata=llm_metadata,
+            use_cache=request.use_cache
         )
         
         # Validate response structure
@@ -193,10 +235,12 @@ async def agent_llm_process(request: AgentLLMProcessRequest):
         logger.info(f"  Model used: {response_data.get('model_used', 'N/A')}")
         logger.info(f"  Provider: {response_data.get('provider', 'N/A')}")
         logger.info(f"  Response length: {len(response_data.get('response', ''))} chars")
+        logger.info(f"  Cached: {bool(llm_response.get('cached'))}")
         
         return {
             "success": True,
-            "data": response_data
+            "data": response_data,
+            "cached": bool(llm_response.get("cached"))
         }
     
     except HTTPException:
@@ -214,3 +258,44 @@ async def agent_llm_process(request: AgentLLMProcessRequest):
             }
         )
 
+
+@agent_llm_router.get("/agent-llm-process/cache/stats")
+async def get_llm_response_cache_stats_endpoint():
+    """
+    LLM response cache statistics (all workers).
+    
+    Returns:
+        Hits, misses, stores, opt-outs, hit rate and the LLM latency saved by hits
+    """
+    from llm_response_cache import get_llm_response_cache_stats
+    
+    try:
+        return {
+            "success": True,
+            "data": get_llm_response_cache_stats(),
+            "message": "LLM response cache statistics retrieved successfully"
+        }
+    except Exception as e:
+        logger.error(f"Error retrieving LLM response cache stats: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve LLM response cache stats: {str(e)}"
+        )
+
+
+@agent_llm_router.get("/llm-gateway/stats")
+async def get_llm_gateway_stats_endpoint():
+    """
+    LLM gateway statistics for this worker.
+    
+    Returns:
+        Per gateway: in-flight calls and caps (overall and per endpoint), queue depth
+        (by priority), wait-time metrics (avg/p95/max ms) and rejection counters
+    """
+    from llm_gateway import get_llm_gateway_stats
+    
+    return {
+        "success": True,
+        "data": get_llm_gateway_stats(),
+        "message": "LLM gateway statistics retrieved successfully"
+    }
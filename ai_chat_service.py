@@ -6,19 +6,21 @@ to the LLM service for OpenAI/Gemini API calls.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
 from sqlalchemy.engine import Connection
 from sqlalchemy import text
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, AsyncIterator
 from enum import Enum
 import logging
 import json
 import httpx
 import os
 import re
+import asyncio
 from datetime import datetime, date
-from database_connection import get_db_connection
+from database_connection import get_db_connection, get_db_engine, get_async_db_engine, run_sync_db
 from database_general import get_ai_card_by_id, get_recommendation_by_id, get_prompt_by_email_and_name, get_formatted_job_data_for_llm_followup_insight, get_formatted_job_data_for_llm_followup_recommendation
 from database_team_metrics import (
     get_closed_sprints_data_db,
@@ -33,6 +35,8 @@ from database_pi import (
 )
 import config
 from sparksai_sql_client import call_sparksai_sql_execute
+from http_clients import acquire_endpoint_slot, post_to_endpoint, stream_from_endpoint
+from llm_gateway import LLMGatewayLease
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +134,8 @@ class AIChatRequest(BaseModel):
     recommendation_id: Optional[str] = Field(None, description="ID of recommendation")
     insights_id: Optional[str] = Field(None, description="ID of insights")
     dashboard_data: Optional[Dict[str, Any]] = Field(None, description="Dashboard layout and filters")
+    history_token_budget: Optional[int] = Field(None, ge=0, description="Max estimated tokens of chat history sent to the LLM (default CHAT_HISTORY_TOKEN_BUDGET)")
+    stream: Optional[bool] = Field(False, description="Stream the answer as server-sent events")
 
     class Config:
         use_enum_values = True
@@ -146,6 +152,11 @@ def get_or_create_chat_history(
     """
     Get existing chat history or create new chat history row.
     
+    Messages come from the append-only chat_messages table (the last
+    CHAT_HISTORY_MAX_MESSAGES not yet folded into the rolling summary, read through
+    its primary key index); the stored history_json metadata (initial_request_*) and
+    the rolling summary are returned alongside them.
+    
     Args:
         conversation_id: Existing conversation ID (UUID)
         user_id: User ID (required for new conversations)
@@ -155,7 +166,7 @@ def get_or_create_chat_history(
         conn: Database connection
         
     Returns:
-        Tuple of (conversation_id as string, history_json dict)
+        Tuple of (conversation_id as string, history_json dict with "messages")
     """
     # Provide defaults for required fields
     username = user_id or "unknown"
@@ -168,25 +179,41 @@ def get_or_create_chat_history(
         try:
             conversation_id_int = int(str(conversation_id))
             query = text(f"""
-                SELECT id, history_json
+                SELECT id, history_json, message_count, summary_text, summary_seq
                 FROM {config.CHAT_HISTORY_TABLE}
                 WHERE id = :conversation_id
             """)
             result = conn.execute(query, {"conversation_id": conversation_id_int})
             row = result.fetchone()
             if row:
-                history_json = row[1] if row[1] is not None else {"messages": []}
-                if not isinstance(history_json, dict):
-                    history_json = {"messages": []}
-                if "messages" not in history_json:
-                    history_json["messages"] = []
+                history_json = row[1] if isinstance(row[1], dict) else {}
+                message_count = row[2] or 0
+                if message_count == 0 and history_json.get("messages"):
+                    # Conversation not migrated yet - move its messages to chat_messages first
+                    from database_chat_messages import migrate_history_json_messages
+                    migrate_history_json_messages(conn, conversation_id=conversation_id_int)
+                    row = conn.execute(query, {"conversation_id": conversation_id_int}).fetchone()
+                    history_json = row[1] if isinstance(row[1], dict) else {}
+                    message_count = row[2] or 0
+                
+                # Messages already folded into the rolling summary are not loaded
+                summary_text, summary_seq = row[3], row[4] or 0
+                from database_chat_messages import load_recent_chat_messages
+                history_json["messages"] = [
+                    {"role": m["role"], "content": m["content"], "token_count": m["token_count"]}
+                    for m in load_recent_chat_messages(
+                        conversation_id_int, message_count, config.CHAT_HISTORY_MAX_MESSAGES, conn,
+                        after_seq=summary_seq
+                    )
+                ]
+                if summary_text:
+                    history_json["rolling_summary"] = {"text": summary_text, "through_seq": summary_seq}
                 return str(row[0]), history_json
         except Exception as e:
             logger.warning(f"Error fetching chat history for conversation_id {conversation_id}: {e}")
             # If fetch fails, create new conversation
     
     # Create new chat history row
-    history_json = {"messages": []}
     insert_query = text(f"""
         INSERT INTO {config.CHAT_HISTORY_TABLE}
         (username, team, pi, chat_type, history_json)
@@ -200,7 +227,7 @@ def get_or_create_chat_history(
             "team": team,
             "pi": pi,
             "chat_type": chat_type,
-            "history_json": json.dumps(history_json)
+            "history_json": json.dumps({})
         })
         row = result.fetchone()
         conn.commit()
@@ -214,73 +241,53 @@ def get_or_create_chat_history(
             detail=f"Failed to create chat history: {str(e)}"
         )
     
-    return new_conversation_id, history_json
+    return new_conversation_id, {"messages": []}
 
 
 def update_chat_history(
     conversation_id: str,
     user_message: str,
     assistant_response: str,
-    conn: Connection
+    conn: Connection,
+    chars_sent: int = 0,
+    tokens_sent: int = 0
 ) -> None:
     """
-    Update chat history with new user message and assistant response.
+    Append the new user message and assistant response to the chat history.
     
     Args:
         conversation_id: Conversation ID (UUID)
         user_message: User's question
         assistant_response: Assistant's response
         conn: Database connection
+        chars_sent: Characters this turn sent to the LLM (added to the conversation's total)
+        tokens_sent: Tokens this turn sent to the LLM (added to the conversation's total)
     """
+    from database_chat_messages import append_chat_messages
+    
     try:
-        # Fetch current history
-        query = text(f"""
-            SELECT history_json
-            FROM {config.CHAT_HISTORY_TABLE}
-            WHERE id = :conversation_id
-        """)
-        
-        result = conn.execute(query, {"conversation_id": conversation_id})
-        row = result.fetchone()
+        seqs = append_chat_messages(
+            int(conversation_id),
+            [
+                {"role": "user", "content": user_message},
+                {"role": "assistant", "content": assistant_response}
+            ],
+            conn,
+            chars_sent=chars_sent,
+            tokens_sent=tokens_sent
+        )
         
-        if not row:
+        if not seqs:
             logger.error(f"Chat history not found for conversation_id: {conversation_id}")
+            conn.rollback()
             raise HTTPException(
                 status_code=404,
                 detail=f"Chat history not found for conversation_id: {conversation_id}"
             )
         
-        # Get current history
-        history_json = row[0] if row[0] is not None else {"messages": []}
-        if not isinstance(history_json, dict):
-            history_json = {"messages": []}
-        if "messages" not in history_json:
-            history_json["messages"] = []
-        
-        # Add new messages
-        history_json["messages"].append({
-            "role": "user",
-            "content": user_message
-        })
-        history_json["messages"].append({
-            "role": "assistant",
-            "content": assistant_response
-        })
-        
-        # Update database
-        update_query = text(f"""
-            UPDATE {config.CHAT_HISTORY_TABLE}
-            SET history_json = CAST(:history_json AS jsonb)
-            WHERE id = :conversation_id
-        """)
-        
-        conn.execute(update_query, {
-            "conversation_id": conversation_id,
-            "history_json": json.dumps(history_json)
-        })
         conn.commit()
         
-        logger.info(f"Updated chat history for conversation_id: {conversation_id}")
+        logger.info(f"Updated chat history for conversation_id: {conversation_id} (messages {seqs[0]}-{seqs[-1]})")
         
     except HTTPException:
         raise
@@ -293,6 +300,65 @@ def update_chat_history(
         )
 
 
+def save_chat_turn(
+    conversation_id: str,
+    user_message: str,
+    assistant_response: str,
+    conn: Connection,
+    chars_sent: int = 0,
+    tokens_sent: int = 0
+) -> None:
+    """
+    Persist a completed chat turn: issue key extracted from the answer (if any),
+    the new user/assistant exchange and what the turn sent to the LLM.
+    
+    Args:
+        conversation_id: Conversation ID
+        user_message: User's question (as saved to history)
+        assistant_response: Final assistant answer
+        conn: Database connection
+        chars_sent: Characters sent to the LLM for this turn
+        tokens_sent: Tokens sent to the LLM for this turn
+    """
+    # Extract and save issue key from LLM response (always extract from final LLM answer)
+    extracted_issue_key = extract_issue_key_from_response(assistant_response)
+    if extracted_issue_key:
+        # Update chat_history table with issue_key
+        update_issue_key_query = text(f"""
+            UPDATE {config.CHAT_HISTORY_TABLE}
+            SET issue_key = :issue_key
+            WHERE id = :conversation_id
+        """)
+        
+        try:
+            conn.execute(update_issue_key_query, {
+                "issue_key": extracted_issue_key,
+                "conversation_id": int(conversation_id)
+            })
+            conn.commit()
+            logger.info(f"Updated issue_key in chat_history: {extracted_issue_key}")
+        except Exception as e:
+            logger.error(f"Error updating issue_key in chat_history: {e}")
+            # Don't fail the request if issue_key update fails
+            conn.rollback()
+    
+    update_chat_history(
+        conversation_id=conversation_id,
+        user_message=user_message,
+        assistant_response=assistant_response,
+        conn=conn,
+        chars_sent=chars_sent,
+        tokens_sent=tokens_sent
+    )
+    
+    # Fold older messages into the rolling summary once enough have accumulated
+    try:
+        from chat_context_window import maybe_schedule_chat_summary
+        maybe_schedule_chat_summary(int(conversation_id), conn)
+    except Exception as e:
+        logger.warning(f"Failed to schedule chat summary refresh: {e}")
+
+
 def build_team_dashboard_context(
     team_name: Optional[str],
     prompt_name: Optional[str],
@@ -1234,7 +1300,7 @@ def extract_issue_key_from_response(response: str) -> Optional[str]:
     return None
 
 
-async def call_llm_service(
+def build_llm_chat_payload(
     conversation_id: str,
     question: str,
     history_json: Dict[str, Any],
@@ -1243,10 +1309,11 @@ async def call_llm_service(
     selected_pi: Optional[str],
     chat_type: Optional[str],
     conversation_context: Optional[str] = None,
-    system_message: Optional[str] = None
+    system_message: Optional[str] = None,
+    history_token_budget: Optional[int] = None
 ) -> Dict[str, Any]:
     """
-    Call LLM service with minimal payload.
+    Build the LLM service chat payload (shared by the JSON and streaming calls).
     
     Args:
         conversation_id: Conversation ID
@@ -1258,12 +1325,11 @@ async def call_llm_service(
         chat_type: Chat type
         conversation_context: Optional additional context to include (e.g., for Team_insights)
         system_message: Optional system message to set AI behavior/context (controlled by backend)
+        history_token_budget: Max estimated history tokens (default CHAT_HISTORY_TOKEN_BUDGET)
         
     Returns:
-        LLM service response dict
+        Payload dict for the LLM service
     """
-    llm_service_url = f"{config.LLM_SERVICE_URL}/chat"
-    
     # OPTIMIZATION: Strip stored context from history_json before sending to LLM
     # This prevents duplicate data: stored context is already sent via conversation_context parameter
     # Keep stored context in database, but only send messages to LLM to reduce token usage
@@ -1271,9 +1337,17 @@ async def call_llm_service(
     if history_json and isinstance(history_json, dict):
         # Create stripped version with only messages (conversation history)
         # Remove stored context fields that are already sent via conversation_context
+        # Messages are windowed to the token budget: system message + rolling summary + recent turns
+        from chat_context_window import build_history_window, resolve_token_budget
+        window_messages, window_stats = build_history_window(history_json, resolve_token_budget(history_token_budget))
         history_json_for_llm = {
-            "messages": history_json.get("messages", [])
+            "messages": window_messages
         }
+        logger.info(
+            f"History window: {window_stats['messages_sent']}/{window_stats['messages_available']} messages, "
+            f"~{window_stats['tokens_sent']}/{window_stats['token_budget']} tokens, "
+            f"summary {'used' if window_stats['summary_used'] else 'not used'}"
+        )
         
         # Log the optimization
         original_size = len(json.dumps(history_json))
@@ -1302,17 +1376,9 @@ async def call_llm_service(
     YELLOW = '\033[93m'
     RESET = '\033[0m'
     
-    logger.info(f"Calling LLM service: {llm_service_url}")
-    
     # Calculate total chars being sent (using stripped history_json)
-    total_chars_sent = len(question) if question else 0
-    if conversation_context:
-        total_chars_sent += len(conversation_context)
-    if system_message:
-        total_chars_sent += len(system_message)
-    if history_json_for_llm:
-        history_str = json.dumps(history_json_for_llm) if isinstance(history_json_for_llm, dict) else str(history_json_for_llm)
-        total_chars_sent += len(history_str)
+    from database_chat_messages import measure_llm_payload
+    total_chars_sent, estimated_tokens_sent = measure_llm_payload(payload)
     
     if conversation_context:
         logger.info(f"Conversation context included: {len(conversation_context)} chars")
@@ -1324,14 +1390,88 @@ async def call_llm_service(
         logger.info("No system message provided")
     
     logger.info(f"{BOLD}{YELLOW}Question: {question}{RESET}")
-    logger.info(f"{BOLD}{CYAN}Total chars sent to LLM: {total_chars_sent}{RESET}")
+    logger.info(f"{BOLD}{CYAN}Total chars sent to LLM: {total_chars_sent} (~{estimated_tokens_sent} tokens){RESET}")
     logger.debug(f"Payload: {payload}")
     
+    return payload
+
+
+def llm_usage_sent(llm_result: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Characters and tokens a chat call sent to the LLM.
+    Tokens are the prompt tokens the LLM service reports, or the estimate when it reports none.
+    
+    Args:
+        llm_result: call_llm_service response, or the "done" event of call_llm_service_stream
+        
+    Returns:
+        (chars_sent, tokens_sent)
+    """
+    chars_sent = llm_result.get("chars_sent") or 0
+    tokens_sent = llm_result.get("estimated_tokens_sent") or 0
+    tokens_used = llm_result.get("tokens_used")
+    if isinstance(tokens_used, dict) and isinstance(tokens_used.get("prompt_tokens"), int):
+        tokens_sent = tokens_used["prompt_tokens"]
+    return chars_sent, tokens_sent
+
+
+async def call_llm_service(
+    conversation_id: str,
+    question: str,
+    history_json: Dict[str, Any],
+    user_id: Optional[str],
+    selected_team: Optional[str],
+    selected_pi: Optional[str],
+    chat_type: Optional[str],
+    conversation_context: Optional[str] = None,
+    system_message: Optional[str] = None,
+    history_token_budget: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Call LLM service with minimal payload.
+    
+    Args:
+        conversation_id: Conversation ID
+        question: User's question
+        history_json: Chat history JSON
+        user_id: User ID
+        selected_team: Team name
+        selected_pi: PI name
+        chat_type: Chat type
+        conversation_context: Optional additional context to include (e.g., for Team_insights)
+        system_message: Optional system message to set AI behavior/context (controlled by backend)
+        history_token_budget: Max estimated history tokens (default CHAT_HISTORY_TOKEN_BUDGET)
+        
+    Returns:
+        LLM service response dict, plus chars_sent / estimated_tokens_sent for the payload
+    """
+    from database_chat_messages import measure_llm_payload
+    
+    llm_service_url = f"{config.LLM_SERVICE_URL}/chat"
+    logger.info(f"Calling LLM service: {llm_service_url}")
+    
+    payload = build_llm_chat_payload(
+        conversation_id=conversation_id,
+        question=question,
+        history_json=history_json,
+        user_id=user_id,
+        selected_team=selected_team,
+        selected_pi=selected_pi,
+        chat_type=chat_type,
+        conversation_context=conversation_context,
+        system_message=system_message,
+        history_token_budget=history_token_budget
+    )
+    
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(llm_service_url, json=payload)
-            response.raise_for_status()
-            return response.json()
+        response = await post_to_endpoint("llm_chat", json=payload)
+        response.raise_for_status()
+        llm_result = response.json()
+        llm_result["chars_sent"], llm_result["estimated_tokens_sent"] = measure_llm_payload(payload)
+        return llm_result
+    except HTTPException:
+        # LLM gateway backpressure (429/503 + Retry-After) goes to the client as-is
+        raise
     except httpx.HTTPError as e:
         logger.error(f"HTTP error calling LLM service: {e}")
         raise HTTPException(
@@ -1346,16 +1486,64 @@ async def call_llm_service(
         )
 
 
+async def call_llm_service_stream(gateway_lease: Optional[LLMGatewayLease] = None, **llm_kwargs) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Call LLM service /chat/stream and yield its events as they arrive.
+    
+    The LLM service streams server-sent events whose data lines are JSON objects:
+    - {"type": "token", "content": str}: next chunk of the answer
+    - {"type": "done", "provider": str, "model": str, "tokens_used": ...}: end of answer
+      (chars_sent / estimated_tokens_sent for the payload are added here)
+    - {"type": "error", "message": str}: generation failed
+    
+    Args:
+        gateway_lease: LLM gateway slot taken before the response started (released when the stream closes)
+        **llm_kwargs: Same arguments as call_llm_service
+        
+    Yields:
+        Event dicts as described above
+    """
+    from database_chat_messages import measure_llm_payload
+    
+    llm_service_url = f"{config.LLM_SERVICE_URL}/chat/stream"
+    logger.info(f"Calling LLM service (streaming): {llm_service_url}")
+    
+    payload = build_llm_chat_payload(**llm_kwargs)
+    chars_sent, estimated_tokens_sent = measure_llm_payload(payload)
+    
+    async with stream_from_endpoint("llm_chat_stream", json=payload, lease=gateway_lease) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if not data or data == "[DONE]":
+                continue
+            try:
+                event = json.loads(data)
+            except json.JSONDecodeError:
+                # Plain-text chunk - treat as a token
+                yield {"type": "token", "content": data}
+                continue
+            if isinstance(event, dict) and event.get("type") == "done":
+                event["chars_sent"] = chars_sent
+                event["estimated_tokens_sent"] = estimated_tokens_sent
+            yield event
+
+
 async def fetch_dashboard_reports_data(
     dashboard_data: Dict[str, Any],
     conn: Connection
 ) -> str:
     """
     Fetch all report data from dashboard layout config.
+    Reports are resolved concurrently on pooled async connections (bounded by
+    DASHBOARD_REPORTS_MAX_CONCURRENCY); a report that exceeds
+    DASHBOARD_REPORT_TIMEOUT_SECONDS is returned as an "unavailable" section.
     
     Args:
         dashboard_data: Dashboard state with layoutConfig, topBarFilters, reportFilters, pinnedFilters
-        conn: Database connection
+        conn: Database connection (used only when the async engine is not available)
         
     Returns:
         Formatted string containing all report data for LLM context
@@ -1364,7 +1552,9 @@ async def fetch_dashboard_reports_data(
     from datetime import datetime, date
     from decimal import Decimal
     from database_reports import get_report_definition_by_id, resolve_report_data
-    from cache_utils import generate_cache_key, get_cached_report, set_cached_report, get_report_cache_ttl
+    from report_registry import get_registered_report_definition
+    from cache_utils import generate_cache_key, get_cached_report_entry, set_cached_report, get_report_cache_ttls
+    from llm_context_encoding import encode_report_for_llm, is_excluded_from_llm
     
     # Custom JSON encoder to handle datetime and Decimal objects
     class DateTimeEncoder(json.JSONEncoder):
@@ -1432,28 +1622,25 @@ async def fetch_dashboard_reports_data(
     
     logger.info(f"Fetching data for {len(report_ids)} reports: {report_ids}")
     
-    # Fetch data for each report
-    formatted_reports = []
-    for idx, report_id in enumerate(report_ids, 1):
-        # TEMPORARY FIX: Skip Epic Hierarchy report for LLM context
-        # TODO: Replace with proper solution using report definition flag
-        # Proper fix should:
-        # 1. Add a flag in report definition (e.g., "exclude_from_llm" or "send_to_llm: false") 
-        #    that indicates "Do not send this report to LLM"
-        # 2. UI should not show reports with this flag in the list of reports that will be sent to LLM
-        # 3. Code should use this flag generically to make the decision instead of hardcoding report_id checks
-        if report_id == "issues-epics-hierarchy":
-            logger.info(f"Skipping report '{report_id}' for LLM context (temporary fix)")
-            continue
+    def build_report_section(idx: int, report_id: str, conn: Connection) -> Optional[str]:
+        """
+        Resolve a single dashboard report and format it for LLM context.
+        Runs on its own pooled connection so reports can be resolved concurrently.
         
+        Returns:
+            Formatted report section, or None if the report should be skipped
+        """
         try:
             logger.info(f"[{idx}/{len(report_ids)}] Processing report: {report_id}")
             
             # Get report definition
-            definition = get_report_definition_by_id(report_id, conn)
+            definition = get_registered_report_definition(report_id) or get_report_definition_by_id(report_id, conn)
             if not definition:
                 logger.warning(f"Report '{report_id}' not found, skipping")
-                continue
+                return None
+            if is_excluded_from_llm(definition):
+                logger.info(f"Skipping report '{report_id}' for LLM context (excluded by its definition)")
+                return None
             
             # Merge filters: default < top bar < report-specific
             default_filters = definition.get("default_filters", {})
@@ -1465,7 +1652,9 @@ async def fetch_dashboard_reports_data(
             
             # Check cache first
             cache_key = generate_cache_key(report_id, merged_filters)
-            cached_data = get_cached_report(cache_key)
+            cached_entry = get_cached_report_entry(cache_key)
+            # The LLM should see current data - stale entries are re-resolved here
+            cached_data = cached_entry.payload if cached_entry is not None and not cached_entry.is_stale else None
             
             if cached_data:
                 logger.info(f"  ✓ Using cached data for report '{report_id}'")
@@ -1488,33 +1677,59 @@ async def fetch_dashboard_reports_data(
                 }
                 
                 # Cache the result
-                ttl = get_report_cache_ttl(report_id)
-                set_cached_report(cache_key, report_data, ttl=ttl)
-                logger.info(f"  ✓ Cached report data with TTL: {ttl}s")
+                soft_ttl, ttl = get_report_cache_ttls(report_id)
+                set_cached_report(cache_key, report_data, ttl=ttl, soft_ttl=soft_ttl)
+                logger.info(f"  ✓ Cached report data with TTL: {soft_ttl}s (hard {ttl}s)")
             
             # Format report data for LLM
             report_name = report_data["definition"]["report_name"]
             report_desc = report_data["definition"].get("description", "")
             report_result = report_data.get("result", [])
             
-            # Truncate data if max_records_for_llm is set (to limit LLM context size)
-            max_records = definition.get("max_records_for_llm")
-            if max_records and isinstance(report_result, list) and len(report_result) > max_records:
-                original_count = len(report_result)
-                report_result = report_result[:max_records]
-                logger.info(f"  Truncated report '{report_id}' data from {original_count} to {max_records} records for LLM")
-            
-            formatted_report = f"\n## {report_name}\n"
-            if report_desc:
-                formatted_report += f"Description: {report_desc}\n"
-            formatted_report += f"Filters: {json.dumps(merged_filters, indent=2, cls=DateTimeEncoder)}\n"
-            formatted_report += f"Data: {json.dumps(report_result, indent=2, cls=DateTimeEncoder)}\n"
-            
-            formatted_reports.append(formatted_report)
+            # Compact tables, with long series summarized (see llm_context_encoding)
+            return encode_report_for_llm(report_name, report_desc, merged_filters, report_result, definition)
             
         except Exception as e:
             logger.error(f"Error fetching report '{report_id}': {e}")
-            formatted_reports.append(f"\n## {report_id}\nError: Failed to fetch data - {str(e)}\n")
+            return f"\n## {report_id}\nError: Failed to fetch data - {str(e)}\n"
+    
+    async_engine = get_async_db_engine()
+    timeout_seconds = config.DASHBOARD_REPORT_TIMEOUT_SECONDS
+    
+    if async_engine is None:
+        # No async pool available - resolve sequentially on the request connection
+        logger.warning("Async database engine not available, resolving dashboard reports sequentially")
+        sections = [build_report_section(idx, report_id, conn) for idx, report_id in enumerate(report_ids, 1)]
+    else:
+        # Fan out across pooled connections with bounded concurrency and a per-report timeout
+        semaphore = asyncio.Semaphore(config.DASHBOARD_REPORTS_MAX_CONCURRENCY)
+        
+        async def resolve_on_pooled_connection(idx: int, report_id: str) -> str:
+            async with async_engine.connect() as report_conn:
+                return await run_sync_db(report_conn, build_report_section, idx, report_id)
+        
+        async def resolve_with_limits(idx: int, report_id: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    # The timeout covers the pool checkout too (a saturated pool would otherwise wait pool_timeout)
+                    return await asyncio.wait_for(
+                        resolve_on_pooled_connection(idx, report_id),
+                        timeout=timeout_seconds
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Report '{report_id}' timed out after {timeout_seconds}s, marking as unavailable")
+                    return f"\n## {report_id}\nData unavailable: report did not respond within {timeout_seconds}s\n"
+                except Exception as e:
+                    logger.error(f"Error fetching report '{report_id}': {e}")
+                    return f"\n## {report_id}\nError: Failed to fetch data - {str(e)}\n"
+        
+        logger.info(f"Resolving {len(report_ids)} reports concurrently (max_concurrency={config.DASHBOARD_REPORTS_MAX_CONCURRENCY}, timeout={timeout_seconds}s)")
+        sections = await asyncio.gather(*[
+            resolve_with_limits(idx, report_id) for idx, report_id in enumerate(report_ids, 1)
+        ])
+    
+    # Keep dashboard layout order
+    formatted_reports = [section for section in sections if section]
     
     final_context = "\n".join(formatted_reports)
     total_chars = len(final_context)
@@ -1528,6 +1743,101 @@ async def fetch_dashboard_reports_data(
     return final_context
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _save_chat_turn_after_stream(
+    conversation_id: str,
+    user_message: str,
+    assistant_response: str,
+    chars_sent: int = 0,
+    tokens_sent: int = 0
+) -> None:
+    """
+    Persist a streamed chat turn on its own pooled connection.
+    The request-scoped connection may already be released once the response starts streaming.
+    """
+    usage = {"chars_sent": chars_sent, "tokens_sent": tokens_sent}
+    async_engine = get_async_db_engine()
+    if async_engine is not None:
+        async with async_engine.connect() as save_conn:
+            await run_sync_db(save_conn, save_chat_turn, conversation_id, user_message, assistant_response, **usage)
+        return
+    
+    sync_engine = get_db_engine()
+    if sync_engine is None:
+        raise Exception("Database engine is not initialized")
+    with sync_engine.connect() as save_conn:
+        save_chat_turn(conversation_id, user_message, assistant_response, save_conn, **usage)
+
+
+async def stream_ai_chat_response(
+    llm_kwargs: Dict[str, Any],
+    user_message_to_save: str,
+    input_params: Dict[str, Any],
+    gateway_lease: Optional[LLMGatewayLease] = None
+) -> AsyncIterator[str]:
+    """
+    Relay LLM tokens to the client as server-sent events.
+    
+    Events:
+    - token: {"content": str} for each chunk of the answer
+    - done: {"conversation_id", "input_parameters", "provider", "model", "tokens_used", "history_saved"}
+    - error: {"conversation_id", "message"} if the LLM call fails
+    
+    Chat history is saved once the stream completes, before the done event.
+    gateway_lease (taken before the response started) is released once the LLM stream ends.
+    """
+    conversation_id = llm_kwargs["conversation_id"]
+    answer_parts: List[str] = []
+    final_meta: Dict[str, Any] = {}
+    
+    try:
+        async for llm_event in call_llm_service_stream(gateway_lease=gateway_lease, **llm_kwargs):
+            event_type = llm_event.get("type", "token")
+            if event_type == "token":
+                content = llm_event.get("content") or ""
+                if content:
+                    answer_parts.append(content)
+                    yield _sse_event("token", {"content": content})
+            elif event_type == "done":
+                final_meta = llm_event
+            elif event_type == "error":
+                raise Exception(llm_event.get("message", "Unknown error"))
+    except Exception as e:
+        logger.error(f"Error streaming LLM response for conversation_id {conversation_id}: {e}")
+        yield _sse_event("error", {
+            "conversation_id": conversation_id,
+            "message": f"LLM service error: {str(e)}"
+        })
+        return
+    finally:
+        if gateway_lease:
+            gateway_lease.release()
+    
+    ai_response = "".join(answer_parts)
+    logger.info(f"LLM stream completed - Conversation ID: {conversation_id}, response length: {len(ai_response)} chars")
+    
+    history_saved = True
+    try:
+        chars_sent, tokens_sent = llm_usage_sent(final_meta)
+        await _save_chat_turn_after_stream(conversation_id, user_message_to_save, ai_response, chars_sent, tokens_sent)
+    except Exception as e:
+        history_saved = False
+        logger.error(f"Error saving streamed chat turn for conversation_id {conversation_id}: {e}")
+    
+    yield _sse_event("done", {
+        "conversation_id": conversation_id,
+        "input_parameters": input_params,
+        "provider": final_meta.get("provider"),
+        "model": final_meta.get("model"),
+        "tokens_used": final_meta.get("tokens_used"),
+        "history_saved": history_saved
+    })
+
+
 @ai_chat_router.post("/ai-chat")
 async def ai_chat(
     request: AIChatRequest,
@@ -1977,15 +2287,18 @@ async def ai_chat(
                                 history_json['initial_request_data_only'] = conversation_context
                                 logger.warning("Epic marker not found in Epic Refinement context, using full context as fallback")
 
-                # Seed initial messages into history_json for follow-ups
+                # Seed initial messages into history for follow-ups
                 history_json.setdefault('messages', [])
                 if system_message:
                     history_json['messages'].append({
                         'role': 'system',
                         'content': system_message
                     })
+                    from database_chat_messages import append_chat_messages
+                    append_chat_messages(int(conversation_id), [{'role': 'system', 'content': system_message}], conn)
                 # Note: conversation_context is sent as a parameter, not seeded into history_json
                 # This matches the original working approach
+                # Messages live in chat_messages - history_json only keeps the initial_request_* snapshot
                 snapshot_update_query = text(f"""
                     UPDATE {config.CHAT_HISTORY_TABLE}
                     SET history_json = CAST(:history_json AS jsonb)
@@ -1993,12 +2306,13 @@ async def ai_chat(
                 """)
                 conn.execute(snapshot_update_query, {
                     'conversation_id': int(conversation_id),
-                    'history_json': json.dumps(history_json)
+                    'history_json': json.dumps({k: v for k, v in history_json.items() if k not in ('messages', 'rolling_summary')})
                 })
                 conn.commit()
                 logger.info("Stored initial system/context and seeded messages in chat history")
         except Exception as e:
             logger.warning(f"Failed to store initial request snapshot: {e}")
+            conn.rollback()
 
         # 2.10. Check for SQL AI trigger and process if needed
         # Initialize variables to track SQL data for chat history
@@ -2201,66 +2515,7 @@ Results ({row_count} row{'s' if row_count != 1 else ''}):
         logger.info(f"system_message: {'SET' if system_message else 'None'}")
         logger.info("=" * 80)
         
-        llm_response = await call_llm_service(
-            conversation_id=conversation_id,
-            question=question_to_send,
-            history_json=history_json,
-            user_id=request.user_id,
-            selected_team=request.selected_team,
-            selected_pi=request.selected_pi,
-            chat_type=chat_type_str,
-            conversation_context=conversation_context_for_llm,
-            system_message=system_message
-        )
-        
-        if not llm_response.get("success"):
-            raise HTTPException(
-                status_code=502,
-                detail=f"LLM service returned error: {llm_response.get('detail', 'Unknown error')}"
-            )
-        
-        ai_response = llm_response.get("response", "")
-        
-        # Log LLM response details
-        logger.info("=" * 80)
-        logger.info("LLM RESPONSE RECEIVED")
-        logger.info("=" * 80)
-        logger.info(f"Response length: {len(ai_response)} chars")
-        if ai_response:
-            preview_length = min(500, len(ai_response))
-            logger.info(f"Response preview (first {preview_length} chars): {ai_response[:preview_length]}...")
-            if len(ai_response) > preview_length:
-                logger.info(f"... (truncated, {len(ai_response) - preview_length} more chars)")
-        else:
-            logger.warning("LLM response is empty")
-        logger.info(f"Provider: {llm_response.get('provider', 'N/A')}")
-        logger.info(f"Model: {llm_response.get('model', 'N/A')}")
-        logger.info(f"Tokens used: {llm_response.get('tokens_used', 'N/A')}")
-        logger.info("=" * 80)
-        
-        # 3.5. Extract and save issue key from LLM response (always extract from final LLM answer)
-        extracted_issue_key = extract_issue_key_from_response(ai_response)
-        if extracted_issue_key:
-            # Update chat_history table with issue_key
-            update_issue_key_query = text(f"""
-                UPDATE {config.CHAT_HISTORY_TABLE}
-                SET issue_key = :issue_key
-                WHERE id = :conversation_id
-            """)
-            
-            try:
-                conn.execute(update_issue_key_query, {
-                    "issue_key": extracted_issue_key,
-                    "conversation_id": int(conversation_id)
-                })
-                conn.commit()
-                logger.info(f"Updated issue_key in chat_history: {extracted_issue_key}")
-            except Exception as e:
-                logger.error(f"Error updating issue_key in chat_history: {e}")
-                # Don't fail the request if issue_key update fails
-                conn.rollback()
-        
-        # 4. Update chat history with new exchange
+        # 3. Prepare the user message to persist and the input parameters echoed back
         # Remove "!" trigger from question before saving to history
         clean_question_for_history = request.question
         if request.question and request.question.startswith(config.SQL_AI_TRIGGER):
@@ -2276,14 +2531,6 @@ Results ({row_count} row{'s' if row_count != 1 else ''}):
         else:
             user_message_to_save = clean_question_for_history
         
-        update_chat_history(
-            conversation_id=conversation_id,
-            user_message=user_message_to_save,
-            assistant_response=ai_response,
-            conn=conn
-        )
-        
-        # 5. Prepare response
         input_params = {
             "conversation_id": conversation_id,
             "question": request.question
@@ -2303,6 +2550,78 @@ Results ({row_count} row{'s' if row_count != 1 else ''}):
         if request.insights_id:
             input_params["insights_id"] = request.insights_id
         
+        llm_kwargs = {
+            "conversation_id": conversation_id,
+            "question": question_to_send,
+            "history_json": history_json,
+            "user_id": request.user_id,
+            "selected_team": request.selected_team,
+            "selected_pi": request.selected_pi,
+            "chat_type": chat_type_str,
+            "conversation_context": conversation_context_for_llm,
+            "system_message": system_message,
+            "history_token_budget": request.history_token_budget
+        }
+        
+        # 3.1. Streaming mode: relay tokens as server-sent events, persist history once the stream completes
+        if request.stream:
+            logger.info(f"Streaming AI chat response (SSE) - Conversation ID: {conversation_id}")
+            stream_headers = {
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+                "SA-ChatID": str(conversation_id),
+            }
+            if request.insights_id:
+                stream_headers["SA-InsightID"] = str(request.insights_id)
+            # Take the LLM gateway slot now, so saturation is still a 429/503 rather than an SSE error.
+            # The background task gives it back if the stream never starts (client already gone).
+            gateway_lease = await acquire_endpoint_slot("llm_chat_stream")
+            return StreamingResponse(
+                stream_ai_chat_response(llm_kwargs, user_message_to_save, input_params, gateway_lease),
+                media_type="text/event-stream",
+                headers=stream_headers,
+                background=BackgroundTask(gateway_lease.release) if gateway_lease else None
+            )
+        
+        # 4. Call LLM service
+        llm_response = await call_llm_service(**llm_kwargs)
+        
+        if not llm_response.get("success"):
+            raise HTTPException(
+                status_code=502,
+                detail=f"LLM service returned error: {llm_response.get('detail', 'Unknown error')}"
+            )
+        
+        ai_response = llm_response.get("response", "")
+        
+        # Log LLM response details
+        logger.info("=" * 80)
+        logger.info("LLM RESPONSE RECEIVED")
+        logger.info("=" * 80)
+        logger.info(f"Response length: {len(ai_response)} chars")
+        if ai_response:
+            preview_length = min(500, len(ai_response))
+            logger.info(f"Response preview (first {preview_length} chars): {ai_response[:preview_length]}...")
+            if len(ai_response) > preview_length:
+                logger.info(f"... (truncated, {len(ai_response) - preview_length} more chars)")
+        else:
+            logger.warning("LLM response is empty")
+        logger.info(f"Provider: {llm_response.get('provider', 'N/A')}")
+        logger.info(f"Model: {llm_response.get('model', 'N/A')}")
+        logger.info(f"Tokens used: {llm_response.get('tokens_used', 'N/A')}")
+        logger.info("=" * 80)
+        
+        # 5. Save issue key, new exchange and LLM usage to chat history
+        chars_sent, tokens_sent = llm_usage_sent(llm_response)
+        save_chat_turn(
+            conversation_id=conversation_id,
+            user_message=user_message_to_save,
+            assistant_response=ai_response,
+            conn=conn,
+            chars_sent=chars_sent,
+            tokens_sent=tokens_sent
+        )
+        
         logger.info(f"AI chat request processed successfully - Conversation ID: {conversation_id}")
         
         tokens_used = llm_response.get("tokens_used")
@@ -26,6 +26,7 @@ from database_general import (
     add_priority_color_to_card,
 )
 from insight_types_service import get_insight_category_names
+from pagination import FORMAT_JSON, FORMAT_NDJSON, decode_cursor, ndjson_response, split_page, validate_response_format
 import config
 
 logger = logging.getLogger(__name__)
@@ -131,6 +132,31 @@ def validate_limit_large(limit: int) -> int:
     return limit
 
 
+def _ai_insight_row_to_dict(row) -> Dict[str, Any]:
+    # Truncate description to first 200 characters with ellipsis when longer
+    description_text = row[6]
+    if isinstance(description_text, str) and len(description_text) > 200:
+        description_text = description_text[:200] + "..."
+    
+    card_dict = {
+        "id": row[0],
+        "date": row[1],
+        "team_name": row[2],
+        "group_name": row[3],
+        "card_name": row[4],
+        "priority": row[5],
+        "description": description_text,
+        "source_job_id": row[7],
+        "pi": row[8] if len(row) > 8 else None,
+        "insight_type": row[9] if len(row) > 9 else None,
+        "updated_at": row[10] if len(row) > 10 else None,
+        "created_at": row[11] if len(row) > 11 else None
+    }
+    # Add priority_color
+    add_priority_color_to_card(card_dict)
+    return card_dict
+
+
 @ai_insights_router.get("/ai-insights/getTopCards")
 async def get_ai_insights(
     insight_type: str = Query(..., description="Type of insight: 'team', 'group', or 'pi'"),
@@ -391,12 +417,16 @@ async def get_ai_insights_collection(
     group_name: Optional[str] = Query(None, description="Filter by group name"),
     pi: Optional[str] = Query(None, description="Filter by PI name"),
     limit: int = Query(100, description="Maximum number of cards to return (default: 100)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    response_format: str = Query(FORMAT_JSON, alias="format", description="json (paged) or ndjson (stream all matching cards)"),
     conn: Connection = Depends(get_db_connection)
 ):
     """
     Get AI summary cards collection with optional filtering.
     Returns the latest cards by default, or filtered results if parameters are provided.
     Uses parameterized queries to prevent SQL injection.
+    Pages are keyset-paginated: pass data.next_cursor as cursor to get the next page (null on the last page).
+    With format=ndjson all matching cards are streamed, one JSON object per line (limit is ignored).
     
     Args:
         insight_type: Optional filter by insight type (e.g., 'PI Dependencies', 'Daily Progress')
@@ -406,9 +436,11 @@ async def get_ai_insights_collection(
         group_name: Optional group name filter
         pi: Optional PI name filter
         limit: Maximum number of cards to return (default: 100)
+        cursor: Opaque cursor from the previous page's next_cursor
+        response_format: "json" or "ndjson"
     
     Returns:
-        JSON response with list of AI cards and count
+        JSON response with list of AI cards and count, or an NDJSON stream
     """
     try:
         # Validate date format if provided
@@ -429,6 +461,16 @@ async def get_ai_insights_collection(
                 )
         
         validated_limit = validate_limit_large(limit)
+        validate_response_format(response_format)
+        cursor_filters = {
+            "insight_type": insight_type,
+            "date": date,
+            "card_name": card_name,
+            "team_name": team_name,
+            "group_name": group_name,
+            "pi": pi,
+        }
+        cursor_id = decode_cursor(cursor, cursor_filters)
         
         # Build WHERE clause dynamically
         where_conditions = []
@@ -465,10 +507,16 @@ async def get_ai_insights_collection(
             where_conditions.append("pi = :pi")
             params["pi"] = validated_pi
         
+        # Keyset pagination: continue after the last card of the previous page
+        if cursor_id is not None:
+            where_conditions.append("id < :cursor_id")
+            params["cursor_id"] = cursor_id
+        
         # Build WHERE clause
         where_clause = ""
         if where_conditions:
             where_clause = "WHERE " + " AND ".join(where_conditions)
+        limit_clause = "" if response_format == FORMAT_NDJSON else "LIMIT :limit"
         
         # SECURE: Parameterized query prevents SQL injection
         # Return all fields including updated_at, created_at, and insight_type
@@ -489,9 +537,10 @@ async def get_ai_insights_collection(
             FROM {config.AI_INSIGHTS_TABLE}
             {where_clause}
             ORDER BY id DESC 
-            LIMIT :limit
+            {limit_clause}
         """)
-        params["limit"] = validated_limit
+        # One extra row tells whether there is a next page
+        params["limit"] = validated_limit + 1
         
         filter_info = []
         if insight_type:
@@ -508,37 +557,18 @@ async def get_ai_insights_collection(
             filter_info.append(f"pi={pi}")
         filter_str = f" with filters: {', '.join(filter_info)}" if filter_info else ""
         
+        if response_format == FORMAT_NDJSON:
+            logger.info(f"Streaming AI insights collection from {config.AI_INSIGHTS_TABLE}{filter_str}")
+            return ndjson_response(query, params, _ai_insight_row_to_dict)
+        
         logger.info(f"Executing query to get AI insights collection from {config.AI_INSIGHTS_TABLE}{filter_str}")
         
         # Execute query
         result = conn.execute(query, params)
-        rows = result.fetchall()
+        rows, next_cursor = split_page(result.fetchall(), validated_limit, 0, cursor_filters)
         
         # Convert rows to list of dictionaries
-        cards = []
-        for row in rows:
-            # Truncate description to first 200 characters with ellipsis when longer
-            description_text = row[6]
-            if isinstance(description_text, str) and len(description_text) > 200:
-                description_text = description_text[:200] + "..."
-            
-            card_dict = {
-                "id": row[0],
-                "date": row[1],
-                "team_name": row[2],
-                "group_name": row[3],
-                "card_name": row[4],
-                "priority": row[5],
-                "description": description_text,
-                "source_job_id": row[7],
-                "pi": row[8] if len(row) > 8 else None,
-                "insight_type": row[9] if len(row) > 9 else None,
-                "updated_at": row[10] if len(row) > 10 else None,
-                "created_at": row[11] if len(row) > 11 else None
-            }
-            # Add priority_color
-            add_priority_color_to_card(card_dict)
-            cards.append(card_dict)
+        cards = [_ai_insight_row_to_dict(row) for row in rows]
         
         filter_message = ""
         if filter_info:
@@ -548,7 +578,8 @@ async def get_ai_insights_collection(
             "success": True,
             "data": {
                 "cards": cards,
-                "count": len(cards)
+                "count": len(cards),
+                "next_cursor": next_cursor
             },
             "message": f"Retrieved {len(cards)} AI insight cards{filter_message}"
         }
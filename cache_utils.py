@@ -2,24 +2,124 @@
 Cache utilities for Redis-based caching of reports and other data.
 """
 
+import asyncio
 import hashlib
 import json
 import redis
-from typing import Any, Optional
+import struct
+import threading
+import uuid
+import zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 import logging
 import time
 import config
 
+# Optional codecs - the cache falls back to json / zlib when these are not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
 logger = logging.getLogger(__name__)
 
 # Initialize Redis client (singleton pattern)
 _redis_client = None
+# Second client on the same server returning raw bytes (for encoded report payloads)
+_redis_binary_client = None
 
 # Failure state cache - track when Redis failed to avoid repeated connection attempts
 _redis_failed_until = None  # Timestamp when we can retry again (None = no failure recorded)
 _redis_cooldown_logged = False  # Track if we've already logged the cooldown message for this period
 REDIS_FAILURE_COOLDOWN_SECONDS = 1800  # 30 minutes cooldown period
 
+# Identifies this worker in invalidation messages (so it can skip its own broadcasts)
+_WORKER_ID = uuid.uuid4().hex
+
+
+class LocalReportCache:
+    """
+    In-process LRU cache for report payloads (L1 in front of Redis).
+    
+    Entries expire after their TTL and the least recently used entries are evicted
+    once the total serialized size exceeds max_bytes. Thread-safe.
+    Cached values are shared between requests - callers must not mutate them.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()  # key -> (value, size, expires_at)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, size, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any, size: int, ttl: float) -> None:
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + ttl)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+    
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+    
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._total_bytes -= size
+
+
+_local_report_cache = LocalReportCache(config.REPORT_LOCAL_CACHE_MAX_BYTES)
+
+# Pub/sub listener thread that applies invalidations broadcast by other workers
+_invalidation_listener_thread: Optional[threading.Thread] = None
+_invalidation_listener_stop = threading.Event()
+
 
 def get_redis_client():
     """
@@ -77,43 +177,348 @@ def get_redis_client():
     return _redis_client
 
 
-def generate_cache_key(report_id: str, filters: dict) -> str:
+def get_redis_binary_client():
+    """
+    Get or create a Redis client that returns raw bytes (decode_responses=False).
+    Used for encoded report payloads. Shares the failure cooldown of get_redis_client().
+    """
+    global _redis_binary_client
+    if get_redis_client() is None:
+        return None
+    
+    if _redis_binary_client is None:
+        _redis_binary_client = redis.Redis(
+            host=config.REDIS_HOST,
+            port=config.REDIS_PORT,
+            db=config.REDIS_DB,
+            password=config.REDIS_PASSWORD,
+            decode_responses=False,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+            socket_keepalive=True,
+            socket_keepalive_options={}
+        )
+    return _redis_binary_client
+
+
+# --- Report payload codec ---
+#
+# Encoded entries start with a header:
+#   CODEC_MAGIC (3 bytes) | format version | serializer id | compression id
+#   | cached_at (float64, epoch seconds) | soft TTL (uint32 seconds)   <- version 2+
+#   | payload digest (16 bytes, BLAKE2b of the serialized payload)     <- version 3+
+# Older entries and entries without the magic prefix (legacy plain-JSON text
+# written by json.dumps(data, default=str)) are still decoded; they are never
+# reported as stale and carry no digest.
+#
+# All serializers stringify values JSON cannot represent (dates, Decimals, UUIDs)
+# with str(), exactly like the legacy default=str, so a decoded payload is the
+# same whichever codec wrote it.
+
+CODEC_MAGIC = b"\x00SC"
+CODEC_VERSION = 3
+_HEADER_SIZE_V1 = len(CODEC_MAGIC) + 3
+_ENTRY_TIMES = struct.Struct(">dI")
+_HEADER_SIZE_V2 = _HEADER_SIZE_V1 + _ENTRY_TIMES.size
+_DIGEST_SIZE = 16
+_HEADER_SIZE = _HEADER_SIZE_V2 + _DIGEST_SIZE
+
+
+class CachedReport:
+    """
+    A cached report payload with the time it was stored and its soft TTL.
+    
+    Entries read from the cache with a stored HTTP body decode their payload on first access
+    (decode), so responses written around the stored body never deserialize it.
+    """
+    __slots__ = ("_payload", "_decode", "cached_at", "soft_ttl", "digest", "body", "body_encoding")
+    
+    def __init__(
+        self,
+        payload: Any = None,
+        cached_at: Optional[float] = None,  # Epoch seconds, None for entries written before timestamps
+        soft_ttl: Optional[int] = None,  # Seconds after which the entry is served stale and refreshed
+        digest: Optional[str] = None,  # Hex hash of the serialized payload (changes only when the data changes)
+        body: Optional[bytes] = None,  # Stored body when it is JSON that HTTP can carry as-is (see body_encoding)
+        body_encoding: Optional[str] = None,  # "identity" (plain JSON) or "zstd" (one zstd frame of JSON)
+        decode: Optional[Callable[[], Any]] = None,  # Produces the payload on first access (instead of payload)
+    ):
+        self._payload = payload
+        self._decode = decode
+        self.cached_at = cached_at
+        self.soft_ttl = soft_ttl
+        self.digest = digest
+        self.body = body
+        self.body_encoding = body_encoding
+    
+    @property
+    def payload(self) -> Any:
+        decode = self._decode
+        if decode is not None:
+            self._payload = decode()
+            self._decode = None
+        return self._payload
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        if self.cached_at is None:
+            return None
+        return max(0.0, time.time() - self.cached_at)
+
+    @property
+    def is_stale(self) -> bool:
+        if self.cached_at is None or self.soft_ttl is None:
+            return False
+        return time.time() - self.cached_at >= self.soft_ttl
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data, default=str).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    return json.loads(raw)
+
+
+def _orjson_dumps(data: Any) -> bytes:
+    try:
+        # Passthrough so datetimes go through default=str (space separator) like json.dumps
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        # e.g. integers beyond 64 bits - json handles them
+        return _json_dumps(data)
+
+
+def _msgpack_dumps(data: Any) -> bytes:
+    # Round-trip through JSON types first so keys/values match the JSON codecs exactly
+    return msgpack.packb(json.loads(_json_dumps(data)), use_bin_type=True)
+
+
+def _msgpack_loads(raw: bytes) -> Any:
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+
+# id -> (name, dumps, loads); dumps/loads are None when the library is not installed
+_SERIALIZERS: Dict[int, Tuple[str, Optional[Callable[[Any], bytes]], Optional[Callable[[bytes], Any]]]] = {
+    1: ("json", _json_dumps, _json_loads),
+    2: ("orjson", _orjson_dumps if orjson else None, orjson.loads if orjson else None),
+    3: ("msgpack", _msgpack_dumps if msgpack else None, _msgpack_loads if msgpack else None),
+}
+
+# id -> (name, compress, decompress)
+_COMPRESSORS: Dict[int, Tuple[str, Optional[Callable[[bytes], bytes]], Optional[Callable[[bytes], bytes]]]] = {
+    0: ("none", lambda raw: raw, lambda raw: raw),
+    1: ("zlib", lambda raw: zlib.compress(raw, 6), zlib.decompress),
+    2: ("zstd",
+        (lambda raw: zstandard.ZstdCompressor(level=3).compress(raw)) if zstandard else None,
+        (lambda raw: zstandard.ZstdDecompressor().decompress(raw)) if zstandard else None),
+    3: ("lz4",
+        lz4_frame.compress if lz4_frame else None,
+        lz4_frame.decompress if lz4_frame else None),
+}
+
+
+def _resolve_codec_id(registry: Dict[int, Tuple], name: str, fallback: str) -> int:
+    """Map a configured codec name to its id, falling back if unknown or not installed."""
+    by_name = {entry[0]: codec_id for codec_id, entry in registry.items()}
+    codec_id = by_name.get((name or "").lower())
+    if codec_id is None or registry[codec_id][1] is None:
+        logger.warning(f"⚠️  Report cache codec '{name}' not available, using '{fallback}'")
+        codec_id = by_name[fallback]
+    return codec_id
+
+
+_serializer_id = _resolve_codec_id(_SERIALIZERS, config.REPORT_CACHE_SERIALIZER, "json")
+_compressor_id = _resolve_codec_id(_COMPRESSORS, config.REPORT_CACHE_COMPRESSION, "zlib")
+
+
+def serialize_report_payload(data: Any) -> bytes:
+    """Serialize a payload with the configured serializer (no header, no compression)."""
+    return _SERIALIZERS[_serializer_id][1](data)
+
+
+def deserialize_report_payload(raw: bytes) -> Any:
+    """Inverse of serialize_report_payload()."""
+    return _SERIALIZERS[_serializer_id][2](raw)
+
+
+# Serializers whose output is JSON text, and compressors whose output is a valid HTTP content-coding
+_JSON_SERIALIZER_IDS = {1, 2}
+_HTTP_BODY_ENCODINGS = {0: "identity", 2: "zstd"}
+
+
+def _http_body(serializer_id: int, compressor_id: int, body: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+    """Keep the stored body if it can be sent over HTTP without decoding (JSON, identity or zstd)."""
+    if serializer_id in _JSON_SERIALIZER_IDS and compressor_id in _HTTP_BODY_ENCODINGS:
+        return body, _HTTP_BODY_ENCODINGS[compressor_id]
+    return None, None
+
+
+def _body_decoder(serializer_id: int, compressor_id: int, stored_body: bytes) -> Callable[[], Any]:
+    """Deferred decode of a stored body (for CachedReport's lazy payload)."""
+    loads = _SERIALIZERS[serializer_id][2]
+    decompress = _COMPRESSORS[compressor_id][2]
+    return lambda: loads(decompress(stored_body))
+
+
+def payload_digest(raw: bytes) -> bytes:
+    """Content hash of a serialized payload (stored in the entry header, used for ETags)."""
+    return hashlib.blake2b(raw, digest_size=_DIGEST_SIZE).digest()
+
+
+def encode_report_payload(raw: bytes, cached_at: float, soft_ttl: int) -> bytes:
+    """
+    Wrap serialized bytes for storage: compress above the size threshold and prepend the header.
+    
+    Args:
+        raw: Output of serialize_report_payload()
+        cached_at: Time the payload was resolved (epoch seconds)
+        soft_ttl: Seconds after which the payload is considered stale
+    
+    Returns:
+        Bytes ready to store in Redis
+    """
+    compressor_id = _compressor_id if len(raw) >= config.REPORT_CACHE_COMPRESSION_MIN_BYTES else 0
+    body = _COMPRESSORS[compressor_id][1](raw)
+    header = (
+        CODEC_MAGIC
+        + bytes([CODEC_VERSION, _serializer_id, compressor_id])
+        + _ENTRY_TIMES.pack(cached_at, max(0, int(soft_ttl)))
+        + payload_digest(raw)
+    )
+    return header + body
+
+
+def decode_report_entry(blob: Any) -> CachedReport:
+    """
+    Decode a stored report entry (encoded or legacy plain JSON).
+    
+    Args:
+        blob: Bytes (or str for legacy entries) read from Redis
+    
+    Returns:
+        CachedReport with, depending on the entry version, its timestamps and digest. When the stored
+        body can be sent over HTTP as-is, the payload is only decoded on first access.
+    
+    Raises:
+        ValueError: If the entry uses an unknown format version or a codec that is not installed
+    """
+    if isinstance(blob, str):
+        return CachedReport(json.loads(blob))
+    if not blob.startswith(CODEC_MAGIC):
+        # Legacy entry written as json.dumps(data, default=str)
+        return CachedReport(json.loads(blob))
+    
+    version, serializer_id, compressor_id = blob[len(CODEC_MAGIC):_HEADER_SIZE_V1]
+    digest = None
+    if version == 1:
+        cached_at, soft_ttl, body_start = None, None, _HEADER_SIZE_V1
+    elif version == 2:
+        cached_at, soft_ttl = _ENTRY_TIMES.unpack_from(blob, _HEADER_SIZE_V1)
+        body_start = _HEADER_SIZE_V2
+    elif version == CODEC_VERSION:
+        cached_at, soft_ttl = _ENTRY_TIMES.unpack_from(blob, _HEADER_SIZE_V1)
+        digest = blob[_HEADER_SIZE_V2:_HEADER_SIZE].hex()
+        body_start = _HEADER_SIZE
+    else:
+        raise ValueError(f"Unsupported report cache format version {version}")
+    
+    serializer = _SERIALIZERS.get(serializer_id)
+    compressor = _COMPRESSORS.get(compressor_id)
+    if not serializer or serializer[2] is None or not compressor or compressor[2] is None:
+        raise ValueError(f"Report cache codec not available (serializer={serializer_id}, compression={compressor_id})")
+    
+    stored_body = blob[body_start:]
+    decode = _body_decoder(serializer_id, compressor_id, stored_body)
+    body, body_encoding = _http_body(serializer_id, compressor_id, stored_body)
+    if body is None:
+        return CachedReport(decode(), cached_at, soft_ttl, digest)
+    return CachedReport(None, cached_at, soft_ttl, digest, body, body_encoding, decode=decode)
+
+
+def decode_report_payload(blob: Any) -> Any:
+    """Decode a stored report entry and return only its payload."""
+    return decode_report_entry(blob).payload
+
+
+def generate_cache_key(report_id: str, filters: dict, result_format: str = "rows") -> str:
     """
     Generate a deterministic cache key from report_id and filters.
     
     Args:
         report_id: The report identifier
         filters: Dictionary of filter parameters
+        result_format: Result format ("rows" keys are unchanged from before formats existed)
     
     Returns:
         A cache key string in the format: report:{report_id}:{hash}
     """
 
     sorted_filters = json.dumps(filters, sort_keys=True)
+    if result_format != "rows":
+        sorted_filters = f"{sorted_filters}:{result_format}"
     hash_obj = hashlib.md5(f"{report_id}:{sorted_filters}".encode())
     return f"report:{report_id}:{hash_obj.hexdigest()}"
 
 
-def get_cached_report(cache_key: str) -> Optional[dict]:
+def _local_ttl(redis_ttl: int) -> int:
+    """Local entries never outlive the Redis entry and are capped by REPORT_LOCAL_CACHE_TTL."""
+    if redis_ttl is None or redis_ttl < 0:
+        return config.REPORT_LOCAL_CACHE_TTL
+    return min(redis_ttl, config.REPORT_LOCAL_CACHE_TTL)
+
+
+def is_report_cached_locally(cache_key: str) -> bool:
+    """True if the entry is in this worker's in-process cache (a lookup would not reach Redis)."""
+    return config.REPORT_LOCAL_CACHE_ENABLED and _local_report_cache.get(cache_key) is not None
+
+
+def get_cached_report_entry(cache_key: str, log_miss: bool = True) -> Optional[CachedReport]:
     """
-    Retrieve cached report data from Redis.
+    Retrieve a cached report entry, checking the in-process cache before Redis.
+    
+    Entries past their soft TTL are still returned (check CachedReport.is_stale);
+    Redis drops them at the hard TTL.
     
     Args:
         cache_key: The cache key to lookup
+        log_miss: Log misses (disabled when polling for another worker's result)
     
     Returns:
-        Cached data as dict if found, None otherwise
+        CachedReport if found, None otherwise.
+        The payload may be shared with other requests - do not mutate it.
     """
+    if config.REPORT_LOCAL_CACHE_ENABLED:
+        local = _local_report_cache.get(cache_key)
+        if local is not None:
+            logger.info(f"🎯 Cache HIT (local): {cache_key}")
+            return local
+    
     try:
-        client = get_redis_client()
+        client = get_redis_binary_client()
         if not client:
             return None
         
-        cached = client.get(cache_key)
+        if config.REPORT_LOCAL_CACHE_ENABLED:
+            # Fetch the value and its remaining TTL in one round trip
+            pipe = client.pipeline(transaction=False)
+            pipe.get(cache_key)
+            pipe.ttl(cache_key)
+            cached, remaining_ttl = pipe.execute()
+        else:
+            cached, remaining_ttl = client.get(cache_key), None
+        
         if cached:
             logger.info(f"🎯 Cache HIT: {cache_key}")
-            return json.loads(cached)
-        else:
+            entry = decode_report_entry(cached)
+            if config.REPORT_LOCAL_CACHE_ENABLED:
+                _local_report_cache.set(cache_key, entry, len(cached), _local_ttl(remaining_ttl))
+            return entry
+        elif log_miss:
             logger.info(f"❌ Cache MISS: {cache_key}")
     except Exception as e:
         logger.warning(f"Cache retrieval error for key {cache_key}: {e}")
@@ -121,57 +526,331 @@ def get_cached_report(cache_key: str) -> Optional[dict]:
     return None
 
 
-def set_cached_report(cache_key: str, data: dict, ttl: int = 300):
+def get_cached_report_entries(cache_keys: List[str]) -> List[Optional[CachedReport]]:
+    """
+    Retrieve many cached report entries: in-process cache first, then one Redis round trip
+    (MGET plus remaining TTLs, pipelined) for the rest.
+    
+    Args:
+        cache_keys: Cache keys to lookup
+    
+    Returns:
+        One CachedReport or None per key, in the same order
+    """
+    entries: List[Optional[CachedReport]] = [None] * len(cache_keys)
+    remote_indexes: List[int] = []
+    for index, cache_key in enumerate(cache_keys):
+        local = _local_report_cache.get(cache_key) if config.REPORT_LOCAL_CACHE_ENABLED else None
+        if local is not None:
+            entries[index] = local
+        else:
+            remote_indexes.append(index)
+    
+    if not remote_indexes:
+        logger.info(f"🎯 Cache HIT (local): {len(cache_keys)}/{len(cache_keys)} batch keys")
+        return entries
+    
+    try:
+        client = get_redis_binary_client()
+        if not client:
+            return entries
+        
+        remote_keys = [cache_keys[index] for index in remote_indexes]
+        pipe = client.pipeline(transaction=False)
+        pipe.mget(remote_keys)
+        for cache_key in remote_keys:
+            pipe.ttl(cache_key)
+        results = pipe.execute()
+        values, remaining_ttls = results[0], results[1:]
+        
+        for index, cache_key, cached, remaining_ttl in zip(remote_indexes, remote_keys, values, remaining_ttls):
+            if not cached:
+                continue
+            try:
+                entry = decode_report_entry(cached)
+            except Exception as e:
+                logger.warning(f"Cache decode error for key {cache_key}: {e}")
+                continue
+            entries[index] = entry
+            if config.REPORT_LOCAL_CACHE_ENABLED:
+                _local_report_cache.set(cache_key, entry, len(cached), _local_ttl(remaining_ttl))
+    except Exception as e:
+        logger.warning(f"Batch cache retrieval error: {e}")
+    
+    hits = sum(1 for entry in entries if entry is not None)
+    logger.info(f"🎯 Batch cache lookup: {hits}/{len(cache_keys)} hits")
+    return entries
+
+
+def get_cached_report(cache_key: str, log_miss: bool = True) -> Optional[dict]:
+    """
+    Retrieve cached report data, checking the in-process cache before Redis.
+    
+    Args:
+        cache_key: The cache key to lookup
+        log_miss: Log misses (disabled when polling for another worker's result)
+    
+    Returns:
+        Cached data as dict if found, None otherwise.
+        The returned dict may be shared with other requests - do not mutate it.
+    """
+    entry = get_cached_report_entry(cache_key, log_miss=log_miss)
+    return entry.payload if entry is not None else None
+
+
+def set_cached_report(cache_key: str, data: dict, ttl: int = 300, soft_ttl: Optional[int] = None) -> Optional[CachedReport]:
     """
     Cache report data in Redis with a TTL.
     
     Args:
         cache_key: The cache key to store under
-        data: The data to cache (will be JSON serialized)
-        ttl: Time-to-live in seconds (default: 5 minutes)
+        data: The data to cache (serialized and compressed by the configured codec)
+        ttl: Time-to-live in seconds (default: 5 minutes) - the hard TTL
+        soft_ttl: Seconds after which the entry is served stale and refreshed (default: ttl)
+    
+    Returns:
+        The entry as later reads will return it (round-tripped payload, timestamps, digest),
+        or None if the payload could not be serialized
     """
     try:
-        client = get_redis_client()
-        if not client:
-            return
+        cached_at = time.time()
+        soft_ttl = ttl if soft_ttl is None else min(soft_ttl, ttl)
         
-        # Use default=str to handle dates, decimals, and other non-serializable objects
-        client.setex(cache_key, ttl, json.dumps(data, default=str))
-        logger.info(f"💾 Cache SET: {cache_key} (TTL={ttl}s)")
+        # Dates, decimals and other non-JSON objects are stringified (same as default=str)
+        raw = serialize_report_payload(data)
+        blob = encode_report_payload(raw, cached_at, soft_ttl)
+        _, serializer_id, compressor_id = blob[len(CODEC_MAGIC):_HEADER_SIZE_V1]
+        # Round-tripped form so fresh responses look exactly like cache hits (decoded when first needed)
+        stored_body = blob[_HEADER_SIZE:]
+        entry = CachedReport(
+            None,
+            cached_at,
+            soft_ttl,
+            payload_digest(raw).hex(),
+            *_http_body(serializer_id, compressor_id, stored_body),
+            decode=_body_decoder(serializer_id, compressor_id, stored_body),
+        )
+    except Exception as e:
+        logger.warning(f"Cache serialization error for key {cache_key}: {e}")
+        return None
+    
+    if config.REPORT_LOCAL_CACHE_ENABLED:
+        _local_report_cache.set(cache_key, entry, len(blob), _local_ttl(ttl))
+    
+    try:
+        client = get_redis_binary_client()
+        if client:
+            client.setex(cache_key, ttl, blob)
+            logger.info(f"💾 Cache SET: {cache_key} (soft TTL={soft_ttl}s, TTL={ttl}s, {len(raw)} -> {len(blob)} bytes)")
     except Exception as e:
         logger.warning(f"Cache set error for key {cache_key}: {e}")
+    
+    return entry
+
+
+def _report_key_prefix(report_id: Optional[str]) -> str:
+    return f"report:{report_id}:" if report_id else "report:"
 
 
 def invalidate_report_cache(report_id: Optional[str] = None) -> int:
     """
-    Invalidate cached reports.
+    Invalidate cached reports in Redis, in this worker's local cache, and
+    (via Redis pub/sub) in every other worker's local cache.
+    
+    Redis entries are deleted before any local cache is cleared, so a request arriving
+    in between cannot copy the old Redis entry back into a local cache.
     
     Args:
         report_id: If provided, only clear caches for this report.
                    If None, clear all report caches.
     
     Returns:
-        Number of cache entries deleted
+        Number of Redis cache entries deleted
     """
+    pattern = f"report:{report_id}:*" if report_id else "report:*"
+    deleted = 0
+    client = None
     try:
         client = get_redis_client()
-        if not client:
-            return 0
-        
-        pattern = f"report:{report_id}:*" if report_id else "report:*"
-        keys = list(client.scan_iter(match=pattern))
-        
-        if keys:
-            deleted = client.delete(*keys)
-            logger.info(f"🗑️  Invalidated {deleted} cache entries for pattern: {pattern}")
-            return deleted
-        else:
-            logger.info(f"No cache entries found for pattern: {pattern}")
-            return 0
+        if client:
+            keys = list(client.scan_iter(match=pattern))
+            if keys:
+                deleted = client.delete(*keys)
+                logger.info(f"🗑️  Invalidated {deleted} cache entries for pattern: {pattern}")
+            else:
+                logger.info(f"No cache entries found for pattern: {pattern}")
     except Exception as e:
         logger.warning(f"Cache invalidation error for pattern {pattern}: {e}")
     
-    return 0
+    local_deleted = _local_report_cache.delete_prefix(_report_key_prefix(report_id))
+    if local_deleted:
+        logger.info(f"🗑️  Invalidated {local_deleted} local cache entries for pattern: {pattern}")
+    
+    if client:
+        try:
+            # Tell other workers to drop their local copies
+            client.publish(
+                config.REPORT_CACHE_INVALIDATION_CHANNEL,
+                json.dumps({"report_id": report_id, "origin": _WORKER_ID})
+            )
+        except Exception as e:
+            logger.warning(f"Cache invalidation broadcast error for pattern {pattern}: {e}")
+    
+    return deleted
+
+
+def invalidate_report_caches(report_ids: List[str]) -> int:
+    """
+    Invalidate several reports at once: one SCAN of the report keys, one DEL, one broadcast
+    (instead of one of each per report with invalidate_report_cache).
+    
+    Args:
+        report_ids: Reports whose cached entries are cleared
+    
+    Returns:
+        Number of Redis cache entries deleted
+    """
+    if not report_ids:
+        return 0
+    prefixes = tuple(_report_key_prefix(report_id) for report_id in report_ids)
+    deleted = 0
+    client = None
+    try:
+        client = get_redis_client()
+        if client:
+            keys = [key for key in client.scan_iter(match="report:*") if key.startswith(prefixes)]
+            if keys:
+                deleted = client.delete(*keys)
+            logger.info(f"🗑️  Invalidated {deleted} cache entries for {len(report_ids)} reports")
+    except Exception as e:
+        logger.warning(f"Cache invalidation error for reports {report_ids}: {e}")
+    
+    # Redis first, so no request can copy an old entry back into a local cache
+    local_deleted = sum(_local_report_cache.delete_prefix(prefix) for prefix in prefixes)
+    if local_deleted:
+        logger.info(f"🗑️  Invalidated {local_deleted} local cache entries for {len(report_ids)} reports")
+    
+    if client:
+        try:
+            client.publish(
+                config.REPORT_CACHE_INVALIDATION_CHANNEL,
+                json.dumps({"report_ids": list(report_ids), "origin": _WORKER_ID})
+            )
+        except Exception as e:
+            logger.warning(f"Cache invalidation broadcast error for reports {report_ids}: {e}")
+    
+    return deleted
+
+
+def _handle_invalidation_message(message: dict) -> None:
+    """Apply an invalidation broadcast by another worker to the local cache."""
+    try:
+        payload = json.loads(message["data"])
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring malformed cache invalidation message: {message.get('data')!r}")
+        return
+    
+    if payload.get("origin") == _WORKER_ID:
+        return
+    
+    report_ids = payload.get("report_ids")
+    if report_ids:
+        deleted = sum(_local_report_cache.delete_prefix(_report_key_prefix(report_id)) for report_id in report_ids)
+        logger.info(f"🗑️  Local cache invalidated by broadcast: {len(report_ids)} reports ({deleted} entries)")
+        return
+    
+    report_id = payload.get("report_id")
+    deleted = _local_report_cache.delete_prefix(_report_key_prefix(report_id))
+    logger.info(f"🗑️  Local cache invalidated by broadcast: report_id={report_id or '*'} ({deleted} entries)")
+
+
+# Pub/sub channel -> handler, run on the listener thread
+_pubsub_handlers: Dict[str, Callable[[dict], None]] = {
+    config.REPORT_CACHE_INVALIDATION_CHANNEL: _handle_invalidation_message,
+}
+
+
+def register_pubsub_handler(channel: str, handler: Callable[[dict], None]) -> None:
+    """
+    Register a handler for another pub/sub channel on the shared listener thread.
+    Must be called before start_report_cache_invalidation_listener() (i.e. at import time).
+    
+    Args:
+        channel: Redis pub/sub channel
+        handler: Called with the raw pub/sub message dict
+    """
+    _pubsub_handlers[channel] = handler
+
+
+def _invalidation_listener_loop() -> None:
+    """
+    Subscribe to the invalidation channel(s) and apply messages until stopped.
+    Reconnects after Redis errors; the local cache is cleared on (re)subscribe
+    because broadcasts may have been missed while disconnected.
+    """
+    retry_seconds = 5
+    while not _invalidation_listener_stop.is_set():
+        client = get_redis_client()
+        if not client:
+            _invalidation_listener_stop.wait(retry_seconds)
+            continue
+        
+        pubsub = None
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(*_pubsub_handlers.keys())
+            _local_report_cache.clear()
+            logger.info(f"📡 Subscribed to cache invalidations on {', '.join(_pubsub_handlers.keys())}")
+            
+            while not _invalidation_listener_stop.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if message and message.get("type") == "message":
+                    handler = _pubsub_handlers.get(message.get("channel"))
+                    if handler is not None:
+                        try:
+                            handler(message)
+                        except Exception as e:
+                            logger.warning(f"Pub/sub handler error on '{message.get('channel')}': {e}")
+        except Exception as e:
+            # Without the subscription we cannot hear other workers - drop local entries
+            _local_report_cache.clear()
+            logger.warning(f"⚠️  Report cache invalidation listener error: {e}. Retrying in {retry_seconds}s.")
+            _invalidation_listener_stop.wait(retry_seconds)
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+
+def start_report_cache_invalidation_listener() -> None:
+    """
+    Start the background pub/sub listener (called at startup).
+    No-op if the local cache is disabled or the listener is already running.
+    """
+    global _invalidation_listener_thread
+    if not config.REPORT_LOCAL_CACHE_ENABLED or not config.REDIS_ENABLED:
+        return
+    if _invalidation_listener_thread is not None and _invalidation_listener_thread.is_alive():
+        return
+    
+    _invalidation_listener_stop.clear()
+    _invalidation_listener_thread = threading.Thread(
+        target=_invalidation_listener_loop,
+        name="report-cache-invalidation",
+        daemon=True
+    )
+    _invalidation_listener_thread.start()
+
+
+def stop_report_cache_invalidation_listener() -> None:
+    """Stop the background pub/sub listener (called on shutdown)."""
+    global _invalidation_listener_thread
+    _invalidation_listener_stop.set()
+    if _invalidation_listener_thread is not None:
+        _invalidation_listener_thread.join(timeout=2)
+        _invalidation_listener_thread = None
 
 
 def get_report_cache_ttl(report_id: str) -> int:
@@ -198,3 +877,214 @@ def get_report_cache_ttl(report_id: str) -> int:
     # Default to aggregate TTL
     return config.CACHE_TTL_AGGREGATE
 
+
+def get_report_cache_ttls(report_id: str, soft_ttl: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Get the soft and hard cache TTLs for a report.
+    
+    Until the soft TTL the entry is fresh. Between soft and hard TTL it is served
+    stale while a background refresh runs. After the hard TTL Redis drops it.
+    
+    Args:
+        report_id: The report identifier
+        soft_ttl: Optional soft TTL override (e.g. the cache_ttl query parameter)
+    
+    Returns:
+        (soft_ttl, hard_ttl) in seconds
+    """
+    soft = soft_ttl if soft_ttl is not None else get_report_cache_ttl(report_id)
+    hard = max(soft, int(soft * config.REPORT_CACHE_HARD_TTL_FACTOR))
+    return soft, hard
+
+
+# --- Single-flight for report cache misses ---
+#
+# Only one resolver runs per cache key: concurrent requests in this process await
+# the same future, and other workers wait on a short Redis lock, polling the cache
+# key until the lock holder has stored the result.
+
+# cache_key -> future resolving to (payload, served_from_cache)
+_inflight_reports: Dict[str, "asyncio.Future"] = {}
+
+# Delete the lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _report_lock_key(cache_key: str) -> str:
+    return f"lock:{cache_key}"
+
+
+def acquire_report_lock(cache_key: str) -> Tuple[bool, Optional[str]]:
+    """
+    Try to take the cross-worker resolver lock for a cache key.
+    
+    Returns:
+        (acquired, token). acquired is True when Redis is unavailable - there is
+        nobody to coordinate with, so the caller should resolve. token is None then.
+    """
+    try:
+        client = get_redis_client()
+        if not client:
+            return True, None
+        token = uuid.uuid4().hex
+        acquired = client.set(
+            _report_lock_key(cache_key),
+            token,
+            nx=True,
+            px=int(config.REPORT_SINGLE_FLIGHT_LOCK_TTL * 1000)
+        )
+        return bool(acquired), token if acquired else None
+    except Exception as e:
+        logger.warning(f"Single-flight lock error for key {cache_key}: {e}")
+        return True, None
+
+
+def release_report_lock(cache_key: str, token: Optional[str]) -> None:
+    """Release a lock taken by acquire_report_lock()."""
+    if token is None:
+        return
+    try:
+        client = get_redis_client()
+        if client:
+            client.eval(_RELEASE_LOCK_SCRIPT, 1, _report_lock_key(cache_key), token)
+    except Exception as e:
+        logger.warning(f"Single-flight unlock error for key {cache_key}: {e}")
+
+
+def _report_lock_held(cache_key: str) -> bool:
+    try:
+        client = get_redis_client()
+        return bool(client and client.exists(_report_lock_key(cache_key)))
+    except Exception:
+        return False
+
+
+async def _wait_for_report_from_other_worker(cache_key: str) -> Optional[CachedReport]:
+    """
+    Poll the cache while another worker holds the resolver lock.
+    
+    Returns:
+        The cached payload, or None if the wait timed out or the lock was released
+        without a result (e.g. the other worker failed).
+    """
+    deadline = time.monotonic() + config.REPORT_SINGLE_FLIGHT_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(config.REPORT_SINGLE_FLIGHT_POLL_INTERVAL)
+        cached = get_cached_report_entry(cache_key, log_miss=False)
+        if cached is not None:
+            return cached
+        if not _report_lock_held(cache_key):
+            # Holder finished or died - check once more, then give up waiting
+            return get_cached_report_entry(cache_key, log_miss=False)
+    logger.warning(f"⏳ Timed out waiting for another worker to resolve {cache_key}")
+    return None
+
+
+async def single_flight_report(
+    cache_key: str,
+    resolve: Callable[[], Awaitable[CachedReport]]
+) -> Tuple[CachedReport, bool]:
+    """
+    Resolve a report cache miss, de-duplicated per cache key within this process and across workers.
+    
+    Args:
+        cache_key: Key from generate_cache_key()
+        resolve: Coroutine function that resolves the payload, stores it with set_cached_report()
+                 and returns the stored entry
+    
+    Returns:
+        (entry, served_from_cache) - served_from_cache is True when another worker
+        resolved the payload and it was read back from the cache.
+        The payload may be shared with concurrent requests - do not mutate it.
+    """
+    inflight = _inflight_reports.get(cache_key)
+    if inflight is not None:
+        logger.info(f"🔗 Joining in-flight resolve: {cache_key}")
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # The leading request was cancelled (e.g. client disconnected) - take over unless we were cancelled too
+            if inflight.cancelled() and not asyncio.current_task().cancelling():
+                return await single_flight_report(cache_key, resolve)
+            raise
+    
+    future = asyncio.get_running_loop().create_future()
+    _inflight_reports[cache_key] = future
+    try:
+        acquired, token = acquire_report_lock(cache_key)
+        result: Optional[Tuple[CachedReport, bool]] = None
+        
+        if not acquired:
+            logger.info(f"🔒 Another worker is resolving {cache_key}, waiting for its result")
+            cached = await _wait_for_report_from_other_worker(cache_key)
+            if cached is not None:
+                result = (cached, True)
+            else:
+                acquired, token = acquire_report_lock(cache_key)
+        
+        if result is None:
+            try:
+                result = (await resolve(), False)
+            finally:
+                release_report_lock(cache_key, token)
+        
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark as retrieved so an unshared failure is not reported as "never retrieved"
+        future.exception()
+        raise
+    finally:
+        _inflight_reports.pop(cache_key, None)
+
+
+# --- Background refresh (stale-while-revalidate) ---
+
+# Keys being refreshed by this process, and the tasks doing it (kept referenced until done)
+_refreshing_reports: Set[str] = set()
+_refresh_tasks: Set["asyncio.Task"] = set()
+
+
+def schedule_report_refresh(cache_key: str, refresh: Callable[[], Awaitable[Any]]) -> bool:
+    """
+    Start a background refresh of a stale cache entry, at most one per key across workers.
+    
+    Args:
+        cache_key: Key of the stale entry
+        refresh: Coroutine function that re-resolves the payload and stores it with set_cached_report()
+    
+    Returns:
+        True if a refresh was started, False if one is already running (here or in another worker)
+    """
+    if cache_key in _refreshing_reports:
+        return False
+    
+    acquired, token = acquire_report_lock(cache_key)
+    if not acquired:
+        return False
+    
+    async def _run() -> None:
+        started = time.monotonic()
+        try:
+            await refresh()
+            logger.info(f"🔄 Refreshed stale cache entry {cache_key} in {time.monotonic() - started:.2f}s")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {cache_key}: {e}")
+        finally:
+            release_report_lock(cache_key, token)
+            _refreshing_reports.discard(cache_key)
+    
+    _refreshing_reports.add(cache_key)
+    task = asyncio.get_running_loop().create_task(_run())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+    return True
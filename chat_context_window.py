@@ -0,0 +1,231 @@
+"""
+Chat Context Window - token-budgeted history for LLM chat calls, with rolling summaries.
+
+Every chat turn declares a history token budget (AIChatRequest.history_token_budget,
+default CHAT_HISTORY_TOKEN_BUDGET). build_history_window() fills it with:
+
+    1. the leading system message(s) of the conversation (always kept),
+    2. the conversation's rolling summary, as a system message (if one exists),
+    3. the most recent messages, verbatim, newest first until the budget is used.
+
+Older messages are folded into the rolling summary (chat_history.summary_text, covering
+every message up to chat_history.summary_seq). Once the messages after summary_seq pass
+CHAT_SUMMARY_TRIGGER_TOKENS - or are about to outnumber the CHAT_HISTORY_MAX_MESSAGES a turn
+loads, so none drop out unsummarized - a background task asks the LLM service to fold all but
+the last CHAT_SUMMARY_KEEP_RECENT_MESSAGES of them into a new summary. The per-turn payload
+is therefore bounded by the budget however long the conversation runs.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.engine import Connection
+
+import config
+from database_chat_messages import (
+    estimate_tokens,
+    get_chat_summary_state,
+    get_unsummarized_token_total,
+    load_chat_messages_range,
+    save_chat_summary,
+)
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You maintain a running summary of a conversation between a user and an Agile/Scrum assistant. "
+    "Keep every fact, number, team, PI, issue key, decision and open question the assistant may need later. "
+    "Write plain prose, no more than 250 words."
+)
+SUMMARY_MESSAGE_PREFIX = "Summary of the earlier conversation:\n"
+TRUNCATED_MARKER = "\n...[truncated]"
+
+# Conversations being summarized by this process, and the tasks doing it (kept referenced until done)
+_summarizing_conversations: Set[int] = set()
+_summary_tasks: Set["asyncio.Task"] = set()
+
+
+def resolve_token_budget(requested: Optional[int]) -> int:
+    """Requested history budget (or the default), capped at CHAT_HISTORY_MAX_TOKEN_BUDGET."""
+    budget = requested if requested is not None else config.CHAT_HISTORY_TOKEN_BUDGET
+    return max(0, min(budget, config.CHAT_HISTORY_MAX_TOKEN_BUDGET))
+
+
+def _message_tokens(message: Dict[str, Any]) -> int:
+    token_count = message.get("token_count")
+    return token_count if isinstance(token_count, int) else estimate_tokens(message.get("content"))
+
+
+def _truncate_to_tokens(content: str, tokens: int) -> str:
+    max_chars = max(tokens, 0) * 4
+    if len(content) <= max_chars:
+        return content
+    return content[:max(max_chars - len(TRUNCATED_MARKER), 0)] + TRUNCATED_MARKER
+
+
+def build_history_window(
+    history_json: Optional[Dict[str, Any]],
+    token_budget: int
+) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+    """
+    Select the history messages to send to the LLM within a token budget.
+
+    Args:
+        history_json: Chat history with "messages" (and "rolling_summary" when one is stored)
+        token_budget: Maximum estimated tokens for the history
+
+    Returns:
+        (messages as [{"role", "content"}], stats dict for logging / responses)
+    """
+    messages = list((history_json or {}).get("messages") or [])
+    summary = ((history_json or {}).get("rolling_summary") or {}).get("text")
+
+    # Leading system messages are the conversation's instructions - always sent
+    pinned_count = 0
+    while pinned_count < len(messages) and messages[pinned_count].get("role") == "system":
+        pinned_count += 1
+    pinned = messages[:pinned_count]
+    recent = messages[pinned_count:]
+
+    window: List[Dict[str, str]] = [{"role": m.get("role"), "content": m.get("content") or ""} for m in pinned]
+    remaining = token_budget - sum(_message_tokens(m) for m in pinned)
+
+    if summary:
+        summary_content = SUMMARY_MESSAGE_PREFIX + summary
+        window.append({"role": "system", "content": summary_content})
+        remaining -= estimate_tokens(summary_content)
+
+    # Newest first until the budget is used; the history stays contiguous
+    kept: List[Dict[str, str]] = []
+    for message in reversed(recent):
+        tokens = _message_tokens(message)
+        content = message.get("content") or ""
+        if tokens > remaining:
+            if not kept and remaining > 0:
+                # The latest message alone is over budget - send its beginning rather than nothing
+                kept.append({"role": message.get("role"), "content": _truncate_to_tokens(content, remaining)})
+                remaining = 0
+            break
+        kept.append({"role": message.get("role"), "content": content})
+        remaining -= tokens
+    kept.reverse()
+    window.extend(kept)
+
+    stats = {
+        "token_budget": token_budget,
+        "tokens_sent": token_budget - remaining,
+        "messages_available": len(messages),
+        "messages_sent": len(pinned) + len(kept),
+        "summary_used": bool(summary),
+    }
+    return window, stats
+
+
+def maybe_schedule_chat_summary(conversation_id: int, conn: Connection) -> bool:
+    """
+    Start a background summary refresh if the unsummarized part of the conversation
+    has grown past CHAT_SUMMARY_TRIGGER_TOKENS, or past
+    CHAT_HISTORY_MAX_MESSAGES - CHAT_SUMMARY_KEEP_RECENT_MESSAGES messages (beyond
+    CHAT_HISTORY_MAX_MESSAGES, older unsummarized messages would no longer be loaded).
+
+    Args:
+        conversation_id: chat_history.id
+        conn: Database connection (for the summary state and token total)
+
+    Returns:
+        True if a refresh was started
+    """
+    if not config.CHAT_SUMMARY_ENABLED or conversation_id in _summarizing_conversations:
+        return False
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return False  # No event loop (e.g. called from a script) - nothing to schedule on
+
+    state = get_chat_summary_state(conversation_id, conn)
+    if state is None:
+        return False
+    _, summary_seq, message_count = state
+    unsummarized_messages = message_count - summary_seq
+    if unsummarized_messages > config.CHAT_HISTORY_MAX_MESSAGES - config.CHAT_SUMMARY_KEEP_RECENT_MESSAGES:
+        reason = f"{unsummarized_messages} unsummarized messages"
+    else:
+        unsummarized_tokens = get_unsummarized_token_total(conversation_id, summary_seq, conn)
+        if unsummarized_tokens < config.CHAT_SUMMARY_TRIGGER_TOKENS:
+            return False
+        reason = f"{unsummarized_tokens} unsummarized tokens"
+
+    _summarizing_conversations.add(conversation_id)
+    task = loop.create_task(_refresh_chat_summary(conversation_id))
+    _summary_tasks.add(task)
+    task.add_done_callback(_summary_tasks.discard)
+    logger.info(f"🧾 Scheduled chat summary refresh for conversation {conversation_id} ({reason})")
+    return True
+
+
+def _build_summary_prompt(previous_summary: Optional[str], messages: List[Dict[str, Any]]) -> str:
+    lines = []
+    if previous_summary:
+        lines.append("Current summary:")
+        lines.append(previous_summary)
+        lines.append("")
+    lines.append("New messages to fold into the summary:")
+    for message in messages:
+        lines.append(f"{message['role']}: {message['content']}")
+    lines.append("")
+    lines.append("Return the updated summary only.")
+    return "\n".join(lines)
+
+
+async def _refresh_chat_summary(conversation_id: int) -> None:
+    """Fold older messages into the rolling summary (runs as a background task)."""
+    from database_connection import async_db_connection, run_sync_db
+    from agent_llm_service import call_llm_service_process_single
+
+    try:
+        async with async_db_connection() as conn:
+            state = await run_sync_db(conn, get_chat_summary_state, conversation_id)
+            if state is None:
+                return
+            previous_summary, summary_seq, message_count = state
+            through_seq = message_count - config.CHAT_SUMMARY_KEEP_RECENT_MESSAGES
+            if through_seq <= summary_seq:
+                return
+            messages = await run_sync_db(conn, load_chat_messages_range, conversation_id, summary_seq, through_seq)
+
+        # Bound the summarizer input; anything left over is folded in by the next refresh
+        folded: List[Dict[str, Any]] = []
+        input_tokens = 0
+        for message in messages:
+            if folded and input_tokens + message["token_count"] > config.CHAT_SUMMARY_MAX_INPUT_TOKENS:
+                break
+            folded.append(message)
+            input_tokens += message["token_count"]
+        if not folded:
+            return
+        through_seq = folded[-1]["seq"]
+
+        # No pooled connection is held while the LLM is working
+        llm_response = await call_llm_service_process_single(
+            _build_summary_prompt(previous_summary, folded),
+            system_prompt=SUMMARY_SYSTEM_PROMPT,
+            metadata={"purpose": "chat_summary", "conversation_id": conversation_id}
+        )
+        data = llm_response.get("data") if isinstance(llm_response.get("data"), dict) else {}
+        summary = (data.get("response") or llm_response.get("response") or "").strip()
+        if not summary:
+            logger.warning(f"Chat summary refresh for conversation {conversation_id} returned an empty summary")
+            return
+
+        async with async_db_connection() as conn:
+            saved = await run_sync_db(conn, save_chat_summary, conversation_id, summary, through_seq, summary_seq)
+        if saved:
+            logger.info(
+                f"🧾 Refreshed chat summary for conversation {conversation_id}: "
+                f"folded {len(folded)} messages ({input_tokens} tokens) through seq {through_seq}"
+            )
+    except Exception as e:
+        logger.warning(f"Chat summary refresh failed for conversation {conversation_id}: {e}")
+    finally:
+        _summarizing_conversations.discard(conversation_id)
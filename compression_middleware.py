@@ -0,0 +1,251 @@
+"""
+Response Compression Middleware - negotiated zstd / brotli / gzip for large JSON responses.
+
+Pure ASGI middleware so streaming responses (NDJSON exports, paginated streams) are
+compressed chunk by chunk instead of being buffered. Responses that already carry a
+Content-Encoding (e.g. cached reports served straight from their stored zstd frame)
+are passed through untouched.
+"""
+
+import logging
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+import config
+
+# Optional encoders - only offered when installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Server preference when the client weights encodings equally
+_ENCODING_PREFERENCE = ["zstd", "br", "gzip"]
+
+# Content types worth compressing (event streams are excluded so tokens are not held back)
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "text/plain",
+    "text/csv",
+    "text/html",
+)
+
+
+def available_encodings() -> List[str]:
+    """Encodings this process can produce, in server preference order."""
+    encodings = []
+    for encoding in _ENCODING_PREFERENCE:
+        if encoding == "zstd" and zstandard is None:
+            continue
+        if encoding == "br" and brotli is None:
+            continue
+        encodings.append(encoding)
+    return encodings
+
+
+def parse_accept_encoding(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into {encoding: q}.
+
+    Args:
+        accept_encoding: Raw header value (e.g. "gzip, br;q=0.9, zstd")
+
+    Returns:
+        Mapping of lower-cased encoding to its q-value
+    """
+    weights: Dict[str, float] = {}
+    if not accept_encoding:
+        return weights
+    for part in accept_encoding.split(","):
+        pieces = part.strip().split(";")
+        encoding = pieces[0].strip().lower()
+        if not encoding:
+            continue
+        q = 1.0
+        for param in pieces[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[encoding] = q
+    return weights
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the response encoding for a request.
+
+    Returns:
+        "zstd", "br", "gzip", or None for identity
+    """
+    weights = parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    best: Optional[Tuple[float, int, str]] = None
+    for rank, encoding in enumerate(available_encodings()):
+        q = weights.get(encoding, wildcard)
+        if q <= 0:
+            continue
+        candidate = (q, -rank, encoding)
+        if best is None or candidate > best:
+            best = candidate
+    return best[2] if best else None
+
+
+def accepts_encoding(accept_encoding: Optional[str], encoding: str) -> bool:
+    """True if the client accepts the given encoding (q > 0)."""
+    weights = parse_accept_encoding(accept_encoding)
+    return weights.get(encoding, weights.get("*", 0.0)) > 0
+
+
+class _StreamEncoder:
+    """Incremental encoder; flush() emits everything compressed so far so chunks can be sent immediately."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._compressor = zlib.compressobj(config.RESPONSE_COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=config.RESPONSE_COMPRESSION_BROTLI_QUALITY)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=config.RESPONSE_COMPRESSION_ZSTD_LEVEL).compressobj()
+        else:
+            raise ValueError(f"Unsupported encoding '{encoding}'")
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._compressor.process(data)
+            return out + self._compressor.flush() if flush else out
+        out = self._compressor.compress(data)
+        if not flush:
+            return out
+        if self.encoding == "gzip":
+            return out + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return out + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.finish()
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def encode_bytes(data: bytes, encoding: str) -> bytes:
+    """One-shot encode (a complete frame/member) with the given encoding."""
+    return _StreamEncoder(encoding).finish(data)
+
+
+def _is_compressible(headers: List[Tuple[bytes, bytes]]) -> bool:
+    content_type = ""
+    for name, value in headers:
+        lowered = name.lower()
+        if lowered == b"content-encoding":
+            return False
+        if lowered == b"content-type":
+            content_type = value.decode("latin-1").lower()
+    return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+def _compressed_headers(headers: List[Tuple[bytes, bytes]], encoding: str) -> List[Tuple[bytes, bytes]]:
+    """Drop Content-Length, add Content-Encoding / Vary, and weaken strong ETags (the bytes changed)."""
+    updated: List[Tuple[bytes, bytes]] = []
+    vary_values: Set[str] = set()
+    for name, value in headers:
+        lowered = name.lower()
+        if lowered == b"content-length":
+            continue
+        if lowered == b"vary":
+            vary_values.update(v.strip().lower() for v in value.decode("latin-1").split(","))
+            continue
+        if lowered == b"etag" and not value.startswith(b"W/"):
+            value = b"W/" + value
+        updated.append((name, value))
+    updated.append((b"content-encoding", encoding.encode("latin-1")))
+    if "accept-encoding" not in vary_values:
+        vary_values.add("accept-encoding")
+    updated.append((b"vary", ", ".join(sorted(v for v in vary_values if v)).encode("latin-1")))
+    return updated
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best encoding the client accepts.
+
+    Complete bodies smaller than minimum_size are sent as-is. Streaming bodies are
+    compressed incrementally and flushed per chunk so they keep streaming.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        encoder: Optional[_StreamEncoder] = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                # Hold the start until we see the first body chunk and know whether to compress
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                headers = list(start_message.get("headers", []))
+                status = start_message["status"]
+                small = not more_body and len(body) < self.minimum_size
+                if status < 200 or status in (204, 304) or small or not _is_compressible(headers):
+                    passthrough = True
+                    await send(start_message)
+                else:
+                    encoder = _StreamEncoder(encoding)
+                    await send({**start_message, "headers": _compressed_headers(headers, encoding)})
+                start_message = None
+
+            if passthrough:
+                await send(message)
+                return
+
+            if more_body:
+                chunk = encoder.compress(body, flush=True)
+            else:
+                chunk = encoder.finish(body)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+        # Start without any body message (e.g. HEAD handled upstream) - send it unchanged
+        if start_message is not None:
+            await send(start_message)
@@ -26,6 +26,7 @@ TRANSCRIPTS_TABLE = "transcripts"  # Transcripts table
 AI_SUMMARY_TABLE = "ai_summary"  # AI summary table
 PROMPTS_TABLE = "prompts"  # Prompts table
 CHAT_HISTORY_TABLE = "chat_history"  # Chat history table
+CHAT_MESSAGES_TABLE = "chat_messages"  # Append-only chat messages (one row per message)
 INSIGHT_TYPES_TABLE = "insight_types"  # Insight types table
 ISSUE_TYPES_TABLE = "issue_types"  # Issue types table
 REPORT_DEFINITIONS_TABLE = "report_definitions"  # Report definitions metadata table
@@ -81,9 +82,47 @@ DEFAULT_HOST = "0.0.0.0"
 # --- LLM Service Configuration ---
 LLM_SERVICE_URL = os.getenv("LLM_SERVICE_URL", "http://localhost:8001")
 
+# --- LLM Response Cache Configuration ---
+LLM_RESPONSE_CACHE_ENABLED = (os.getenv("LLM_RESPONSE_CACHE_ENABLED") or "true").lower() == "true"  # Reuse responses to byte-identical processSingle prompts
+LLM_RESPONSE_CACHE_TTL = int(os.getenv("LLM_RESPONSE_CACHE_TTL") or "86400")  # 1 day
+LLM_RESPONSE_CACHE_SETTINGS_TTL = int(os.getenv("LLM_RESPONSE_CACHE_SETTINGS_TTL") or "30")  # How long a worker reuses its llm_settings snapshot for cache keys
+
 # --- SparksAI-SQL Service Configuration ---
 LLM_SQL_SERVICE_URL = os.getenv("LLM_SQL_SERVICE_URL", "http://localhost:8002")
 
+# --- Outbound HTTP Client Configuration (shared pooled clients in http_clients.py) ---
+HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS") or "50")  # Max open connections per service
+HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS") or "20")  # Idle connections kept alive per service
+HTTP_CLIENT_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY") or "30")  # Seconds before idle connections are closed
+HTTP_CLIENT_CONNECT_TIMEOUT = float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT") or "5")  # Connect timeout in seconds
+HTTP_CLIENT_HTTP2_ENABLED = (os.getenv("HTTP_CLIENT_HTTP2_ENABLED") or "true").lower() == "true"  # Use HTTP/2 when 'h2' is installed
+
+# --- LLM Gateway Configuration (per-worker admission control for LLM service calls, see llm_gateway.py) ---
+LLM_GATEWAY_ENABLED = (os.getenv("LLM_GATEWAY_ENABLED") or "true").lower() == "true"
+LLM_GATEWAY_MAX_CONCURRENCY = int(os.getenv("LLM_GATEWAY_MAX_CONCURRENCY") or "16")  # Calls in flight to the LLM service per worker
+LLM_GATEWAY_CHAT_MAX_CONCURRENCY = int(os.getenv("LLM_GATEWAY_CHAT_MAX_CONCURRENCY") or "12")  # Per endpoint: /chat and /chat/stream
+LLM_GATEWAY_PROCESS_SINGLE_MAX_CONCURRENCY = int(os.getenv("LLM_GATEWAY_PROCESS_SINGLE_MAX_CONCURRENCY") or "6")  # Per endpoint: /processSingle (agent jobs)
+LLM_GATEWAY_MAX_QUEUE = int(os.getenv("LLM_GATEWAY_MAX_QUEUE") or "64")  # Calls waiting for a slot before new ones get 429
+LLM_GATEWAY_MAX_WAIT_SECONDS = float(os.getenv("LLM_GATEWAY_MAX_WAIT_SECONDS") or "20")  # Wait for a slot before giving up with 503
+LLM_GATEWAY_RETRY_AFTER_MAX_SECONDS = int(os.getenv("LLM_GATEWAY_RETRY_AFTER_MAX_SECONDS") or "60")  # Upper bound on the Retry-After estimate
+
+# --- Dashboard Chat Configuration ---
+DASHBOARD_REPORTS_MAX_CONCURRENCY = int(os.getenv("DASHBOARD_REPORTS_MAX_CONCURRENCY") or "4")  # Reports resolved in parallel per chat turn
+DASHBOARD_REPORT_TIMEOUT_SECONDS = float(os.getenv("DASHBOARD_REPORT_TIMEOUT_SECONDS") or "15")  # Per-report timeout before marking it unavailable
+LLM_CONTEXT_MAX_ROWS = int(os.getenv("LLM_CONTEXT_MAX_ROWS") or "60")  # Rows per report table before it is sent as a column summary + sample
+LLM_CONTEXT_MAX_CELL_CHARS = int(os.getenv("LLM_CONTEXT_MAX_CELL_CHARS") or "200")  # Longer cell values are cut
+LLM_CONTEXT_TOP_VALUES = int(os.getenv("LLM_CONTEXT_TOP_VALUES") or "5")  # Most frequent values listed in a categorical column summary
+
+# --- Chat History Configuration ---
+CHAT_HISTORY_MAX_MESSAGES = int(os.getenv("CHAT_HISTORY_MAX_MESSAGES") or "40")  # Most recent messages loaded per chat turn
+CHAT_HISTORY_MIGRATION_BATCH_SIZE = int(os.getenv("CHAT_HISTORY_MIGRATION_BATCH_SIZE") or "500")  # Conversations moved from history_json per batch
+CHAT_HISTORY_TOKEN_BUDGET = int(os.getenv("CHAT_HISTORY_TOKEN_BUDGET") or "3000")  # Default history tokens sent per turn (requests may ask for another budget)
+CHAT_HISTORY_MAX_TOKEN_BUDGET = int(os.getenv("CHAT_HISTORY_MAX_TOKEN_BUDGET") or "16000")  # Upper bound on a requested history budget
+CHAT_SUMMARY_ENABLED = (os.getenv("CHAT_SUMMARY_ENABLED") or "true").lower() == "true"  # Fold older messages into a rolling summary
+CHAT_SUMMARY_TRIGGER_TOKENS = int(os.getenv("CHAT_SUMMARY_TRIGGER_TOKENS") or "4000")  # Unsummarized tokens that trigger a background summary refresh
+CHAT_SUMMARY_KEEP_RECENT_MESSAGES = int(os.getenv("CHAT_SUMMARY_KEEP_RECENT_MESSAGES") or "6")  # Most recent messages never folded into the summary
+CHAT_SUMMARY_MAX_INPUT_TOKENS = int(os.getenv("CHAT_SUMMARY_MAX_INPUT_TOKENS") or "12000")  # Messages folded per refresh (the rest on the next one)
+
 # --- SQL AI Trigger Configuration ---
 SQL_AI_TRIGGER = "!"  # Trigger character to detect SQL queries in user questions (first character check)
 
@@ -100,6 +139,53 @@ CACHE_TTL_AGGREGATE = int(os.getenv("CACHE_TTL_AGGREGATE") or "300")  # 5 minute
 CACHE_TTL_HISTORICAL = int(os.getenv("CACHE_TTL_HISTORICAL") or "1800")  # 30 minutes
 CACHE_TTL_DEFINITIONS = int(os.getenv("CACHE_TTL_DEFINITIONS") or "3600")  # 1 hour
 CACHE_TTL_GROUPS_TEAMS = int(os.getenv("CACHE_TTL_GROUPS_TEAMS") or "3600")  # 1 hour
+REPORT_CACHE_HARD_TTL_FACTOR = float(os.getenv("REPORT_CACHE_HARD_TTL_FACTOR") or "4")  # Hard TTL = soft TTL x factor; stale entries are served (and refreshed) in between
+
+# In-process report cache (L1) in front of Redis, per worker
+REPORT_LOCAL_CACHE_ENABLED = (os.getenv("REPORT_LOCAL_CACHE_ENABLED") or "true").lower() == "true"
+REPORT_LOCAL_CACHE_MAX_BYTES = int(os.getenv("REPORT_LOCAL_CACHE_MAX_BYTES") or str(64 * 1024 * 1024))  # 64 MB of serialized payloads
+REPORT_LOCAL_CACHE_TTL = int(os.getenv("REPORT_LOCAL_CACHE_TTL") or "30")  # Upper bound on local freshness (never exceeds the Redis TTL)
+REPORT_CACHE_INVALIDATION_CHANNEL = os.getenv("REPORT_CACHE_INVALIDATION_CHANNEL") or "report-cache:invalidate"  # Redis pub/sub channel
+
+# Report cache payload encoding (stored in Redis)
+REPORT_CACHE_SERIALIZER = os.getenv("REPORT_CACHE_SERIALIZER") or "orjson"  # orjson | msgpack | json (falls back to json if not installed)
+REPORT_CACHE_COMPRESSION = os.getenv("REPORT_CACHE_COMPRESSION") or "zstd"  # zstd | lz4 | zlib | none (falls back to zlib if not installed)
+REPORT_CACHE_COMPRESSION_MIN_BYTES = int(os.getenv("REPORT_CACHE_COMPRESSION_MIN_BYTES") or "4096")  # Payloads smaller than this are stored uncompressed
+
+# Single-flight for report cache misses (one resolver per cache key across workers)
+REPORT_SINGLE_FLIGHT_LOCK_TTL = float(os.getenv("REPORT_SINGLE_FLIGHT_LOCK_TTL") or "30")  # Redis lock expiry (seconds) if the holder dies
+REPORT_SINGLE_FLIGHT_WAIT_TIMEOUT = float(os.getenv("REPORT_SINGLE_FLIGHT_WAIT_TIMEOUT") or "20")  # Max wait for another worker before resolving locally
+REPORT_SINGLE_FLIGHT_POLL_INTERVAL = float(os.getenv("REPORT_SINGLE_FLIGHT_POLL_INTERVAL") or "0.1")  # Cache poll interval while waiting
+
+# Report cache warm-up (pre-resolves the most requested report/filter combinations)
+REPORT_WARMUP_ENABLED = (os.getenv("REPORT_WARMUP_ENABLED") or "true").lower() == "true"
+REPORT_WARMUP_TOP_N = int(os.getenv("REPORT_WARMUP_TOP_N") or "20")  # Combinations warmed per cycle
+REPORT_WARMUP_INTERVAL_SECONDS = int(os.getenv("REPORT_WARMUP_INTERVAL_SECONDS") or "600")  # 10 minutes between cycles
+REPORT_WARMUP_STARTUP_DELAY_SECONDS = float(os.getenv("REPORT_WARMUP_STARTUP_DELAY_SECONDS") or "5")  # First cycle shortly after startup
+REPORT_WARMUP_CONCURRENCY = int(os.getenv("REPORT_WARMUP_CONCURRENCY") or "2")  # Reports resolved in parallel while warming
+REPORT_WARMUP_TRACKED_MAX = int(os.getenv("REPORT_WARMUP_TRACKED_MAX") or "500")  # Combinations kept in the popularity set
+REPORT_WARMUP_DECAY = float(os.getenv("REPORT_WARMUP_DECAY") or "0.9")  # Score multiplier per cycle so old favourites fade
+REPORT_WARMUP_FLUSH_INTERVAL_SECONDS = float(os.getenv("REPORT_WARMUP_FLUSH_INTERVAL_SECONDS") or "30")  # Request counts are pushed to Redis this often per worker
+
+# In-memory report definitions registry
+REPORT_REGISTRY_RELOAD_CHANNEL = os.getenv("REPORT_REGISTRY_RELOAD_CHANNEL") or "report-registry:reload"  # Redis pub/sub channel
+REPORT_REGISTRY_CHECK_INTERVAL_SECONDS = int(os.getenv("REPORT_REGISTRY_CHECK_INTERVAL_SECONDS") or "60")  # max(updated_at) check interval
+
+# Batch report endpoint
+REPORT_BATCH_MAX_REPORTS = int(os.getenv("REPORT_BATCH_MAX_REPORTS") or "50")  # Max reports per POST /reports/batch
+REPORT_BATCH_MAX_CONCURRENCY = int(os.getenv("REPORT_BATCH_MAX_CONCURRENCY") or "4")  # Cache misses resolved in parallel per batch
+
+# --- Response Compression Configuration ---
+RESPONSE_COMPRESSION_ENABLED = (os.getenv("RESPONSE_COMPRESSION_ENABLED") or "true").lower() == "true"
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES") or "1024")  # Complete bodies below this are sent uncompressed
+RESPONSE_COMPRESSION_GZIP_LEVEL = int(os.getenv("RESPONSE_COMPRESSION_GZIP_LEVEL") or "6")
+RESPONSE_COMPRESSION_BROTLI_QUALITY = int(os.getenv("RESPONSE_COMPRESSION_BROTLI_QUALITY") or "4")  # 0-11; low values keep CPU cost close to gzip
+RESPONSE_COMPRESSION_ZSTD_LEVEL = int(os.getenv("RESPONSE_COMPRESSION_ZSTD_LEVEL") or "3")
+
+# --- Collection Pagination / Streaming Configuration ---
+NDJSON_STREAM_BATCH_SIZE = int(os.getenv("NDJSON_STREAM_BATCH_SIZE") or "500")  # Rows fetched from the server-side cursor per chunk
+ISSUE_HISTORY_EXPORT_BATCH_SIZE = int(os.getenv("ISSUE_HISTORY_EXPORT_BATCH_SIZE") or "5000")  # Rows per NDJSON chunk for /issues/history-export
+ISSUE_HISTORY_EXPORT_MAX_DAYS = int(os.getenv("ISSUE_HISTORY_EXPORT_MAX_DAYS") or "366")  # Longest date range one export may cover
 
 # --- Priority Constants ---
 # Priority constants - single source of truth
@@ -0,0 +1,304 @@
+"""
+Database Chat Messages - append-only message store for AI chat conversations.
+
+Each chat turn INSERTs its messages into chat_messages (conversation_id, seq, role,
+content, token_count) instead of rewriting chat_history.history_json. seq is allocated
+by incrementing chat_history.message_count in the same statement, so concurrent turns
+on one conversation serialize on that row and never overwrite each other. Reads fetch
+only the last N messages through the (conversation_id, seq) primary key.
+
+chat_history.summary_text / summary_seq hold the rolling summary of older messages
+(see chat_context_window.py), and llm_chars_sent / llm_tokens_sent the running total
+of what the conversation's turns sent to the LLM. chat_history.history_json keeps the per-conversation
+metadata (initial_request_*); conversations whose messages still live in
+history_json["messages"] are moved over by migrate_history_json_messages() (in bulk
+at startup, and lazily on first read).
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(content: Optional[str]) -> int:
+    """Rough token estimate (~4 characters per token) stored with each message."""
+    if not content:
+        return 0
+    return (len(content) + 3) // 4
+
+
+def append_chat_messages(
+    conversation_id: int,
+    messages: List[Dict[str, Any]],
+    conn: Connection,
+    chars_sent: int = 0,
+    tokens_sent: int = 0
+) -> List[int]:
+    """
+    Append messages to a conversation (caller commits).
+
+    Args:
+        conversation_id: chat_history.id
+        messages: [{"role": str, "content": str}, ...] in order
+        conn: Database connection
+        chars_sent: Characters the turn sent to the LLM (added to chat_history.llm_chars_sent)
+        tokens_sent: Tokens the turn sent to the LLM (added to chat_history.llm_tokens_sent)
+
+    Returns:
+        seq numbers assigned to the messages, or [] if the conversation does not exist
+    """
+    if not messages:
+        return []
+
+    roles = [str(m.get("role") or "user") for m in messages]
+    contents = [m.get("content") if isinstance(m.get("content"), str) else json.dumps(m.get("content"), default=str) for m in messages]
+    token_counts = [estimate_tokens(content) for content in contents]
+
+    query = text(f"""
+        WITH counter AS (
+            UPDATE {config.CHAT_HISTORY_TABLE}
+            SET message_count = message_count + :message_total,
+                llm_chars_sent = llm_chars_sent + :chars_sent,
+                llm_tokens_sent = llm_tokens_sent + :tokens_sent
+            WHERE id = :conversation_id
+            RETURNING message_count - :message_total AS base_seq
+        )
+        INSERT INTO {config.CHAT_MESSAGES_TABLE} (conversation_id, seq, role, content, token_count)
+        SELECT :conversation_id, counter.base_seq + m.ord, m.role, m.content, m.token_count
+        FROM counter,
+             unnest(CAST(:roles AS text[]), CAST(:contents AS text[]), CAST(:token_counts AS int[]))
+                 WITH ORDINALITY AS m(role, content, token_count, ord)
+        RETURNING seq
+    """)
+    result = conn.execute(query, {
+        "conversation_id": conversation_id,
+        "message_total": len(messages),
+        "chars_sent": chars_sent,
+        "tokens_sent": tokens_sent,
+        "roles": roles,
+        "contents": contents,
+        "token_counts": token_counts
+    })
+    return sorted(row[0] for row in result)
+
+
+def measure_llm_payload(payload: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Size of an LLM chat payload: question, conversation context, system message and history.
+
+    Returns:
+        (characters, estimated tokens)
+    """
+    chars = 0
+    for key in ("question", "conversation_context", "system_message"):
+        if payload.get(key):
+            chars += len(payload[key])
+    history = payload.get("history_json")
+    if history:
+        chars += len(json.dumps(history) if isinstance(history, dict) else str(history))
+    return chars, (chars + 3) // 4
+
+
+def load_recent_chat_messages(
+    conversation_id: int,
+    message_count: int,
+    limit: int,
+    conn: Connection,
+    after_seq: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Load the last `limit` messages of a conversation, oldest first.
+
+    The leading system message (seq 1, seeded on the initial call) is always included
+    so follow-ups keep their instructions however long the conversation gets.
+
+    Args:
+        conversation_id: chat_history.id
+        message_count: chat_history.message_count (highest seq)
+        limit: Maximum number of recent messages
+        conn: Database connection
+        after_seq: Skip messages up to this seq (already folded into the rolling summary)
+
+    Returns:
+        List of {"role", "content", "seq", "token_count"} dicts
+    """
+    if message_count <= 0:
+        return []
+
+    from_seq = max(message_count - limit, after_seq, 0)
+    query = text(f"""
+        SELECT seq, role, content, token_count
+        FROM {config.CHAT_MESSAGES_TABLE}
+        WHERE conversation_id = :conversation_id
+        AND (seq > :from_seq OR (seq = 1 AND role = 'system'))
+        ORDER BY seq
+    """)
+    result = conn.execute(query, {"conversation_id": conversation_id, "from_seq": from_seq})
+    return [
+        {"role": row[1], "content": row[2], "seq": row[0], "token_count": row[3]}
+        for row in result
+    ]
+
+
+def load_chat_messages_range(
+    conversation_id: int,
+    after_seq: int,
+    through_seq: int,
+    conn: Connection
+) -> List[Dict[str, Any]]:
+    """
+    Load messages with after_seq < seq <= through_seq (the seeded system message excluded).
+
+    Returns:
+        List of {"role", "content", "seq", "token_count"} dicts, oldest first
+    """
+    query = text(f"""
+        SELECT seq, role, content, token_count
+        FROM {config.CHAT_MESSAGES_TABLE}
+        WHERE conversation_id = :conversation_id
+        AND seq > :after_seq AND seq <= :through_seq
+        AND NOT (seq = 1 AND role = 'system')
+        ORDER BY seq
+    """)
+    result = conn.execute(query, {"conversation_id": conversation_id, "after_seq": after_seq, "through_seq": through_seq})
+    return [
+        {"role": row[1], "content": row[2], "seq": row[0], "token_count": row[3]}
+        for row in result
+    ]
+
+
+def get_unsummarized_token_total(conversation_id: int, summary_seq: int, conn: Connection) -> int:
+    """Estimated tokens of the messages not yet folded into the rolling summary."""
+    query = text(f"""
+        SELECT COALESCE(SUM(token_count), 0)
+        FROM {config.CHAT_MESSAGES_TABLE}
+        WHERE conversation_id = :conversation_id
+        AND seq > :summary_seq
+        AND NOT (seq = 1 AND role = 'system')
+    """)
+    result = conn.execute(query, {"conversation_id": conversation_id, "summary_seq": summary_seq})
+    return int(result.scalar() or 0)
+
+
+def get_chat_summary_state(conversation_id: int, conn: Connection) -> Optional[Tuple[Optional[str], int, int]]:
+    """
+    Returns:
+        (summary_text, summary_seq, message_count), or None if the conversation does not exist
+    """
+    query = text(f"""
+        SELECT summary_text, summary_seq, message_count
+        FROM {config.CHAT_HISTORY_TABLE}
+        WHERE id = :conversation_id
+    """)
+    row = conn.execute(query, {"conversation_id": conversation_id}).fetchone()
+    if not row:
+        return None
+    return row[0], row[1] or 0, row[2] or 0
+
+
+def save_chat_summary(
+    conversation_id: int,
+    summary: str,
+    through_seq: int,
+    expected_summary_seq: int,
+    conn: Connection
+) -> bool:
+    """
+    Store a new rolling summary, unless another refresh already moved it on.
+
+    Args:
+        conversation_id: chat_history.id
+        summary: New summary text
+        through_seq: Last seq the summary covers
+        expected_summary_seq: summary_seq the new summary was built on
+        conn: Database connection (committed here)
+
+    Returns:
+        True if the summary was stored
+    """
+    query = text(f"""
+        UPDATE {config.CHAT_HISTORY_TABLE}
+        SET summary_text = :summary, summary_seq = :through_seq
+        WHERE id = :conversation_id AND summary_seq = :expected_summary_seq
+    """)
+    result = conn.execute(query, {
+        "conversation_id": conversation_id,
+        "summary": summary,
+        "through_seq": through_seq,
+        "expected_summary_seq": expected_summary_seq
+    })
+    conn.commit()
+    return result.rowcount > 0
+
+
+def migrate_history_json_messages(
+    conn: Connection,
+    conversation_id: Optional[int] = None,
+    batch_size: Optional[int] = None
+) -> int:
+    """
+    Move messages from chat_history.history_json["messages"] into chat_messages.
+
+    Only conversations that have no chat_messages yet (message_count = 0) are moved;
+    "messages" is removed from history_json in the same statement, so running this
+    again is a no-op. Commits after each batch.
+
+    Args:
+        conn: Database connection
+        conversation_id: Migrate only this conversation (lazy path), or None for all
+        batch_size: Conversations per batch (default: CHAT_HISTORY_MIGRATION_BATCH_SIZE)
+
+    Returns:
+        Number of conversations migrated
+    """
+    batch_size = batch_size or config.CHAT_HISTORY_MIGRATION_BATCH_SIZE
+    conversation_filter = "AND id = :conversation_id" if conversation_id is not None else ""
+    query = text(f"""
+        WITH src AS (
+            SELECT id, history_json -> 'messages' AS messages
+            FROM {config.CHAT_HISTORY_TABLE}
+            WHERE message_count = 0
+            AND jsonb_typeof(history_json -> 'messages') = 'array'
+            {conversation_filter}
+            ORDER BY id
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        ),
+        moved AS (
+            INSERT INTO {config.CHAT_MESSAGES_TABLE} (conversation_id, seq, role, content, token_count)
+            SELECT src.id,
+                   m.ord,
+                   COALESCE(m.msg ->> 'role', 'user'),
+                   COALESCE(m.msg ->> 'content', ''),
+                   (length(COALESCE(m.msg ->> 'content', '')) + 3) / 4
+            FROM src, jsonb_array_elements(src.messages) WITH ORDINALITY AS m(msg, ord)
+            ON CONFLICT DO NOTHING
+        )
+        UPDATE {config.CHAT_HISTORY_TABLE} ch
+        SET message_count = jsonb_array_length(src.messages),
+            history_json = ch.history_json - 'messages'
+        FROM src
+        WHERE ch.id = src.id
+    """)
+
+    migrated = 0
+    while True:
+        params: Dict[str, Any] = {"batch_size": batch_size}
+        if conversation_id is not None:
+            params["conversation_id"] = conversation_id
+        result = conn.execute(query, params)
+        conn.commit()
+        migrated += result.rowcount
+        if result.rowcount < batch_size or conversation_id is not None:
+            break
+
+    if migrated:
+        logger.info(f"📦 Migrated {migrated} chat histories from history_json to {config.CHAT_MESSAGES_TABLE}")
+    return migrated
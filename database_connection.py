@@ -9,7 +9,9 @@ import os
 import time
 from sqlalchemy import create_engine, text, event
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncConnection
 from typing import Optional, Dict
+from contextlib import asynccontextmanager
 import logging
 from contextvars import ContextVar
 from urllib.parse import urlparse, parse_qs
@@ -36,6 +38,13 @@ _SKIP_SQL_LOG_PATHS = {"/api/v1/agent-jobs/claim-next"}
 # Global engine cache to prevent multiple engine creation
 _cached_engine = None
 
+# Global async engine cache (psycopg3 async driver) used by async read paths
+_cached_async_engine = None
+
+# Async pool sizing - async routes can keep many queries in flight per worker
+ASYNC_DB_POOL_SIZE = int(os.getenv('ASYNC_DB_POOL_SIZE') or '20')
+ASYNC_DB_MAX_OVERFLOW = int(os.getenv('ASYNC_DB_MAX_OVERFLOW') or '10')
+
 # Global flag to track if database creation has been attempted
 _database_creation_attempted = False
 
@@ -349,6 +358,85 @@ def safe_db_query(query_func, *args, **kwargs):
         return None
 
 
+def get_async_connection_string() -> Optional[str]:
+    """
+    Get the database connection string for the async engine.
+    Same source as get_connection_string(), but using the psycopg3 async driver.
+    psycopg3 understands the same libpq query parameters (sslmode, application_name).
+    
+    Returns:
+        Async connection string or None if not configured
+    """
+    connection_string = get_connection_string()
+    if not connection_string:
+        return None
+    return connection_string.replace('postgresql://', 'postgresql+psycopg://', 1)
+
+
+def get_async_db_engine() -> Optional[AsyncEngine]:
+    """
+    Create (once) and return the async database engine.
+    Engine creation does not open a connection - the pool connects lazily.
+    
+    Returns:
+        SQLAlchemy AsyncEngine or None if not configured
+    """
+    global _cached_async_engine
+    
+    if _cached_async_engine is not None:
+        return _cached_async_engine
+    
+    connection_string = get_async_connection_string()
+    if not connection_string:
+        logger.error("Error: No database connection string configured for async engine.")
+        return None
+    
+    try:
+        logger.info("🚀 DATABASE: Creating async engine (psycopg3)")
+        _cached_async_engine = create_async_engine(
+            connection_string,
+            pool_size=ASYNC_DB_POOL_SIZE,        # Connections kept in pool
+            max_overflow=ASYNC_DB_MAX_OVERFLOW,  # Extra connections under burst
+            pool_pre_ping=True,                  # Verify connections before use
+            pool_recycle=300,                    # Recycle connections every 5 minutes
+            pool_timeout=30,                     # Timeout for getting connection from pool
+            echo=False
+        )
+        logger.info(f"✅ DATABASE: Async engine created (pool_size={ASYNC_DB_POOL_SIZE}, max_overflow={ASYNC_DB_MAX_OVERFLOW})")
+        return _cached_async_engine
+    except Exception as e:
+        logger.error(f"Error creating async database engine: {e}")
+        return None
+
+
+async def dispose_async_db_engine() -> None:
+    """Dispose the async engine and close all pooled connections (called on shutdown)."""
+    global _cached_async_engine
+    if _cached_async_engine is not None:
+        await _cached_async_engine.dispose()
+        _cached_async_engine = None
+        logger.info("🔌 DATABASE: Async engine disposed")
+
+
+async def run_sync_db(conn: AsyncConnection, func, *args, **kwargs):
+    """
+    Run a sync Connection-based DB helper on an AsyncConnection without blocking the event loop.
+    
+    The helper receives a sync Connection facade through its `conn` keyword argument,
+    so existing helpers in database_*.py can be reused unchanged.
+    
+    Args:
+        conn: AsyncConnection from get_async_db_connection
+        func: Helper function that accepts a `conn` keyword argument
+        *args: Positional arguments to pass to func
+        **kwargs: Keyword arguments to pass to func
+        
+    Returns:
+        Result of func
+    """
+    return await conn.run_sync(lambda sync_conn: func(*args, conn=sync_conn, **kwargs))
+
+
 # Global engine instance - will be created lazily in startup event
 # Set to None initially to prevent creation at module import time
 engine = None
@@ -389,3 +477,40 @@ def get_db_connection():
         # This code runs *after* the endpoint is finished
         if conn:
             conn.close()  # Returns the connection to the pool
+
+
+@asynccontextmanager
+async def async_db_connection():
+    """
+    Async context manager yielding a connection from the async pool.
+    Use it to check out a connection only when a code path actually needs the database.
+    Raises HTTPException(503) if the pool is unavailable.
+    """
+    async_engine = get_async_db_engine()
+    
+    if async_engine is None:
+        logger.error("Async database engine is not initialized.")
+        raise HTTPException(status_code=503, detail="Database connection not available")
+    
+    conn = None
+    try:
+        conn = await async_engine.connect()
+        yield conn
+    except Exception as e:
+        if "psycopg" in str(type(e)) or "sqlalchemy" in str(type(e)) or "database" in str(e).lower():
+            logger.error(f"Database connection error: {e}")
+            raise HTTPException(status_code=503, detail="Database connection error")
+        else:
+            raise e
+    finally:
+        if conn:
+            await conn.close()  # Returns the connection to the pool
+
+
+async def get_async_db_connection():
+    """
+    FastAPI dependency to get an async DB connection from the async pool.
+    Use this in async routes so queries do not block the event loop.
+    """
+    async with async_db_connection() as conn:
+        yield conn
@@ -0,0 +1,138 @@
+"""
+Database Issue History - bulk export of jira_issue_history slices.
+
+Exports are streamed straight from PostgreSQL through the psycopg3 driver connection:
+CSV uses COPY (SELECT ...) TO STDOUT so Postgres formats the rows, and NDJSON reads a
+named (server-side) cursor in ISSUE_HISTORY_EXPORT_BATCH_SIZE batches. Neither path
+materializes the slice, so worker memory stays flat however many rows are exported.
+"""
+
+import json
+import logging
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JIRA_ISSUE_HISTORY_TABLE = "jira_issue_history"
+
+EXPORT_FORMAT_NDJSON = "ndjson"
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMATS = (EXPORT_FORMAT_NDJSON, EXPORT_FORMAT_CSV)
+
+
+def build_issue_history_export_query(
+    start_date: date,
+    end_date: date,
+    team_names: Optional[List[str]] = None,
+    sprint_id: Optional[int] = None,
+    pi_name: Optional[str] = None,
+    issue_type: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build the SELECT for a history slice (psycopg parameter style, usable inside COPY).
+
+    Args:
+        start_date: First snapshot date (inclusive)
+        end_date: Last snapshot date (inclusive)
+        team_names: Team names to include, or None for all teams
+        sprint_id: Only snapshots where the issue was in this sprint
+        pi_name: Only snapshots in this PI (quarter_pi)
+        issue_type: Only this issue type
+
+    Returns:
+        (sql, params)
+    """
+    # Half-open range on the raw column keeps the snapshot_date index usable
+    conditions = ["jh.snapshot_date >= %(start_date)s", "jh.snapshot_date < %(end_date_exclusive)s"]
+    params: Dict[str, Any] = {"start_date": start_date, "end_date_exclusive": end_date + timedelta(days=1)}
+
+    if team_names:
+        conditions.append("jh.team_name = ANY(%(team_names)s)")
+        params["team_names"] = list(team_names)
+    if sprint_id is not None:
+        conditions.append("%(sprint_id)s = ANY(jh.sprint_ids)")
+        params["sprint_id"] = sprint_id
+    if pi_name:
+        conditions.append("jh.quarter_pi = %(pi_name)s")
+        params["pi_name"] = pi_name
+    if issue_type:
+        conditions.append("jh.issuetype = %(issue_type)s")
+        params["issue_type"] = issue_type
+
+    sql = f"""
+        SELECT jh.*
+        FROM public.{JIRA_ISSUE_HISTORY_TABLE} jh
+        WHERE {" AND ".join(conditions)}
+        ORDER BY jh.snapshot_date, jh.issue_key
+    """
+    return sql, params
+
+
+async def _driver_connection(conn: AsyncConnection):
+    """The underlying psycopg AsyncConnection (COPY and named cursors are driver features)."""
+    raw = await conn.get_raw_connection()
+    return raw.driver_connection
+
+
+def _ndjson_line(row: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(row, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(row, default=str) + "\n").encode()
+
+
+async def stream_issue_history_csv(conn: AsyncConnection, sql: str, params: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """
+    Stream a history slice as CSV (with header) using COPY ... TO STDOUT.
+
+    Args:
+        conn: Async connection held for the whole stream
+        sql, params: From build_issue_history_export_query()
+
+    Yields:
+        CSV chunks as produced by Postgres
+    """
+    driver_conn = await _driver_connection(conn)
+    exported_bytes = 0
+    async with driver_conn.cursor() as cursor:
+        async with cursor.copy(f"COPY ({sql}) TO STDOUT WITH (FORMAT csv, HEADER true)", params) as copy:
+            async for chunk in copy:
+                exported_bytes += len(chunk)
+                yield bytes(chunk)
+    logger.info(f"📤 Issue history CSV export finished ({exported_bytes} bytes)")
+
+
+async def stream_issue_history_ndjson(conn: AsyncConnection, sql: str, params: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """
+    Stream a history slice as NDJSON from a named server-side cursor.
+
+    Args:
+        conn: Async connection held for the whole stream
+        sql, params: From build_issue_history_export_query()
+
+    Yields:
+        One chunk of NDJSON lines per fetched batch
+    """
+    from psycopg.rows import dict_row
+
+    driver_conn = await _driver_connection(conn)
+    batch_size = config.ISSUE_HISTORY_EXPORT_BATCH_SIZE
+    exported = 0
+    async with driver_conn.cursor(name="issue_history_export", row_factory=dict_row) as cursor:
+        await cursor.execute(sql, params)
+        while True:
+            rows = await cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            exported += len(rows)
+            yield b"".join(_ndjson_line(row) for row in rows)
+    logger.info(f"📤 Issue history NDJSON export finished ({exported} rows)")
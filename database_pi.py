@@ -6,30 +6,47 @@ This module contains database access functions for PI operations.
 
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 import logging
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
+
+from report_downsampling import change_point_indices
 
 logger = logging.getLogger(__name__)
 
+_UNPARSEABLE_DATE = object()  # Marks a burndown date string that could not be parsed
 
-def reduce_pi_burndown_data(burndown_data: List[Dict[str, Any]], days_without_change_threshold: int = 5) -> List[Dict[str, Any]]:
+
+def _burndown_day(value: Any) -> Any:
+    """Calendar day of a burndown row (datetimes truncated to their date), or _UNPARSEABLE_DATE."""
+    try:
+        if isinstance(value, str):
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).date() if 'T' in value else datetime.strptime(value, '%Y-%m-%d').date()
+        if isinstance(value, datetime):
+            return value.date()
+    except (ValueError, AttributeError, TypeError):
+        return _UNPARSEABLE_DATE
+    return value
+
+
+def _pi_burndown_kept_indices(
+    field_names: List[str],
+    column: Callable[[str], List[Any]],
+    count: int,
+    days_without_change_threshold: int
+) -> Optional[List[int]]:
     """
-    Reduce PI burndown data using Enhanced Option 5:
-    - Keep first and last day
-    - Keep days with changes (issues_completed, issues_removed, total_scope, actual_remaining)
-    - If no change for N days (default 5), add a data point to mark the period
+    Positions of the PI burndown points to keep (see reduce_pi_burndown_data).
     
     Args:
-        burndown_data: List of burndown data dictionaries
-        days_without_change_threshold: Number of days without change before adding a marker point (default: 5)
+        field_names: Column names present in the data
+        column: Returns the values of one column
+        count: Number of points
+        days_without_change_threshold: Number of days without change before adding a marker point
     
     Returns:
-        Reduced list of burndown data dictionaries
+        Sorted positions, or None if the data has no change fields (keep everything)
     """
-    if not burndown_data or len(burndown_data) <= 1:
-        return burndown_data
-    
     # Fields to track for changes (try multiple naming variations)
     possible_change_fields = [
         'issues_completed', 'issues_completed_on_day', 'completed_issues',
@@ -42,88 +59,104 @@ def reduce_pi_burndown_data(burndown_data: List[Dict[str, Any]], days_without_ch
     possible_date_fields = ['date', 'snapshot_date', 'day', 'snapshot_day', 'burndown_date']
     
     # Get field names that exist in the data
-    first_row = burndown_data[0]
-    available_fields = [field for field in possible_change_fields if field in first_row]
+    available_fields = [field for field in possible_change_fields if field in field_names]
     date_field = None
     for field in possible_date_fields:
-        if field in first_row:
+        if field in field_names:
             date_field = field
             break
     
     # If no change fields found, return original data
     if not available_fields:
         logger.warning("No change fields found in PI burndown data, returning original data")
+        return None
+    
+    # Dates are converted once for the whole series (gaps are measured in whole days)
+    days = [_burndown_day(value) for value in column(date_field)] if date_field else []
+    change_columns = [column(field) for field in available_fields]
+    
+    def days_since(last_index: int, index: int) -> int:
+        current_day, last_day = days[index], days[last_index]
+        if current_day is _UNPARSEABLE_DATE or last_day is _UNPARSEABLE_DATE:
+            # If date parsing fails, fall back to index-based counting
+            return index - last_index
+        if isinstance(current_day, date) and isinstance(last_day, date):
+            return (current_day - last_day).days
+        return 0
+    
+    # Include if:
+    # 1. First day
+    # 2. Last day
+    # 3. Has changes
+    # 4. No change for threshold days (add marker point)
+    return change_point_indices(
+        list(range(count)),
+        change_columns,
+        max_gap=days_without_change_threshold if date_field else None,
+        gap=days_since,
+    )
+
+
+def _log_pi_burndown_reduction(original: int, reduced: int) -> None:
+    logger.info(f"Reduced PI burndown data from {original} to {reduced} records ({original - reduced} removed, {100 * (original - reduced) / original:.1f}% reduction)")
+
+
+def reduce_pi_burndown_data(burndown_data: List[Dict[str, Any]], days_without_change_threshold: int = 5) -> List[Dict[str, Any]]:
+    """
+    Reduce PI burndown data using Enhanced Option 5:
+    - Keep first and last day
+    - Keep days with changes (issues_completed, issues_removed, total_scope, actual_remaining)
+    - If no change for N days (default 5), add a data point to mark the period
+    
+    Args:
+        burndown_data: List of burndown data dictionaries
+        days_without_change_threshold: Number of days without change before adding a marker point (default: 5)
+    
+    Returns:
+        Reduced list of burndown data dictionaries
+    """
+    if not burndown_data or len(burndown_data) <= 1:
         return burndown_data
     
-    reduced_data = []
-    last_values = {}
-    last_included_index = -1
+    kept_indices = _pi_burndown_kept_indices(
+        list(burndown_data[0].keys()),
+        lambda field: [row.get(field) for row in burndown_data],
+        len(burndown_data),
+        days_without_change_threshold,
+    )
+    if kept_indices is None:
+        return burndown_data
+    reduced_data = [burndown_data[i] for i in kept_indices]
     
-    for i, row in enumerate(burndown_data):
-        is_first = (i == 0)
-        is_last = (i == len(burndown_data) - 1)
-        
-        # Calculate days since last included point (if we have date field)
-        days_since_last_point = 0
-        if date_field and last_included_index >= 0:
-            try:
-                current_date = row.get(date_field)
-                last_date = burndown_data[last_included_index].get(date_field)
-                
-                # Handle different date formats
-                if isinstance(current_date, str):
-                    current_date = datetime.fromisoformat(current_date.replace('Z', '+00:00')).date() if 'T' in current_date else datetime.strptime(current_date, '%Y-%m-%d').date()
-                elif isinstance(current_date, datetime):
-                    current_date = current_date.date()
-                
-                if isinstance(last_date, str):
-                    last_date = datetime.fromisoformat(last_date.replace('Z', '+00:00')).date() if 'T' in last_date else datetime.strptime(last_date, '%Y-%m-%d').date()
-                elif isinstance(last_date, datetime):
-                    last_date = last_date.date()
-                
-                if isinstance(current_date, date) and isinstance(last_date, date):
-                    days_since_last_point = (current_date - last_date).days
-            except (ValueError, AttributeError, TypeError) as e:
-                # If date parsing fails, fall back to index-based counting
-                days_since_last_point = i - last_included_index
-        
-        # Check if any tracked field has changed
-        has_change = False
-        if is_first:
-            # Always include first day
-            has_change = True
-            # Initialize last_values
-            for field in available_fields:
-                last_values[field] = row.get(field)
-        else:
-            # Check for changes in any tracked field
-            for field in available_fields:
-                current_value = row.get(field)
-                last_value = last_values.get(field)
-                # Compare values (handle None, handle type differences)
-                if current_value != last_value:
-                    has_change = True
-                    last_values[field] = current_value
-        
-        # Include if:
-        # 1. First day
-        # 2. Last day
-        # 3. Has changes
-        # 4. No change for threshold days (add marker point)
-        if is_first or is_last or has_change or days_since_last_point >= days_without_change_threshold:
-            reduced_data.append(row)
-            last_included_index = i
-            if has_change:
-                # Update last_values for all fields when we include a point
-                for field in available_fields:
-                    last_values[field] = row.get(field)
-        # else: skip this row
-    
-    logger.info(f"Reduced PI burndown data from {len(burndown_data)} to {len(reduced_data)} records ({len(burndown_data) - len(reduced_data)} removed, {100 * (len(burndown_data) - len(reduced_data)) / len(burndown_data):.1f}% reduction)")
+    _log_pi_burndown_reduction(len(burndown_data), len(reduced_data))
     
     return reduced_data
 
 
+def reduce_pi_burndown_columns(table: Dict[str, Any], days_without_change_threshold: int = 5) -> Dict[str, Any]:
+    """
+    Same reduction as reduce_pi_burndown_data, for a columnar table ({columns, values}).
+    
+    Returns:
+        Reduced table (the same points as reduce_pi_burndown_data keeps)
+    """
+    values = table["values"]
+    count = len(next(iter(values.values()), []))
+    if count <= 1:
+        return table
+    
+    kept_indices = _pi_burndown_kept_indices(table["columns"], lambda field: values[field], count, days_without_change_threshold)
+    if kept_indices is None:
+        return table
+    
+    _log_pi_burndown_reduction(count, len(kept_indices))
+    
+    return {
+        "columns": table["columns"],
+        "values": {name: [column[i] for i in kept_indices] for name, column in values.items()},
+    }
+
+
 def fetch_pi_predictability_data(pi_names, team_names: Optional[List[str]] = None, conn: Connection = None) -> List[Dict[str, Any]]:
     """
     Fetch PI predictability data from the database function.
@@ -200,7 +233,7 @@ def fetch_pi_predictability_data(pi_names, team_names: Optional[List[str]] = Non
         raise e
 
 
-def fetch_pi_burndown_data(pi_name: str, project_keys: str = None, issue_type: str = None, team_names: Optional[List[str]] = None, conn: Connection = None) -> List[Dict[str, Any]]:
+def fetch_pi_burndown_data(pi_name: str, project_keys: str = None, issue_type: str = None, team_names: Optional[List[str]] = None, conn: Connection = None, columnar: bool = False) -> Any:
     """
     Fetch PI burndown data from the database function.
     
@@ -210,13 +243,15 @@ def fetch_pi_burndown_data(pi_name: str, project_keys: str = None, issue_type: s
         issue_type (str, optional): Issue type filter (defaults to 'Epic' if not provided)
         team_names (Optional[List[str]], optional): List of team names filter, or None for all teams
         conn (Connection): Database connection from FastAPI dependency
+        columnar (bool): Build a {columns, values} table straight from the cursor instead of row dicts
     
     Returns:
-        list: List of dictionaries with PI burndown data (all columns)
+        list: List of dictionaries with PI burndown data (all columns),
+        or a {columns, values} table when columnar is True
     """
     try:
         if not pi_name:
-            return []
+            return {"columns": [], "values": {}} if columnar else []
         
         # Default issue_type to 'Epic' if not provided (note: can still pass 'all' explicitly)
         if not issue_type or issue_type == "":
@@ -262,6 +297,17 @@ def fetch_pi_burndown_data(pi_name: str, project_keys: str = None, issue_type: s
         # Execute query with parameters (SECURE: prevents SQL injection)
         result = conn.execute(sql_query_text, params)
         
+        if columnar:
+            from database_reports import columnar_from_result
+            table = columnar_from_result(result)
+            # Format array/list columns (same as the row path below)
+            table["values"] = {
+                name: [', '.join(value) if isinstance(value, list) else value for value in column]
+                for name, column in table["values"].items()
+            }
+            logger.info(f"Retrieved {len(next(iter(table['values'].values()), []))} PI burndown records")
+            return reduce_pi_burndown_columns(table, days_without_change_threshold=5)
+        
         # Convert rows to list of dictionaries
         burndown_data = []
         for row in result:
@@ -24,6 +24,7 @@ from database_pi import (
     fetch_epic_inbound_dependency_data,
     fetch_epic_outbound_dependency_data,
 )
+from report_downsampling import downsample_report_result
 from database_team_metrics import (
     get_sprint_burndown_data_db,
     get_sprints_with_total_issues_db,
@@ -45,6 +46,12 @@ MIN_CYCLE_TIME_DAYS = 0.2  # Minimum cycle time threshold (in days) - filters ou
 VALID_DURATION_MONTHS = {1, 2, 3, 4, 6, 9}
 DEFAULT_HIERARCHY_LIMIT = 500
 
+# Report result formats: "rows" is a list of row dicts, "columnar" is
+# {"columns": [...], "values": {column: [...]}} (column names sent once, not per row)
+RESULT_FORMAT_ROWS = "rows"
+RESULT_FORMAT_COLUMNAR = "columnar"
+SUPPORTED_RESULT_FORMATS = (RESULT_FORMAT_ROWS, RESULT_FORMAT_COLUMNAR)
+
 
 def _ensure_json_field(row_dict: Dict[str, Any], field: str) -> None:
     """
@@ -147,20 +154,118 @@ def get_supported_data_sources() -> List[str]:
     return list(_REPORT_DATA_FETCHERS.keys())
 
 
-def resolve_report_data(data_source: str, filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+def resolve_report_data(
+    data_source: str,
+    filters: Dict[str, Any],
+    conn: Connection,
+    result_format: str = RESULT_FORMAT_ROWS,
+    downsample: Optional[Dict[str, Any]] = None,
+) -> ReportDataResult:
     """
     Resolve report data via the dispatcher registry.
 
+    With result_format="columnar", the time-series data sources (_COLUMNAR_REPORT_DATA_FETCHERS)
+    build the columns straight from the cursor, without per-row dicts. The other sources
+    return row lists that are converted afterwards (same output shape, no cursor savings).
+    With a downsample spec (the definition's meta_schema["downsample"]), time series are
+    reduced to max_points per series (see report_downsampling).
+
     Raises:
         KeyError: If the data source is not supported.
-        ValueError: If required filters are missing.
+        ValueError: If required filters are missing or the result format is unknown.
     """
     fetcher = _REPORT_DATA_FETCHERS.get(data_source)
     if fetcher is None:
         raise KeyError(f"Unsupported report data source '{data_source}'")
+    if result_format not in SUPPORTED_RESULT_FORMATS:
+        raise ValueError(
+            f"Unsupported result format '{result_format}' (expected one of: {', '.join(SUPPORTED_RESULT_FORMATS)})"
+        )
 
     logger.info("Resolving report data for data_source='%s' with filters=%s", data_source, filters)
-    return fetcher(filters, conn)
+    columnar_fetcher = None
+    if result_format == RESULT_FORMAT_COLUMNAR:
+        columnar_fetcher = _COLUMNAR_REPORT_DATA_FETCHERS.get(data_source)
+    result = (columnar_fetcher or fetcher)(filters, conn)
+
+    if downsample:
+        result = downsample_report_result(result, downsample, filters)
+    if result_format == RESULT_FORMAT_COLUMNAR and columnar_fetcher is None:
+        result = {**result, "data": _to_columnar_data(result.get("data"))}
+    return result
+
+
+def columnar_from_result(result: Any) -> Dict[str, Any]:
+    """
+    Build a columnar table from a result cursor, transposing the row tuples (no per-row dicts).
+    """
+    columns = list(result.keys())
+    column_values = list(zip(*result.fetchall())) or [() for _ in columns]
+    return {
+        "columns": columns,
+        "values": {column: list(values) for column, values in zip(columns, column_values)},
+    }
+
+
+def _first_row(data: Any) -> Optional[Dict[str, Any]]:
+    """First row of a row list or a columnar table (None if empty)."""
+    if isinstance(data, dict) and "values" in data:
+        if not _row_count(data):
+            return None
+        return {column: values[0] for column, values in data["values"].items()}
+    return data[0] if data else None
+
+
+def _row_count(data: Any) -> int:
+    """Number of rows in a row list or a columnar table."""
+    if isinstance(data, dict) and "values" in data:
+        return len(next(iter(data["values"].values()), []))
+    return len(data)
+
+
+def _columnar_from_rows(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a list of row dicts into a columnar table (columns in first-seen order).
+    """
+    columns: List[str] = []
+    for row in rows:
+        for column in row:
+            if column not in columns:
+                columns.append(column)
+    return {
+        "columns": columns,
+        "values": {column: [row.get(column) for row in rows] for column in columns},
+    }
+
+
+def _filter_columnar(table: Dict[str, Any], keep: List[bool]) -> Dict[str, Any]:
+    """
+    Keep only the positions where keep is True, in every column.
+    """
+    return {
+        "columns": table["columns"],
+        "values": {
+            column: [value for value, kept in zip(values, keep) if kept]
+            for column, values in table["values"].items()
+        },
+    }
+
+
+def _is_row_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+
+def _to_columnar_data(data: Any) -> Any:
+    """
+    Convert a fetcher's row-based data: a list of row dicts becomes one table, and a dict
+    has each of its non-empty row-list values converted (e.g. burndown_data). Anything else
+    is unchanged.
+    """
+    if isinstance(data, list) and all(isinstance(item, dict) for item in data):
+        return _columnar_from_rows(data)
+    if isinstance(data, dict):
+        return {key: _columnar_from_rows(value) if _is_row_list(value) else value for key, value in data.items()}
+    return data
 
 
 def _require_filter(filters: Dict[str, Any], key: str) -> Any:
@@ -170,7 +275,10 @@ def _require_filter(filters: Dict[str, Any], key: str) -> Any:
     return value
 
 
-def _fetch_team_sprint_burndown(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+def _fetch_team_sprint_burndown(filters: Dict[str, Any], conn: Connection, result_format: str = RESULT_FORMAT_ROWS) -> ReportDataResult:
+    """
+    With result_format="columnar" burndown_data is built column by column from the cursor.
+    """
     team_name = filters.get("team_name")
     issue_type = (filters.get("issue_type") or "all").strip() or "all"
     sprint_name = filters.get("sprint_name")
@@ -265,15 +373,17 @@ def _fetch_team_sprint_burndown(filters: Dict[str, Any], conn: Connection) -> Re
             },
         }
 
-    burndown_data = get_sprint_burndown_data_db(team_names_list, selected_sprint_name, issue_type, conn)
+    burndown_data = get_sprint_burndown_data_db(
+        team_names_list, selected_sprint_name, issue_type, conn, columnar=result_format == RESULT_FORMAT_COLUMNAR
+    )
 
     total_issues = 0
     # Use dates from sprint selection first, fall back to burndown_data if needed
     start_date: Optional[str] = _date_to_iso(selected_sprint_start_date) if selected_sprint_start_date else None
     end_date: Optional[str] = _date_to_iso(selected_sprint_end_date) if selected_sprint_end_date else None
 
-    if burndown_data:
-        first_entry = burndown_data[0]
+    first_entry = _first_row(burndown_data)
+    if first_entry:
         total_issues = first_entry.get("total_issues", 0) or 0
         # Only use burndown_data dates if sprint selection didn't provide them
         if not start_date:
@@ -406,7 +516,10 @@ def _fetch_team_current_sprint_progress(filters: Dict[str, Any], conn: Connectio
     }
 
 
-def _fetch_pi_burndown(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+def _fetch_pi_burndown(filters: Dict[str, Any], conn: Connection, result_format: str = RESULT_FORMAT_ROWS) -> ReportDataResult:
+    """
+    With result_format="columnar" burndown_data is built column by column from the cursor.
+    """
     from database_team_metrics import resolve_team_names_from_filter
     
     pi_name = (filters.get("pi") or "").strip() or None
@@ -450,6 +563,7 @@ def _fetch_pi_burndown(filters: Dict[str, Any], conn: Connection) -> ReportDataR
             issue_type=issue_type,
             team_names=team_names_list,
             conn=conn,
+            columnar=result_format == RESULT_FORMAT_COLUMNAR,
         )
 
     # Build meta with appropriate fields
@@ -625,7 +739,10 @@ def _fetch_team_sprint_velocity_advanced(filters: Dict[str, Any], conn: Connecti
     return _fetch_closed_sprints_flat_report(filters, conn, sort_by="advanced")
 
 
-def _fetch_team_issues_trend(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+def _fetch_team_issues_trend(filters: Dict[str, Any], conn: Connection, result_format: str = RESULT_FORMAT_ROWS) -> ReportDataResult:
+    """
+    With result_format="columnar" the data is built column by column from the cursor.
+    """
     team_name = _require_filter(filters, "team_name")
     is_group = filters.get("isGroup", False)
     issue_type = (filters.get("issue_type") or "Bug").strip() or "Bug"
@@ -639,13 +756,15 @@ def _fetch_team_issues_trend(filters: Dict[str, Any], conn: Connection) -> Repor
     team_names_list = resolve_team_names_from_filter(team_name, is_group, conn)
 
     # Get trend data for all teams
-    trend_data = get_issues_trend_data_db(team_names_list, months, issue_type, conn)
+    trend_data = get_issues_trend_data_db(
+        team_names_list, months, issue_type, conn, columnar=result_format == RESULT_FORMAT_COLUMNAR
+    )
 
     # Build meta with appropriate fields
     meta = {
         "issue_type": issue_type,
         "months": months,
-        "count": len(trend_data),
+        "count": _row_count(trend_data),
     }
     
     if is_group:
@@ -2017,10 +2136,11 @@ def _fetch_active_sprint_summary(filters: Dict[str, Any], conn: Connection) -> R
     }
 
 
-def _fetch_wip_over_time(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+def _fetch_wip_over_time(filters: Dict[str, Any], conn: Connection, result_format: str = RESULT_FORMAT_ROWS) -> ReportDataResult:
     """
     Fetch WIP over time data from get_teams_wip_history database function.
     Follows the same pattern as sprint burndown - dates are passed through as-is.
+    With result_format="columnar" the data is built column by column from the cursor.
     """
     from database_team_metrics import resolve_team_names_from_filter
     
@@ -2068,29 +2188,44 @@ def _fetch_wip_over_time(filters: Dict[str, Any], conn: Connection) -> ReportDat
         """)
     
     # Execute query
-    rows = conn.execute(query, params).fetchall()
-    data: List[Dict[str, Any]] = []
-    for row in rows:
-        # Use row._mapping to access columns by name (same pattern as sprint burndown)
-        row_dict = dict(row._mapping)
-        # Do NOT format dates - pass through as-is (same pattern as sprint burndown)
-        data.append(row_dict)
-    
-    # Filter out issue types that have all zeros
-    issue_types_with_data = {
-        row['issuetype'] 
-        for row in data 
-        if row['work_in_progress'] > 0
-    }
-    data = [row for row in data if row['issuetype'] in issue_types_with_data]
+    result = conn.execute(query, params)
+    if result_format == RESULT_FORMAT_COLUMNAR:
+        data = columnar_from_result(result)
+        issue_types = data["values"].get("issuetype", [])
+        # Filter out issue types that have all zeros
+        issue_types_with_data = {
+            issue_type
+            for issue_type, wip in zip(issue_types, data["values"].get("work_in_progress", []))
+            if wip > 0
+        }
+        data = _filter_columnar(data, [issue_type in issue_types_with_data for issue_type in issue_types])
+        issue_types = data["values"].get("issuetype", [])
+        count = len(issue_types)
+    else:
+        data: List[Dict[str, Any]] = []
+        for row in result.fetchall():
+            # Use row._mapping to access columns by name (same pattern as sprint burndown)
+            row_dict = dict(row._mapping)
+            # Do NOT format dates - pass through as-is (same pattern as sprint burndown)
+            data.append(row_dict)
+        
+        # Filter out issue types that have all zeros
+        issue_types_with_data = {
+            row['issuetype'] 
+            for row in data 
+            if row['work_in_progress'] > 0
+        }
+        data = [row for row in data if row['issuetype'] in issue_types_with_data]
+        issue_types = [row['issuetype'] for row in data]
+        count = len(data)
     
     # Build meta
-    available_issue_types = sorted(set(row['issuetype'] for row in data))
+    available_issue_types = sorted(set(issue_types))
     meta = {
         "months": months,
         "days_back": days_back,
         "isGroup": is_group,
-        "count": len(data),
+        "count": count,
         "available_teams": available_teams,
         "available_issue_types": available_issue_types,
     }
@@ -2110,10 +2245,11 @@ def _fetch_wip_over_time(filters: Dict[str, Any], conn: Connection) -> ReportDat
     }
 
 
-def _fetch_cycle_time_over_time(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+def _fetch_cycle_time_over_time(filters: Dict[str, Any], conn: Connection, result_format: str = RESULT_FORMAT_ROWS) -> ReportDataResult:
     """
     Fetch cycle time over time data using direct SQL query.
     Follows the same pattern as wip-over-time - dates are passed through as-is.
+    With result_format="columnar" the data is built column by column from the cursor.
     """
     from database_team_metrics import resolve_team_names_from_filter
     
@@ -2192,22 +2328,27 @@ def _fetch_cycle_time_over_time(filters: Dict[str, Any], conn: Connection) -> Re
     """)
     
     # Execute query
-    rows = conn.execute(query, params).fetchall()
-    data: List[Dict[str, Any]] = []
-    for row in rows:
-        # Use row._mapping to access columns by name (same pattern as sprint burndown)
-        row_dict = dict(row._mapping)
-        # Do NOT format dates - pass through as-is (same pattern as sprint burndown)
-        # Only days with actual resolved issues are returned (no zero-filled days)
-        data.append(row_dict)
+    result = conn.execute(query, params)
+    if result_format == RESULT_FORMAT_COLUMNAR:
+        data = columnar_from_result(result)
+        issue_types = data["values"].get("issuetype", [])
+    else:
+        data: List[Dict[str, Any]] = []
+        for row in result.fetchall():
+            # Use row._mapping to access columns by name (same pattern as sprint burndown)
+            row_dict = dict(row._mapping)
+            # Do NOT format dates - pass through as-is (same pattern as sprint burndown)
+            # Only days with actual resolved issues are returned (no zero-filled days)
+            data.append(row_dict)
+        issue_types = [row['issuetype'] for row in data]
     
     # Build meta
-    available_issue_types = sorted(set(row['issuetype'] for row in data))
+    available_issue_types = sorted(set(issue_types))
     meta = {
         "months": months,
         "days_back": days_back,
         "isGroup": is_group,
-        "count": len(data),
+        "count": len(issue_types),
         "available_teams": available_teams,
         "available_issue_types": available_issue_types,
     }
@@ -2250,3 +2391,120 @@ _REPORT_DATA_FETCHERS: Dict[str, ReportDataFetcher] = {
     "cycle_time_over_time": _fetch_cycle_time_over_time,
 }
 
+
+def _fetch_team_sprint_burndown_columnar(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+    return _fetch_team_sprint_burndown(filters, conn, result_format=RESULT_FORMAT_COLUMNAR)
+
+
+def _fetch_pi_burndown_columnar(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+    return _fetch_pi_burndown(filters, conn, result_format=RESULT_FORMAT_COLUMNAR)
+
+
+def _fetch_team_issues_trend_columnar(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+    return _fetch_team_issues_trend(filters, conn, result_format=RESULT_FORMAT_COLUMNAR)
+
+
+def _fetch_wip_over_time_columnar(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+    return _fetch_wip_over_time(filters, conn, result_format=RESULT_FORMAT_COLUMNAR)
+
+
+def _fetch_cycle_time_over_time_columnar(filters: Dict[str, Any], conn: Connection) -> ReportDataResult:
+    return _fetch_cycle_time_over_time(filters, conn, result_format=RESULT_FORMAT_COLUMNAR)
+
+
+# Data sources that build format=columnar results straight from the cursor: the
+# high-volume time series. The others return small, aggregated results (summaries,
+# per-sprint or per-PI rows, hierarchies) and have their row lists converted after fetching.
+_COLUMNAR_REPORT_DATA_FETCHERS: Dict[str, ReportDataFetcher] = {
+    "team_sprint_burndown": _fetch_team_sprint_burndown_columnar,
+    "pi_burndown": _fetch_pi_burndown_columnar,
+    "team_issues_trend": _fetch_team_issues_trend_columnar,
+    "wip_over_time": _fetch_wip_over_time_columnar,
+    "cycle_time_over_time": _fetch_cycle_time_over_time_columnar,
+}
+
+
+
+# --- Data source -> source tables (for ETL-driven cache invalidation) ---
+#
+# Tables each data source reads, directly or through the DB functions/views it calls.
+# When the ETL reports that some tables were refreshed, only reports whose data source
+# reads one of them are invalidated. When unsure, list the table (over-invalidating
+# costs one re-resolve; under-invalidating serves stale numbers until the TTL).
+
+JIRA_ISSUES_TABLE = config.WORK_ITEMS_TABLE
+JIRA_SPRINTS_TABLE = "jira_sprints"
+JIRA_ISSUE_HISTORY_TABLE = "jira_issue_history"
+ISSUE_STATUS_DURATIONS_TABLE = "issue_status_durations"
+# Team/group structure used to resolve team_name / isGroup filters
+_TEAM_STRUCTURE_TABLES = ("teams", "groups", "team_groups")
+
+REPORT_DATA_SOURCE_TABLES: Dict[str, Tuple[str, ...]] = {
+    "team_sprint_burndown": (JIRA_ISSUES_TABLE, JIRA_SPRINTS_TABLE, JIRA_ISSUE_HISTORY_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "team_current_sprint_progress": (JIRA_ISSUES_TABLE, JIRA_SPRINTS_TABLE),
+    "pi_burndown": (JIRA_ISSUES_TABLE, JIRA_SPRINTS_TABLE, JIRA_ISSUE_HISTORY_TABLE, config.PIS_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "team_closed_sprints": (JIRA_ISSUES_TABLE, JIRA_SPRINTS_TABLE, config.ISSUE_TYPES_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "team_sprint_velocity_advanced": (JIRA_ISSUES_TABLE, JIRA_SPRINTS_TABLE, config.ISSUE_TYPES_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "team_issues_trend": (JIRA_ISSUES_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "pi_predictability": (JIRA_ISSUES_TABLE, config.PIS_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "epic_scope_changes": (JIRA_ISSUES_TABLE, JIRA_ISSUE_HISTORY_TABLE, config.PIS_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "issues_bugs_by_priority": (JIRA_ISSUES_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "issues_bugs_by_team": (JIRA_ISSUES_TABLE,),
+    "issues_flow_status_duration": (JIRA_ISSUES_TABLE, ISSUE_STATUS_DURATIONS_TABLE, config.ISSUE_TYPES_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "issues_hierarchy": (JIRA_ISSUES_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "issues_epic_dependencies": (JIRA_ISSUES_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "issues_release_predictability": (JIRA_ISSUES_TABLE,),
+    "sprint_predictability": (JIRA_ISSUES_TABLE, JIRA_SPRINTS_TABLE, JIRA_ISSUE_HISTORY_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "pi_metrics_summary": (JIRA_ISSUES_TABLE, JIRA_ISSUE_HISTORY_TABLE, config.PIS_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "pi_metrics_summary_by_team": (JIRA_ISSUES_TABLE, JIRA_ISSUE_HISTORY_TABLE, config.PIS_TABLE, config.ISSUE_TYPES_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "active_sprint_summary": (JIRA_ISSUES_TABLE, JIRA_SPRINTS_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "wip_over_time": (JIRA_ISSUES_TABLE, JIRA_ISSUE_HISTORY_TABLE, *_TEAM_STRUCTURE_TABLES),
+    "cycle_time_over_time": (JIRA_ISSUES_TABLE, *_TEAM_STRUCTURE_TABLES),
+}
+
+
+def _normalize_table_name(table: str) -> str:
+    name = table.strip().lower()
+    if name.startswith("public."):
+        name = name[len("public."):]
+    return name
+
+
+def get_known_source_tables() -> List[str]:
+    """
+    Return every table referenced by REPORT_DATA_SOURCE_TABLES.
+    """
+    return sorted({table for tables in REPORT_DATA_SOURCE_TABLES.values() for table in tables})
+
+
+def get_data_sources_for_tables(tables: List[str]) -> List[str]:
+    """
+    Return the data sources that read any of the given tables.
+
+    Table names may be schema-qualified ("public.jira_issues").
+    """
+    changed = {_normalize_table_name(table) for table in tables if table and table.strip()}
+    return sorted(
+        data_source
+        for data_source, source_tables in REPORT_DATA_SOURCE_TABLES.items()
+        if changed.intersection(source_tables)
+    )
+
+
+def get_report_ids_for_data_sources(data_sources: List[str], conn: Connection) -> List[str]:
+    """
+    Fetch the IDs of report definitions that use any of the given data sources.
+    """
+    if not data_sources:
+        return []
+
+    query = text(
+        f"""
+        SELECT report_id
+        FROM {config.REPORT_DEFINITIONS_TABLE}
+        WHERE data_source = ANY(:data_sources)
+        ORDER BY report_id
+        """
+    )
+    result = conn.execute(query, {"data_sources": list(data_sources)})
+    return [row[0] for row in result]
@@ -157,11 +157,18 @@ DEFAULT_REPORT_DEFINITIONS = [
         },
         "meta_schema": {
             "required_filters": [],
-            "optional_filters": ["team_name", "issue_type", "sprint_name"],
+            "optional_filters": ["team_name", "issue_type", "sprint_name", "max_points"],
             "parameters": {
                 "team_name": {"type": "string", "description": "Team identifier"},
                 "issue_type": {"type": "string", "description": "Issue type filter such as 'all', 'Bug', 'Story'"},
-                "sprint_name": {"type": "string", "description": "Explicit sprint name override"}
+                "sprint_name": {"type": "string", "description": "Explicit sprint name override"},
+                "max_points": {"type": "integer", "description": "Downsample the series to at most this many points (per series)"}
+            },
+            "downsample": {
+                "path": "burndown_data",
+                "x": "snapshot_date",
+                "y": ["remaining_issues", "total_issues", "wip_issues_in_progress"],
+                "strategy": "lttb"
             },
             "allowed_views": ["team-dashboard"]
         }
@@ -390,7 +397,6 @@ DEFAULT_REPORT_DEFINITIONS = [
         "chart_type": "table",
         "data_source": "issues_hierarchy",
         "description": "Displays the hierarchy of issues with status and dependency information.",
-        "max_records_for_llm": 50,
         "default_filters": {
             "pi": None,
             "hierarchy_level": None,
@@ -407,6 +413,7 @@ DEFAULT_REPORT_DEFINITIONS = [
                 "isGroup": {"type": "boolean", "description": "If true, team_name is treated as a group name"},
                 "limit": {"type": "integer", "description": "Maximum number of records to return (up to 1000)"}
             },
+            "llm_context": {"exclude": True, "max_rows": 50},
             "allowed_views": ["pi-dashboard", "team-dashboard"]
         }
     },
@@ -558,11 +565,18 @@ DEFAULT_REPORT_DEFINITIONS = [
         },
         "meta_schema": {
             "required_filters": [],
-            "optional_filters": ["team_name", "isGroup", "months"],
+            "optional_filters": ["team_name", "isGroup", "months", "max_points"],
             "parameters": {
                 "team_name": {"type": "string", "description": "Team identifier or group name (if isGroup=true)"},
                 "isGroup": {"type": "boolean", "description": "If true, team_name is treated as a group name"},
-                "months": {"type": "integer", "description": "Number of months to look back (default: 3, converts to days)"}
+                "months": {"type": "integer", "description": "Number of months to look back (default: 3, converts to days)"},
+                "max_points": {"type": "integer", "description": "Downsample the series to at most this many points (per series)"}
+            },
+            "downsample": {
+                "x": "snapshot_day",
+                "y": ["work_in_progress"],
+                "group_by": "issuetype",
+                "strategy": "lttb"
             },
             "allowed_views": ["pi-dashboard", "team-dashboard"]
         }
@@ -580,11 +594,18 @@ DEFAULT_REPORT_DEFINITIONS = [
         },
         "meta_schema": {
             "required_filters": [],
-            "optional_filters": ["team_name", "isGroup", "months"],
+            "optional_filters": ["team_name", "isGroup", "months", "max_points"],
             "parameters": {
                 "team_name": {"type": "string", "description": "Team identifier or group name (if isGroup=true)"},
                 "isGroup": {"type": "boolean", "description": "If true, team_name is treated as a group name"},
-                "months": {"type": "integer", "description": "Number of months to look back (default: 3, converts to days)"}
+                "months": {"type": "integer", "description": "Number of months to look back (default: 3, converts to days)"},
+                "max_points": {"type": "integer", "description": "Downsample the series to at most this many points (per series)"}
+            },
+            "downsample": {
+                "x": "snapshot_day",
+                "y": ["avg_cycle_time", "issue_count"],
+                "group_by": "issuetype",
+                "strategy": "lttb"
             },
             "allowed_views": ["pi-dashboard", "team-dashboard"]
         }
@@ -1188,7 +1209,12 @@ def create_chat_history_table_if_not_exists(engine=None) -> bool:
                     chat_type VARCHAR(50) NOT NULL,
                     start_timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                     history_json JSONB,
-                    issue_key VARCHAR(50)
+                    issue_key VARCHAR(50),
+                    message_count INT NOT NULL DEFAULT 0,
+                    summary_text TEXT,
+                    summary_seq INT NOT NULL DEFAULT 0,
+                    llm_chars_sent BIGINT NOT NULL DEFAULT 0,
+                    llm_tokens_sent BIGINT NOT NULL DEFAULT 0
                 );
                 
                 CREATE INDEX idx_chat_history_username ON public.chat_history(username);
@@ -1212,6 +1238,98 @@ def create_chat_history_table_if_not_exists(engine=None) -> bool:
         return False
 
 
+def create_chat_messages_table_if_not_exists(engine=None) -> bool:
+    """
+    Create the append-only chat_messages table, add the chat_history message_count,
+    rolling summary and LLM usage columns, and move existing history_json messages over.
+    """
+    # Skip if tables are already initialized (no need to check again)
+    global _tables_initialized
+    if _tables_initialized:
+        return True
+    
+    import database_connection
+    
+    if engine is None:
+        engine = database_connection.get_db_engine()
+    if engine is None:
+        print("Warning: Database engine not available, cannot create chat_messages table")
+        return False
+    
+    try:
+        with engine.connect() as conn:
+            # Columns added to chat_history for the message store, rolling summaries and LLM usage
+            chat_history_columns = [
+                ("message_count", "INT NOT NULL DEFAULT 0"),
+                ("summary_text", "TEXT"),
+                ("summary_seq", "INT NOT NULL DEFAULT 0"),
+                ("llm_chars_sent", "BIGINT NOT NULL DEFAULT 0"),
+                ("llm_tokens_sent", "BIGINT NOT NULL DEFAULT 0"),
+            ]
+            for column_name, column_type in chat_history_columns:
+                check_column_sql = """
+                SELECT EXISTS (
+                    SELECT FROM information_schema.columns 
+                    WHERE table_schema = 'public' 
+                    AND table_name = 'chat_history'
+                    AND column_name = :column_name
+                );
+                """
+                result = conn.execute(text(check_column_sql), {"column_name": column_name})
+                column_exists = result.scalar()
+                
+                if not column_exists:
+                    print(f"Adding {column_name} column to chat_history table...")
+                    conn.execute(text(f"ALTER TABLE public.chat_history ADD COLUMN {column_name} {column_type};"))
+                    conn.commit()
+                    print(f"{column_name} column added successfully")
+                else:
+                    print(f"{column_name} column already exists")
+            
+            # Check if table exists
+            check_table_sql = """
+            SELECT EXISTS (
+                SELECT FROM information_schema.tables 
+                WHERE table_schema = 'public' 
+                AND table_name = 'chat_messages'
+            );
+            """
+            result = conn.execute(text(check_table_sql))
+            table_exists = result.scalar()
+            
+            if not table_exists:
+                print("Creating chat_messages table...")
+                create_table_sql = """
+                CREATE TABLE public.chat_messages (
+                    conversation_id INT NOT NULL REFERENCES public.chat_history(id) ON DELETE CASCADE,
+                    seq INT NOT NULL,
+                    role VARCHAR(20) NOT NULL,
+                    content TEXT NOT NULL,
+                    token_count INT NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+                    PRIMARY KEY (conversation_id, seq)
+                );
+                """
+                conn.execute(text(create_table_sql))
+                conn.commit()
+                print("Chat messages table created successfully")
+            else:
+                print("Chat messages table already exists")
+            
+            # Move histories still stored in history_json (no-op once migrated)
+            from database_chat_messages import migrate_history_json_messages
+            migrated = migrate_history_json_messages(conn)
+            if migrated:
+                print(f"Migrated {migrated} chat histories to chat_messages")
+            
+            return True
+            
+    except Exception as e:
+        print(f"Error creating chat_messages table: {e}")
+        traceback.print_exc()
+        return False
+
+
 def add_input_sent_column_to_agent_jobs(engine=None) -> bool:
     """Temporary function to add input_sent column to agent_jobs table"""
     # Skip if tables are already initialized (no need to check again)
@@ -1278,10 +1396,11 @@ def add_input_sent_column_to_agent_jobs(engine=None) -> bool:
 
 def create_teams_and_team_groups_tables_if_not_exists(engine=None) -> bool:
     """
-    Create teams, groups, and team_groups tables if they don't exist.
+    Create teams, groups, team_groups and group_closure tables if they don't exist.
     - groups: holds group hierarchy
     - teams: holds team data
     - team_groups: many-to-many junction table between teams and groups
+    - group_closure: (ancestor_id, descendant_id, depth) for every pair in the group hierarchy
     """
     # Skip if tables are already initialized (no need to check again)
     global _tables_initialized
@@ -1387,6 +1506,41 @@ def create_teams_and_team_groups_tables_if_not_exists(engine=None) -> bool:
             else:
                 print("Team_groups junction table already exists")
             
+            # Check if group_closure table exists (maintained by the groups endpoints)
+            check_closure_sql = """
+            SELECT EXISTS (
+                SELECT FROM information_schema.tables 
+                WHERE table_schema = 'public' 
+                AND table_name = 'group_closure'
+            );
+            """
+            result = conn.execute(text(check_closure_sql))
+            table_exists = result.scalar()
+            
+            if not table_exists:
+                print("Creating group_closure table...")
+                create_table_sql = """
+                CREATE TABLE public.group_closure (
+                    ancestor_id INT NOT NULL,
+                    descendant_id INT NOT NULL,
+                    depth INT NOT NULL,
+                    PRIMARY KEY (ancestor_id, descendant_id),
+                    FOREIGN KEY (ancestor_id) REFERENCES public.groups(group_key) ON DELETE CASCADE,
+                    FOREIGN KEY (descendant_id) REFERENCES public.groups(group_key) ON DELETE CASCADE
+                );
+                
+                CREATE INDEX idx_group_closure_descendant ON public.group_closure(descendant_id);
+                """
+                conn.execute(text(create_table_sql))
+                
+                # Backfill from the existing hierarchy
+                from groups_teams_cache import rebuild_group_closure
+                closure_rows = rebuild_group_closure(conn)
+                conn.commit()
+                print(f"Group_closure table created successfully ({closure_rows} rows backfilled)")
+            else:
+                print("Group_closure table already exists")
+            
             return True
             
     except Exception as e:
@@ -1885,6 +2039,7 @@ def initialize_database_tables_with_engine(engine) -> None:
     create_transcripts_table_if_not_exists(engine)
     create_recommendations_table_if_not_exists(engine)
     create_chat_history_table_if_not_exists(engine)
+    create_chat_messages_table_if_not_exists(engine)
     create_insight_types_table_if_not_exists(engine)
     create_report_definitions_table_if_not_exists(engine)
     create_pi_goals_table_if_not_exists(engine)
@@ -615,7 +615,7 @@ def resolve_team_names_from_filter(
     """
     from fastapi import HTTPException
     from groups_teams_cache import (
-        get_cached_groups, get_cached_teams,
+        get_group_team_index,
         group_exists_by_name_in_db, team_exists_by_name_in_db
     )
     
@@ -636,10 +636,9 @@ def resolve_team_names_from_filter(
             raise HTTPException(status_code=400, detail="Group name is too long (max 100 characters)")
         
         # Check if group exists
-        cached_groups = get_cached_groups()
-        if cached_groups:
-            groups = cached_groups.get("groups", [])
-            group_exists = any(g.get("name") == validated_group_name for g in groups)
+        index = get_group_team_index()
+        if index is not None:
+            group_exists = index.has_group(validated_group_name)
         else:
             group_exists = group_exists_by_name_in_db(validated_group_name, conn)
         
@@ -674,10 +673,9 @@ def resolve_team_names_from_filter(
             raise HTTPException(status_code=400, detail="Team name is too long (max 100 characters)")
         
         # Verify team exists
-        cached_teams = get_cached_teams()
-        if cached_teams:
-            teams = cached_teams.get("teams", [])
-            team_exists = any(t.get("team_name") == validated for t in teams)
+        index = get_group_team_index()
+        if index is not None:
+            team_exists = index.has_team(validated)
         else:
             team_exists = team_exists_by_name_in_db(validated, conn)
         
@@ -779,7 +777,22 @@ def get_closed_sprints_data_db(team_names: Optional[List[str]], months: int = 3,
         raise e
 
 
-def get_sprint_burndown_data_db(team_names: List[str], sprint_name: str, issue_type: str = "all", conn: Connection = None) -> List[Dict[str, Any]]:
+# Sprint burndown columns returned by get_sprint_burndown_data_db (counts are converted to int)
+_SPRINT_BURNDOWN_DATE_COLUMNS = ['snapshot_date', 'start_date', 'end_date']
+_SPRINT_BURNDOWN_COUNT_COLUMNS = [
+    'remaining_issues', 'ideal_remaining', 'total_issues', 'issues_added_on_day',
+    'issues_removed_on_day', 'issues_completed_on_day', 'wip_issues_in_progress'
+]
+
+
+def _burndown_count(value):
+    # Preserve None values
+    if value is None:
+        return None
+    return int(value) if value else 0
+
+
+def get_sprint_burndown_data_db(team_names: List[str], sprint_name: str, issue_type: str = "all", conn: Connection = None, columnar: bool = False) -> Any:
     """
     Get sprint burndown data for a specific team and sprint.
     Uses the get_sprint_burndown_data_for_team database function.
@@ -789,9 +802,10 @@ def get_sprint_burndown_data_db(team_names: List[str], sprint_name: str, issue_t
         sprint_name (str): Sprint name
         issue_type (str): Issue type filter (default: "all")
         conn (Connection): Database connection from FastAPI dependency
+        columnar (bool): Build a {columns, values} table straight from the cursor instead of row dicts
     
     Returns:
-        list: List of burndown data dictionaries
+        list: List of burndown data dictionaries, or a {columns, values} table when columnar is True
     """
     try:
         # SECURE: Parameterized query prevents SQL injection
@@ -808,28 +822,35 @@ def get_sprint_burndown_data_db(team_names: List[str], sprint_name: str, issue_t
             "team_names": team_names
         })
         
+        if columnar:
+            from database_reports import columnar_from_result
+            values = columnar_from_result(result)["values"]
+            count = len(next(iter(values.values()), []))
+            columns = _SPRINT_BURNDOWN_DATE_COLUMNS + _SPRINT_BURNDOWN_COUNT_COLUMNS
+            return {
+                "columns": columns,
+                "values": {
+                    **{name: values.get(name) or [None] * count for name in _SPRINT_BURNDOWN_DATE_COLUMNS},
+                    **{name: [_burndown_count(value) for value in values.get(name) or [None] * count] for name in _SPRINT_BURNDOWN_COUNT_COLUMNS},
+                },
+            }
+        
         burndown_data = []
         for row in result:
             # Use row._mapping to access columns by name (safer than positional indexing)
             row_dict = dict(row._mapping)
             
-            # Helper function to preserve None values
-            def safe_int(value):
-                if value is None:
-                    return None
-                return int(value) if value else 0
-            
             burndown_data.append({
                 'snapshot_date': row_dict.get('snapshot_date'),
                 'start_date': row_dict.get('start_date'),
                 'end_date': row_dict.get('end_date'),
-                'remaining_issues': safe_int(row_dict.get('remaining_issues')),
-                'ideal_remaining': safe_int(row_dict.get('ideal_remaining')),
-                'total_issues': safe_int(row_dict.get('total_issues')),
-                'issues_added_on_day': safe_int(row_dict.get('issues_added_on_day')),
-                'issues_removed_on_day': safe_int(row_dict.get('issues_removed_on_day')),
-                'issues_completed_on_day': safe_int(row_dict.get('issues_completed_on_day')),
-                'wip_issues_in_progress': safe_int(row_dict.get('wip_issues_in_progress'))
+                'remaining_issues': _burndown_count(row_dict.get('remaining_issues')),
+                'ideal_remaining': _burndown_count(row_dict.get('ideal_remaining')),
+                'total_issues': _burndown_count(row_dict.get('total_issues')),
+                'issues_added_on_day': _burndown_count(row_dict.get('issues_added_on_day')),
+                'issues_removed_on_day': _burndown_count(row_dict.get('issues_removed_on_day')),
+                'issues_completed_on_day': _burndown_count(row_dict.get('issues_completed_on_day')),
+                'wip_issues_in_progress': _burndown_count(row_dict.get('wip_issues_in_progress'))
             })
         
         return burndown_data
@@ -1007,7 +1028,7 @@ def get_sprint_history_issues_db(
         raise e
 
 
-def get_issues_trend_data_db(team_names: Optional[List[str]], months: int = 6, issue_type: str = "all", conn: Connection = None) -> List[Dict[str, Any]]:
+def get_issues_trend_data_db(team_names: Optional[List[str]], months: int = 6, issue_type: str = "all", conn: Connection = None, columnar: bool = False) -> Any:
     """
     Get issues created and resolved over time for one or more teams.
     Uses the issues_created_and_resolved_over_time view.
@@ -1018,9 +1039,11 @@ def get_issues_trend_data_db(team_names: Optional[List[str]], months: int = 6, i
         months (int): Number of months to look back (1, 2, 3, 4, 6, 9, 12) - default: 6
         issue_type (str): Issue type filter (default: "all")
         conn (Connection): Database connection from FastAPI dependency
+        columnar (bool): Build a {columns, values} table straight from the cursor instead of row dicts
     
     Returns:
-        list: List of trend data dictionaries directly from the view
+        list: List of trend data dictionaries directly from the view,
+        or a {columns, values} table when columnar is True
     """
     try:
         # Calculate start date based on months parameter
@@ -1059,6 +1082,10 @@ def get_issues_trend_data_db(team_names: Optional[List[str]], months: int = 6, i
         
         result = conn.execute(text(sql_query), params)
         
+        if columnar:
+            from database_reports import columnar_from_result
+            return columnar_from_result(result)
+        
         # Convert rows to dictionaries - pass through all columns
         trend_data = []
         for row in result:
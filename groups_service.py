@@ -283,6 +283,10 @@ async def create_group(
             "ai_insight": request.ai_insight if request.ai_insight is not None else False
         })
         row = result.fetchone()
+        
+        # Maintain the hierarchy closure in the same transaction
+        from groups_teams_cache import insert_group_closure
+        insert_group_closure(row[0], row[2], conn)
         conn.commit()
         
         # Invalidate cache after mutation
@@ -373,6 +377,13 @@ async def update_group(
                     status_code=404,
                     detail=f"Parent group with ID {parent_key} not found"
                 )
+            # Prevent cycles (moving a group under one of its own descendants)
+            from groups_teams_cache import is_group_descendant_in_db
+            if is_group_descendant_in_db(parent_key, validated_group_id, conn):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Group cannot be moved under one of its own descendants"
+                )
         
         # Build dynamic UPDATE query
         updates = []
@@ -408,7 +419,6 @@ async def update_group(
         
         result = conn.execute(query, params)
         row = result.fetchone()
-        conn.commit()
         
         if not row:
             raise HTTPException(
@@ -416,6 +426,12 @@ async def update_group(
                 detail=f"Group with ID {validated_group_id} not found"
             )
         
+        # Maintain the hierarchy closure in the same transaction
+        if request.parent_group_key is not None:
+            from groups_teams_cache import move_group_closure
+            move_group_closure(validated_group_id, parent_key, conn)
+        conn.commit()
+        
         # Refresh cache after mutation
         from groups_teams_cache import invalidate_groups_teams_cache
         invalidate_groups_teams_cache()
@@ -487,6 +503,10 @@ async def delete_group(
         """)
         conn.execute(delete_associations_query, {"group_key": validated_group_id})
         
+        # Remove its hierarchy closure rows (CASCADE would too; same transaction either way)
+        from groups_teams_cache import delete_group_closure
+        delete_group_closure(validated_group_id, conn)
+        
         # Then delete the group
         delete_query = text("""
             DELETE FROM public.groups
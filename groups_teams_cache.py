@@ -3,10 +3,17 @@ Groups and Teams Cache - Redis-based cache for groups and teams data.
 
 This module provides simple cache functions following the same pattern as reports cache.
 Cache functions are simple get/set - services orchestrate the flow.
+
+Group -> team resolution additionally goes through an in-process GroupTeamIndex built
+once from the cached payload. Every write/invalidation bumps a Redis version key; each
+worker rebuilds its index only when that version changes, so resolving a group is a
+dict lookup instead of decoding both blobs and walking the hierarchy per request.
 """
 
 import json
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+import time
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
 import logging
@@ -18,6 +25,35 @@ logger = logging.getLogger(__name__)
 # Cache keys
 CACHE_KEY_GROUPS = "groups:all"
 CACHE_KEY_TEAMS = "teams:all"
+CACHE_KEY_GROUPS_TEAMS_VERSION = "groups_teams:version"
+
+
+def _bump_groups_teams_version(client) -> None:
+    """Signal every worker that its group/team index is out of date."""
+    try:
+        client.incr(CACHE_KEY_GROUPS_TEAMS_VERSION)
+    except Exception as e:
+        logger.warning(f"Failed to bump groups/teams cache version: {e}")
+
+
+def get_groups_teams_version() -> Optional[str]:
+    """
+    Current groups/teams cache version.
+    
+    Returns:
+        Version string ("0" if never bumped), or None if Redis is unavailable
+    """
+    try:
+        client = get_redis_client()
+        if not client:
+            return None
+        version = client.get(CACHE_KEY_GROUPS_TEAMS_VERSION)
+        if isinstance(version, bytes):
+            version = version.decode()
+        return version or "0"
+    except Exception as e:
+        logger.warning(f"Cache retrieval error for {CACHE_KEY_GROUPS_TEAMS_VERSION}: {e}")
+        return None
 
 
 def get_cached_groups() -> Optional[Dict[str, Any]]:
@@ -62,6 +98,7 @@ def set_cached_groups(data: Dict[str, Any], ttl: Optional[int] = None) -> bool:
         
         ttl = ttl or config.CACHE_TTL_GROUPS_TEAMS
         client.setex(CACHE_KEY_GROUPS, ttl, json.dumps(data, default=str))
+        _bump_groups_teams_version(client)
         return True
     except Exception as e:
         logger.warning(f"Cache set error for groups:all: {e}")
@@ -110,6 +147,7 @@ def set_cached_teams(data: Dict[str, Any], ttl: Optional[int] = None) -> bool:
         
         ttl = ttl or config.CACHE_TTL_GROUPS_TEAMS
         client.setex(CACHE_KEY_TEAMS, ttl, json.dumps(data, default=str))
+        _bump_groups_teams_version(client)
         return True
     except Exception as e:
         logger.warning(f"Cache set error for teams:all: {e}")
@@ -156,6 +194,8 @@ def invalidate_groups_teams_cache() -> int:
         if client.exists(CACHE_KEY_TEAMS):
             keys.append(CACHE_KEY_TEAMS)
         
+        # Bump even when nothing was cached - workers may still hold an index of the old data
+        _bump_groups_teams_version(client)
         if keys:
             deleted = client.delete(*keys)
             logger.info(f"Invalidated {deleted} groups/teams cache entries")
@@ -243,16 +283,11 @@ def load_teams_in_group_from_db(group_id: int, conn: Connection, include_childre
     """
     if include_children:
         query = text("""
-            WITH RECURSIVE group_tree AS (
-                SELECT group_key FROM public.groups WHERE group_key = :group_id
-                UNION ALL
-                SELECT g.group_key FROM public.groups g
-                INNER JOIN group_tree gt ON g.parent_group_key = gt.group_key
-            )
             SELECT DISTINCT t.team_key, t.team_name, t.number_of_team_members
-            FROM public.teams t
-            INNER JOIN public.team_groups tg ON t.team_key = tg.team_id
-            WHERE tg.group_id IN (SELECT group_key FROM group_tree)
+            FROM public.group_closure gc
+            INNER JOIN public.team_groups tg ON tg.group_id = gc.descendant_id
+            INNER JOIN public.teams t ON t.team_key = tg.team_id
+            WHERE gc.ancestor_id = :group_id
             ORDER BY t.team_name
         """)
     else:
@@ -313,16 +348,11 @@ def load_teams_for_group_from_db(group_name: str, conn: Connection, include_chil
     
     if include_children:
         query = text("""
-            WITH RECURSIVE group_tree AS (
-                SELECT group_key FROM public.groups WHERE group_key = :group_key
-                UNION ALL
-                SELECT g.group_key FROM public.groups g
-                INNER JOIN group_tree gt ON g.parent_group_key = gt.group_key
-            )
             SELECT DISTINCT t.team_name
-            FROM public.teams t
-            INNER JOIN public.team_groups tg ON t.team_key = tg.team_id
-            WHERE tg.group_id IN (SELECT group_key FROM group_tree)
+            FROM public.group_closure gc
+            INNER JOIN public.team_groups tg ON tg.group_id = gc.descendant_id
+            INNER JOIN public.teams t ON t.team_key = tg.team_id
+            WHERE gc.ancestor_id = :group_key
             ORDER BY t.team_name
         """)
     else:
@@ -385,53 +415,253 @@ def get_team_by_id_from_db(team_key: int, conn: Connection) -> Optional[Dict[str
     return None
 
 
-def _build_recursive_teams_from_cache(
-    group_id: int,
-    cached_groups: Dict[str, Any],
-    cached_teams: Dict[str, Any]
-) -> List[str]:
+# ==================== Group Closure Table ====================
+#
+# public.group_closure holds one row per (ancestor, descendant) pair of the group
+# hierarchy, including (g, g, 0) for every group, so "all teams under group X" is
+# group_closure JOIN team_groups on ancestor_id = X. Team membership itself stays in
+# team_groups. The helpers below run on the caller's connection and never commit:
+# they are part of the same transaction as the groups change they mirror.
+
+def rebuild_group_closure(conn: Connection) -> int:
     """
-    Build recursive team list for a group from cache data.
-    Includes teams from all descendant groups.
+    Recompute the whole closure table from public.groups (backfill / repair).
     
     Args:
-        group_id: Target group ID
-        cached_groups: Cached groups data
-        cached_teams: Cached teams data
+        conn: Database connection (caller commits)
     
     Returns:
-        List of team names
+        Number of closure rows written
+    """
+    conn.execute(text("DELETE FROM public.group_closure"))
+    result = conn.execute(text("""
+        INSERT INTO public.group_closure (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE tree AS (
+            SELECT group_key AS ancestor_id, group_key AS descendant_id, 0 AS depth
+            FROM public.groups
+            UNION ALL
+            SELECT tree.ancestor_id, g.group_key, tree.depth + 1
+            FROM tree
+            INNER JOIN public.groups g ON g.parent_group_key = tree.descendant_id
+            WHERE tree.depth < 100  -- Guards against circular parent references
+        )
+        SELECT ancestor_id, descendant_id, MIN(depth)
+        FROM tree
+        GROUP BY ancestor_id, descendant_id
+    """))
+    return result.rowcount
+
+
+def insert_group_closure(group_id: int, parent_id: Optional[int], conn: Connection) -> None:
+    """
+    Add closure rows for a newly created group (itself plus every ancestor of its parent).
+    
+    Args:
+        group_id: New group key
+        parent_id: Parent group key, or None for a root group
+        conn: Database connection (caller commits)
+    """
+    conn.execute(
+        text("""
+            INSERT INTO public.group_closure (ancestor_id, descendant_id, depth)
+            VALUES (:group_id, :group_id, 0)
+            ON CONFLICT DO NOTHING
+        """),
+        {"group_id": group_id}
+    )
+    if parent_id is not None:
+        conn.execute(
+            text("""
+                INSERT INTO public.group_closure (ancestor_id, descendant_id, depth)
+                SELECT ancestor_id, :group_id, depth + 1
+                FROM public.group_closure
+                WHERE descendant_id = :parent_id
+                ON CONFLICT DO NOTHING
+            """),
+            {"group_id": group_id, "parent_id": parent_id}
+        )
+
+
+def move_group_closure(group_id: int, new_parent_id: Optional[int], conn: Connection) -> None:
     """
-    groups = cached_groups.get("groups", [])
-    teams = cached_teams.get("teams", [])
+    Re-link a group's subtree under a new parent.
     
-    # Step 1: Build set of all descendant group IDs (including self)
-    descendant_ids = {group_id}
-    visited = set()  # Prevent circular references
+    Removes the paths from the subtree to its old ancestors, then adds a path from every
+    ancestor of the new parent (inclusive) to every node of the subtree.
+    
+    Args:
+        group_id: Group being moved (root of the moved subtree)
+        new_parent_id: New parent group key, or None to make it a root group
+        conn: Database connection (caller commits)
+    """
+    conn.execute(
+        text("""
+            DELETE FROM public.group_closure
+            WHERE descendant_id IN (
+                SELECT descendant_id FROM public.group_closure WHERE ancestor_id = :group_id
+            )
+            AND ancestor_id NOT IN (
+                SELECT descendant_id FROM public.group_closure WHERE ancestor_id = :group_id
+            )
+        """),
+        {"group_id": group_id}
+    )
+    if new_parent_id is not None:
+        conn.execute(
+            text("""
+                INSERT INTO public.group_closure (ancestor_id, descendant_id, depth)
+                SELECT above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+                FROM public.group_closure above
+                CROSS JOIN public.group_closure below
+                WHERE above.descendant_id = :new_parent_id
+                AND below.ancestor_id = :group_id
+                ON CONFLICT DO NOTHING
+            """),
+            {"group_id": group_id, "new_parent_id": new_parent_id}
+        )
+
+
+def delete_group_closure(group_id: int, conn: Connection) -> None:
+    """
+    Remove every closure row that references a group being deleted.
     
-    def find_children(parent_id: int):
-        """Recursively find all child groups"""
-        if parent_id in visited:
-            return  # Prevent infinite loops
-        visited.add(parent_id)
+    Args:
+        group_id: Group key
+        conn: Database connection (caller commits)
+    """
+    conn.execute(
+        text("""
+            DELETE FROM public.group_closure
+            WHERE ancestor_id = :group_id OR descendant_id = :group_id
+        """),
+        {"group_id": group_id}
+    )
+
+
+def is_group_descendant_in_db(group_id: int, ancestor_id: int, conn: Connection) -> bool:
+    """Check if group_id is ancestor_id itself or one of its descendants."""
+    query = text("""
+        SELECT 1 FROM public.group_closure
+        WHERE ancestor_id = :ancestor_id AND descendant_id = :group_id
+        LIMIT 1
+    """)
+    result = conn.execute(query, {"ancestor_id": ancestor_id, "group_id": group_id})
+    return result.fetchone() is not None
+
+
+# ==================== In-Process Group/Team Index ====================
+
+class GroupTeamIndex:
+    """
+    Precomputed group -> team closure over one version of the cached groups/teams payload.
+    
+    Built once per version; all lookups are dict/set lookups.
+    """
+    
+    def __init__(self, cached_groups: Dict[str, Any], cached_teams: Dict[str, Any], version: Optional[str]):
+        self.version = version
+        self.built_at = time.monotonic()
         
+        groups = cached_groups.get("groups", [])
+        teams = cached_teams.get("teams", [])
+        
+        self.group_id_by_name: Dict[str, int] = {}
+        children: Dict[int, List[int]] = {}
         for group in groups:
-            if group.get("parent_id") == parent_id:
-                child_id = group.get("id")
-                if child_id:
-                    descendant_ids.add(child_id)
-                    find_children(child_id)
+            group_id = group.get("id")
+            if group_id is None:
+                continue
+            self.group_id_by_name[group.get("name")] = group_id
+            children.setdefault(group.get("parent_id"), []).append(group_id)
+        
+        # Direct team membership per group
+        direct: Dict[int, Set[str]] = {}
+        self.team_names: FrozenSet[str] = frozenset(t.get("team_name") for t in teams if t.get("team_name"))
+        for team in teams:
+            for group_id in team.get("group_keys", []):
+                direct.setdefault(group_id, set()).add(team.get("team_name"))
+        self.direct_teams: Dict[int, Tuple[str, ...]] = {
+            group_id: tuple(sorted(direct.get(group_id, ()))) for group_id in self.group_id_by_name.values()
+        }
+        
+        # Descendant closure (including self) and the recursive team list per group
+        self.descendants: Dict[int, FrozenSet[int]] = {}
+        self.recursive_teams: Dict[int, Tuple[str, ...]] = {}
+        for group_id in self.group_id_by_name.values():
+            closure = {group_id}
+            stack = [group_id]
+            while stack:
+                for child_id in children.get(stack.pop(), []):
+                    if child_id not in closure:  # Guards against circular parent references
+                        closure.add(child_id)
+                        stack.append(child_id)
+            self.descendants[group_id] = frozenset(closure)
+            names: Set[str] = set()
+            for descendant_id in closure:
+                names.update(direct.get(descendant_id, ()))
+            self.recursive_teams[group_id] = tuple(sorted(names))
+    
+    def has_group(self, group_name: str) -> bool:
+        return group_name in self.group_id_by_name
+    
+    def has_team(self, team_name: str) -> bool:
+        return team_name in self.team_names
+    
+    def teams_for_group(self, group_name: str, include_children: bool = True) -> Optional[List[str]]:
+        """
+        Sorted team names of a group, or None if the group is not in the index.
+        """
+        group_id = self.group_id_by_name.get(group_name)
+        if group_id is None:
+            return None
+        teams = self.recursive_teams if include_children else self.direct_teams
+        return list(teams[group_id])
+
+
+_group_team_index: Optional[GroupTeamIndex] = None
+_group_team_index_lock = threading.Lock()
+
+
+def get_group_team_index() -> Optional[GroupTeamIndex]:
+    """
+    Get this worker's group/team index, rebuilding it if the cache version changed.
     
-    find_children(group_id)
+    Costs one small Redis GET per call while the index is current. The index is also
+    rebuilt once it is older than CACHE_TTL_GROUPS_TEAMS, so it never outlives the
+    cached payload it was built from.
     
-    # Step 2: Get all teams that belong to any descendant group
-    team_names = set()
-    for team in teams:
-        team_group_keys = team.get("group_keys", [])
-        if any(gid in descendant_ids for gid in team_group_keys):
-            team_names.add(team.get("team_name"))
+    Returns:
+        Current GroupTeamIndex, or None if Redis or the cached payload is unavailable
+        (callers fall back to the database)
+    """
+    global _group_team_index
     
-    return sorted(list(team_names))
+    # Read the version before the payload: a concurrent write then only causes an extra rebuild
+    version = get_groups_teams_version()
+    if version is None:
+        return None
+    
+    index = _group_team_index
+    if index is not None and index.version == version and time.monotonic() - index.built_at < config.CACHE_TTL_GROUPS_TEAMS:
+        return index
+    
+    with _group_team_index_lock:
+        index = _group_team_index
+        if index is not None and index.version == version and time.monotonic() - index.built_at < config.CACHE_TTL_GROUPS_TEAMS:
+            return index
+        
+        cached_groups = get_cached_groups()
+        cached_teams = get_cached_teams()
+        if not cached_groups or not cached_teams:
+            return None
+        
+        index = GroupTeamIndex(cached_groups, cached_teams, version)
+        _group_team_index = index
+        logger.info(
+            f"🔄 Rebuilt group/team index (version {version}): "
+            f"{len(index.group_id_by_name)} groups, {len(index.team_names)} teams"
+        )
+        return index
 
 
 def get_recursive_teams_for_group_from_cache(
@@ -451,29 +681,11 @@ def get_recursive_teams_for_group_from_cache(
     Returns:
         List of team names
     """
-    # Try cache first
-    cached_groups = get_cached_groups()
-    cached_teams = get_cached_teams()
-    
-    if cached_groups and cached_teams:
-        # Find group by name
-        groups = cached_groups.get("groups", [])
-        group_data = next((g for g in groups if g.get("name") == group_name), None)
-        
-        if group_data:
-            group_id = group_data.get("id")
-            
-            if include_children:
-                # Build recursive teams from cache
-                return _build_recursive_teams_from_cache(group_id, cached_groups, cached_teams)
-            else:
-                # Direct teams only - filter from cache
-                teams = cached_teams.get("teams", [])
-                team_names = [
-                    t.get("team_name") for t in teams
-                    if group_id in t.get("group_keys", [])
-                ]
-                return sorted(team_names)
+    index = get_group_team_index()
+    if index is not None:
+        team_names = index.teams_for_group(group_name, include_children)
+        if team_names is not None:
+            return team_names
     
     # Fallback to DB
     return load_teams_for_group_from_db(group_name, conn, include_children)
@@ -0,0 +1,259 @@
+"""
+Shared HTTP clients - app-lifetime pooled httpx clients for outbound service calls.
+
+One AsyncClient per upstream service (LLM service, SparksAI-SQL service) is created
+at startup and reused for every call, so chat turns and agent jobs reuse keep-alive
+connections instead of paying a new TCP/TLS handshake each time.
+Per-endpoint timeouts and retry budgets live in ENDPOINTS below.
+
+LLM service endpoints also have a concurrency cap: calls to them first take a slot from
+the service's LLM gateway (llm_gateway.py), which queues or rejects excess calls.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+
+import httpx
+
+import config
+from llm_gateway import (
+    PRIORITY_INTERACTIVE,
+    LLMGateway,
+    LLMGatewayLease,
+    get_llm_gateway,
+    register_llm_gateway,
+)
+
+logger = logging.getLogger(__name__)
+
+# Service names
+LLM_SERVICE = "llm"
+SQL_SERVICE = "sql"
+
+# Per-endpoint settings: which service, path, timeout (seconds) and retry budget.
+# Retries only cover failures to connect (connect errors and connect timeouts) - a request
+# that may have reached the upstream is never re-sent.
+# max_concurrency caps the endpoint's calls in flight through the LLM gateway.
+ENDPOINTS: Dict[str, Dict[str, Any]] = {
+    "llm_chat": {"service": LLM_SERVICE, "path": "/chat", "timeout": 60.0, "retries": 2,
+                 "max_concurrency": config.LLM_GATEWAY_CHAT_MAX_CONCURRENCY},
+    "llm_chat_stream": {"service": LLM_SERVICE, "path": "/chat/stream", "timeout": 60.0, "retries": 0,
+                        "max_concurrency": config.LLM_GATEWAY_CHAT_MAX_CONCURRENCY},
+    "llm_process_single": {"service": LLM_SERVICE, "path": "/processSingle", "timeout": 120.0, "retries": 2,
+                           "max_concurrency": config.LLM_GATEWAY_PROCESS_SINGLE_MAX_CONCURRENCY},
+    "sql_execute": {"service": SQL_SERVICE, "path": "/sql/execute", "timeout": 120.0, "retries": 2},
+}
+
+# Exceptions that mean the request never reached the upstream and is safe to retry.
+# RemoteProtocolError is left out: it is also raised when the server drops the connection
+# after the request was sent, and /chat, /processSingle and /sql/execute are not idempotent.
+_RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+_RETRY_BACKOFF_SECONDS = 0.2
+
+# Registry of shared clients (service name -> AsyncClient)
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional 'h2' package (installed via httpx[http2])."""
+    return config.HTTP_CLIENT_HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+
+
+def _service_base_url(service: str) -> str:
+    if service == LLM_SERVICE:
+        return config.LLM_SERVICE_URL
+    if service == SQL_SERVICE:
+        return config.LLM_SQL_SERVICE_URL
+    raise KeyError(f"Unknown HTTP service '{service}'")
+
+
+def _create_client(service: str) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=config.HTTP_CLIENT_MAX_CONNECTIONS,
+        max_keepalive_connections=config.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=config.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+    )
+    http2 = _http2_available()
+    client = httpx.AsyncClient(
+        base_url=_service_base_url(service),
+        limits=limits,
+        http2=http2,
+        timeout=httpx.Timeout(60.0, connect=config.HTTP_CLIENT_CONNECT_TIMEOUT),
+    )
+    logger.info(
+        f"🌐 HTTP client created for '{service}' service "
+        f"(max_connections={config.HTTP_CLIENT_MAX_CONNECTIONS}, "
+        f"max_keepalive={config.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS}, http2={http2})"
+    )
+    return client
+
+
+def init_http_clients() -> None:
+    """Create the shared clients (called at startup)."""
+    for service in (LLM_SERVICE, SQL_SERVICE):
+        if service not in _clients or _clients[service].is_closed:
+            _clients[service] = _create_client(service)
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients and their pooled connections (called on shutdown)."""
+    for service, client in list(_clients.items()):
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing HTTP client for '{service}': {e}")
+    _clients.clear()
+    logger.info("🔌 HTTP clients closed")
+
+
+def get_http_client(service: str) -> httpx.AsyncClient:
+    """
+    Get the shared client for a service.
+    Creates it lazily if startup did not (e.g. when called outside the app lifecycle).
+    """
+    client = _clients.get(service)
+    if client is None or client.is_closed:
+        client = _create_client(service)
+        _clients[service] = client
+    return client
+
+
+def get_http_clients() -> Dict[str, httpx.AsyncClient]:
+    """
+    FastAPI dependency returning the shared client registry.
+    """
+    init_http_clients()
+    return _clients
+
+
+def _endpoint_gateway(endpoint: str) -> Optional[LLMGateway]:
+    """The gateway guarding an endpoint (created on first use), or None if it is not capped."""
+    settings = ENDPOINTS[endpoint]
+    if not config.LLM_GATEWAY_ENABLED or "max_concurrency" not in settings:
+        return None
+    service = settings["service"]
+    gateway = get_llm_gateway(service)
+    if gateway is None:
+        gateway = register_llm_gateway(LLMGateway(
+            name=service,
+            max_concurrency=config.LLM_GATEWAY_MAX_CONCURRENCY,
+            endpoint_limits={
+                name: endpoint_settings["max_concurrency"]
+                for name, endpoint_settings in ENDPOINTS.items()
+                if endpoint_settings["service"] == service and "max_concurrency" in endpoint_settings
+            },
+            max_queue=config.LLM_GATEWAY_MAX_QUEUE,
+            max_wait_seconds=config.LLM_GATEWAY_MAX_WAIT_SECONDS,
+        ))
+    return gateway
+
+
+async def acquire_endpoint_slot(endpoint: str, priority: int = PRIORITY_INTERACTIVE) -> Optional[LLMGatewayLease]:
+    """
+    Take a gateway slot for one call to endpoint (waits in the gateway queue if needed).
+
+    Returns:
+        Lease to release() after the call, or None if the endpoint is not capped
+
+    Raises:
+        HTTPException(429/503) with Retry-After when the gateway is saturated
+    """
+    gateway = _endpoint_gateway(endpoint)
+    if gateway is None:
+        return None
+    return await gateway.acquire(endpoint, priority)
+
+
+async def post_to_endpoint(
+    endpoint: str,
+    json: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+    priority: int = PRIORITY_INTERACTIVE
+) -> httpx.Response:
+    """
+    POST to a configured endpoint using the shared pooled client.
+
+    Capped endpoints first take a slot from the LLM gateway.
+    Connection-level failures are retried up to the endpoint's retry budget.
+    HTTP status errors are left to the caller (call response.raise_for_status()).
+
+    Args:
+        endpoint: Key in ENDPOINTS (e.g. "llm_chat")
+        json: JSON body
+        timeout: Optional override of the endpoint timeout (seconds)
+        priority: Gateway queue priority (llm_gateway.PRIORITY_INTERACTIVE / PRIORITY_BACKGROUND)
+
+    Returns:
+        httpx.Response
+
+    Raises:
+        HTTPException(429/503) with Retry-After when the gateway is saturated
+    """
+    settings = ENDPOINTS[endpoint]
+    client = get_http_client(settings["service"])
+    request_timeout = timeout if timeout is not None else settings["timeout"]
+    retries = settings.get("retries", 0)
+
+    lease = await acquire_endpoint_slot(endpoint, priority)
+    try:
+        attempt = 0
+        while True:
+            try:
+                return await client.post(
+                    settings["path"],
+                    json=json,
+                    timeout=httpx.Timeout(request_timeout, connect=config.HTTP_CLIENT_CONNECT_TIMEOUT),
+                )
+            except _RETRYABLE_ERRORS as e:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                logger.warning(f"Connection error calling '{endpoint}' ({type(e).__name__}: {e}), retry {attempt}/{retries}")
+                await asyncio.sleep(_RETRY_BACKOFF_SECONDS * attempt)
+    finally:
+        if lease:
+            lease.release()
+
+
+@asynccontextmanager
+async def stream_from_endpoint(
+    endpoint: str,
+    json: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+    priority: int = PRIORITY_INTERACTIVE,
+    lease: Optional[LLMGatewayLease] = None
+):
+    """
+    Open a streaming POST to a configured endpoint using the shared pooled client.
+
+    The timeout applies between received chunks (httpx read timeout), not to the
+    whole stream. Streams are not retried. The gateway slot is held until the stream
+    closes; pass a lease taken earlier with acquire_endpoint_slot() (e.g. before a
+    StreamingResponse starts, so saturation can still be answered with 429/503) and
+    it is released here.
+
+    Usage:
+        async with stream_from_endpoint("llm_chat_stream", json=payload) as response:
+            async for line in response.aiter_lines():
+                ...
+    """
+    settings = ENDPOINTS[endpoint]
+    client = get_http_client(settings["service"])
+    request_timeout = timeout if timeout is not None else settings["timeout"]
+
+    if lease is None:
+        lease = await acquire_endpoint_slot(endpoint, priority)
+    try:
+        async with client.stream(
+            "POST",
+            settings["path"],
+            json=json,
+            timeout=httpx.Timeout(request_timeout, connect=config.HTTP_CLIENT_CONNECT_TIMEOUT),
+        ) as response:
+            yield response
+    finally:
+        if lease:
+            lease.release()
@@ -6,14 +6,33 @@ Uses FastAPI dependencies for clean connection management and SQL injection prot
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy import text
-from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta, date
+import json
 import logging
 import re
-from database_connection import get_db_connection
+from database_connection import get_async_db_connection, async_db_connection, run_sync_db
 from database_reports import MIN_CYCLE_TIME_DAYS
+from pagination import (
+    FORMAT_JSON,
+    FORMAT_NDJSON,
+    NDJSON_MEDIA_TYPE,
+    decode_cursor,
+    ndjson_response,
+    split_page,
+    validate_response_format,
+)
+from database_issue_history import (
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMAT_NDJSON,
+    EXPORT_FORMATS,
+    build_issue_history_export_query,
+    stream_issue_history_csv,
+    stream_issue_history_ndjson,
+)
 import config
 
 logger = logging.getLogger(__name__)
@@ -36,6 +55,19 @@ def validate_limit(limit: int) -> int:
     
     return limit
 
+
+def _issue_row_to_dict(row) -> Dict[str, Any]:
+    return {
+        "issue_key": row[0],
+        "issue_type": row[1],
+        "summary": row[2],
+        "description": row[3],
+        "status_category": row[4],
+        "flagged": row[5],
+        "dependency": row[6],
+        "parent_key": row[7]
+    }
+
 @issues_router.get("/issues")
 async def get_issues(
     issue_type: Optional[str] = Query(None, description="Filter by issue type"),
@@ -45,12 +77,16 @@ async def get_issues(
     pi: Optional[str] = Query(None, description="Filter by PI (quarter_pi)"),
     sprint_id: Optional[int] = Query(None, description="Filter by sprint ID (matches any sprint_ids array element)"),
     limit: int = Query(200, description="Number of issues to return (default: 200, max: 1000)"),
-    conn: Connection = Depends(get_db_connection)
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    response_format: str = Query(FORMAT_JSON, alias="format", description="json (paged) or ndjson (stream all matching issues)"),
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get a collection of issues with optional filtering.
     
     Returns issues with fields: issue_key, issue_type, summary, description, status_category, flagged, dependency, parent_key.
+    Pages are keyset-paginated: pass data.next_cursor as cursor to get the next page (null on the last page).
+    With format=ndjson all matching issues are streamed, one JSON object per line (limit is ignored).
     
     Args:
         issue_type: Optional filter by issue type
@@ -60,24 +96,37 @@ async def get_issues(
         pi: Optional filter by PI (quarter_pi)
         sprint_id: Optional filter by sprint ID (checks if sprint_id is in sprint_ids array)
         limit: Number of issues to return (default: 200, max: 1000)
+        cursor: Opaque cursor from the previous page's next_cursor
+        response_format: "json" or "ndjson"
     
     Returns:
-        JSON response with issues list and metadata
+        JSON response with issues list and metadata, or an NDJSON stream
     """
     try:
         from database_team_metrics import resolve_team_names_from_filter
         
-        # Validate limit
+        # Validate limit, format and cursor (a cursor is only valid with the filters it was issued for)
         validated_limit = validate_limit(limit)
+        validate_response_format(response_format)
+        cursor_filters = {
+            "issue_type": issue_type,
+            "status_category": status_category,
+            "team_name": team_name,
+            "isGroup": isGroup,
+            "pi": pi,
+            "sprint_id": sprint_id,
+        }
+        cursor_issue_id = decode_cursor(cursor, cursor_filters)
         
         # Resolve team names if team_name is provided (handles group to teams translation)
         team_names_list = None
         if team_name:
-            team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+            team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Build WHERE clause conditions based on provided filters
         where_conditions = []
-        params = {"limit": validated_limit}
+        # One extra row tells whether there is a next page
+        params = {"limit": validated_limit + 1}
         
         if issue_type:
             where_conditions.append("issue_type = :issue_type")
@@ -102,8 +151,14 @@ async def get_issues(
             where_conditions.append(":sprint_id = ANY(sprint_ids)")
             params["sprint_id"] = sprint_id
         
+        # Keyset pagination: continue after the last issue of the previous page
+        if cursor_issue_id is not None:
+            where_conditions.append("issue_id < :cursor_issue_id")
+            params["cursor_issue_id"] = cursor_issue_id
+        
         # Build SQL query
         where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+        limit_clause = "" if response_format == FORMAT_NDJSON else "LIMIT :limit"
         
         query = text(f"""
             SELECT 
@@ -114,41 +169,34 @@ async def get_issues(
                 status_category,
                 flagged,
                 dependency,
-                parent_key
+                parent_key,
+                issue_id
             FROM {config.WORK_ITEMS_TABLE}
             WHERE {where_clause}
             ORDER BY issue_id DESC
-            LIMIT :limit
+            {limit_clause}
         """)
         
         logger.info(f"Executing query to get issues with filters: issue_type={issue_type}, status_category={status_category}, team_name={team_name}, isGroup={isGroup}, pi={pi}, sprint_id={sprint_id}, limit={validated_limit}")
         if team_names_list:
             logger.info(f"Resolved team names: {team_names_list}")
         
-        result = conn.execute(query, params)
-        rows = result.fetchall()
+        if response_format == FORMAT_NDJSON:
+            return ndjson_response(query, params, _issue_row_to_dict)
+        
+        result = await conn.execute(query, params)
+        rows, next_cursor = split_page(result.fetchall(), validated_limit, 8, cursor_filters)
         
         # Convert rows to list of dictionaries
-        issues = []
-        for row in rows:
-            issue_dict = {
-                "issue_key": row[0],
-                "issue_type": row[1],
-                "summary": row[2],
-                "description": row[3],
-                "status_category": row[4],
-                "flagged": row[5],
-                "dependency": row[6],
-                "parent_key": row[7]
-            }
-            issues.append(issue_dict)
+        issues = [_issue_row_to_dict(row) for row in rows]
         
         return {
             "success": True,
             "data": {
                 "issues": issues,
                 "count": len(issues),
-                "limit": validated_limit
+                "limit": validated_limit,
+                "next_cursor": next_cursor
             },
             "message": f"Retrieved {len(issues)} issues"
         }
@@ -169,7 +217,7 @@ async def get_epics_hierarchy(
     pi: Optional[str] = Query(None, description="Filter by PI (quarter_pi_of_epic)"),
     team_name: Optional[str] = Query(None, description="Filter by team name (team_name_of_epic)"),
     limit: int = Query(500, description="Number of records to return (default: 500, max: 1000)"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get epic hierarchy data from epic_hierarchy_with_progress view.
@@ -212,7 +260,7 @@ async def get_epics_hierarchy(
         
         logger.info(f"Executing query to get epic hierarchy: pi={pi}, team_name={team_name}, limit={validated_limit}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -247,7 +295,7 @@ async def get_issue_status_duration(
     issue_type: Optional[str] = Query(None, description="Filter by issue type"),
     team_name: Optional[str] = Query(None, description="Filter by team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get average duration by status name from issue_status_durations table.
@@ -275,7 +323,7 @@ async def get_issue_status_duration(
             )
         
         # Resolve team names using shared helper function
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Calculate start date based on months parameter
         start_date = datetime.now().date() - timedelta(days=months * 30)
@@ -327,7 +375,7 @@ async def get_issue_status_duration(
         logger.info(f"Executing query to get issue status duration: months={months}, issue_type={issue_type}, team_name={team_name}")
         logger.info(f"Parameters: start_date={start_date}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -367,7 +415,7 @@ async def get_issue_status_duration_with_issue_keys(
     issue_type: Optional[str] = Query(None, description="Filter by issue type"),
     team_name: Optional[str] = Query(None, description="Filter by team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get issue keys, summaries, and durations for a specific status from issue_status_durations table.
@@ -486,7 +534,7 @@ async def get_issue_status_duration_with_issue_keys(
             logger.info(f"Filtering by months: {months}, start_date: {start_date}")
         
         # Resolve team names using shared helper function
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Add optional filters
         if issue_type:
@@ -523,7 +571,7 @@ async def get_issue_status_duration_with_issue_keys(
         else:
             logger.info(f"Executing query to get issue status duration with issue keys: status_name={status_name}, months={months}, issue_type={issue_type}, team_name={team_name}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -575,7 +623,7 @@ async def get_issue_status_duration_per_month(
     months: int = Query(3, description="Number of months to look back (1, 2, 3, 4, 6, 9, 12)", ge=1, le=12),
     team_name: Optional[str] = Query(None, description="Filter by team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get average duration per month by status name from issue_status_durations table.
@@ -631,7 +679,7 @@ async def get_issue_status_duration_per_month(
         }
         
         # Resolve team names using shared helper function
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Add optional team filter
         if team_names_list:
@@ -671,7 +719,7 @@ async def get_issue_status_duration_per_month(
         logger.info(f"Executing query to get issue status duration per month: months={months}, team_name={team_name}")
         logger.info(f"Parameters: start_date={start_date}, end_date={end_date}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
         
         # Process results: group by status_name and create month-to-value mapping
@@ -740,7 +788,7 @@ async def get_issue_status_duration_per_month(
 @issues_router.get("/issues/release-predictability")
 async def get_release_predictability(
     months: int = Query(3, description="Number of months to look back", ge=1, le=12),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get release predictability analysis from the release_predictability_analysis table.
@@ -778,7 +826,7 @@ async def get_release_predictability(
         
         logger.info(f"Executing query to get release predictability: months={months}")
         
-        result = conn.execute(query, {"start_date": start_date.strftime("%Y-%m-%d")})
+        result = await conn.execute(query, {"start_date": start_date.strftime("%Y-%m-%d")})
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -820,7 +868,7 @@ async def get_issues_grouped_by_priority(
     team_name: Optional[str] = Query(None, description="Filter by team name or group name (if isGroup=true)"),
     status_category: Optional[str] = Query(None, description="Filter by status category"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get issues grouped by priority from the jira_issues table.
@@ -851,7 +899,7 @@ async def get_issues_grouped_by_priority(
         # Resolve team names using shared helper function (same pattern as other endpoints)
         team_names_list = None
         if team_name:
-            team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+            team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
             if team_names_list:
                 # Build parameterized IN clause (same pattern as closed sprints)
                 placeholders = ", ".join([f":team_name_{i}" for i in range(len(team_names_list))])
@@ -883,7 +931,7 @@ async def get_issues_grouped_by_priority(
         
         logger.info(f"Executing query to get issues grouped by priority: issue_type={issue_type}, team_name={team_name}, isGroup={isGroup}, status_category={status_category}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -934,7 +982,7 @@ async def get_issues_grouped_by_priority(
 async def get_issues_grouped_by_team(
     issue_type: Optional[str] = Query(None, description="Filter by issue type"),
     status_category: Optional[str] = Query(None, description="Filter by status category"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get issues grouped by team with priority breakdown from the jira_issues table.
@@ -982,7 +1030,7 @@ async def get_issues_grouped_by_team(
         
         logger.info(f"Executing query to get issues grouped by team: issue_type={issue_type}, status_category={status_category}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
         
         # Group by team_name into nested structure
@@ -1035,7 +1083,7 @@ async def get_epic_inbound_dependency_load_by_quarter(
     pi: Optional[str] = Query(None, description="Filter by PI (quarter_pi_of_epic)"),
     team_name: Optional[str] = Query(None, description="Filter by team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get epic inbound dependency load data from epic_inbound_dependency_load_by_quarter view.
@@ -1055,10 +1103,10 @@ async def get_epic_inbound_dependency_load_by_quarter(
         from database_pi import fetch_epic_inbound_dependency_data
         
         # Resolve team names FIRST (before building WHERE clause)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Call shared function to fetch data
-        records = fetch_epic_inbound_dependency_data(pi, team_names_list, conn)
+        records = await run_sync_db(conn, fetch_epic_inbound_dependency_data, pi, team_names_list)
         
         # Calculate average number of dependencies per team
         # Count unique teams in the response
@@ -1119,7 +1167,7 @@ async def get_epic_outbound_dependency_metrics_by_quarter(
     pi: Optional[str] = Query(None, description="Filter by PI (quarter_pi_of_epic)"),
     team_name: Optional[str] = Query(None, description="Filter by team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get epic outbound dependency metrics data from epic_outbound_dependency_metrics_by_quarter view.
@@ -1139,10 +1187,10 @@ async def get_epic_outbound_dependency_metrics_by_quarter(
         from database_pi import fetch_epic_outbound_dependency_data
         
         # Resolve team names FIRST (before building WHERE clause)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Call shared function to fetch data
-        records = fetch_epic_outbound_dependency_data(pi, team_names_list, conn)
+        records = await run_sync_db(conn, fetch_epic_outbound_dependency_data, pi, team_names_list)
         
         # Calculate average number of dependencies per team
         # Count unique teams in the response
@@ -1203,7 +1251,7 @@ async def get_epics_by_pi(
     pi: str = Query(..., description="PI name (quarter_pi) to filter epics"),
     team_name: Optional[str] = Query(None, description="Team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get comprehensive information about EPICs in a specific PI.
@@ -1223,7 +1271,7 @@ async def get_epics_by_pi(
         from database_team_metrics import resolve_team_names_from_filter
         
         # Resolve team names (handles group to teams translation)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Step 1: Get all epics for the PI
         where_conditions = [
@@ -1256,7 +1304,7 @@ async def get_epics_by_pi(
         
         logger.info(f"Executing query to get epics for PI: {pi}, team_name={team_name}, isGroup={isGroup}")
         
-        result1 = conn.execute(query1, params)
+        result1 = await conn.execute(query1, params)
         epic_rows = result1.fetchall()
         
         if not epic_rows:
@@ -1321,7 +1369,7 @@ async def get_epics_by_pi(
                 ORDER BY h1.snapshot_date
             """)
             
-            result2 = conn.execute(query2, params2)
+            result2 = await conn.execute(query2, params2)
             in_progress_rows = result2.fetchall()
             
             # Store in-progress dates
@@ -1366,7 +1414,7 @@ async def get_epics_by_pi(
                         GROUP BY h.parent_key
                     """)
                 
-                result3 = conn.execute(query3, params3)
+                result3 = await conn.execute(query3, params3)
                 baseline_rows = result3.fetchall()
                 
                 for row in baseline_rows:
@@ -1393,7 +1441,7 @@ async def get_epics_by_pi(
                 ORDER BY parent_key, team_name
             """)
             
-            result4a = conn.execute(query4a, params4)
+            result4a = await conn.execute(query4a, params4)
             team_breakdown_rows = result4a.fetchall()
             
             # Total issue counts (all issues, not just stories)
@@ -1407,7 +1455,7 @@ async def get_epics_by_pi(
                 GROUP BY parent_key
             """)
             
-            result4b = conn.execute(query4b, params4)
+            result4b = await conn.execute(query4b, params4)
             story_count_rows = result4b.fetchall()
             
             # Process team breakdown
@@ -1460,7 +1508,7 @@ async def get_epics_by_pi(
                 GROUP BY parent_key
             """)
             
-            result5 = conn.execute(query5, params4)
+            result5 = await conn.execute(query5, params4)
             dependency_rows = result5.fetchall()
             
             for row in dependency_rows:
@@ -1496,7 +1544,7 @@ async def get_epics_by_pi(
 async def get_active_epic_dependencies(
     team_name: Optional[str] = Query(None, description="Team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get active epic dependencies for a team or group.
@@ -1516,7 +1564,7 @@ async def get_active_epic_dependencies(
         from database_team_metrics import resolve_team_names_from_filter
         
         # Resolve team names (handles group to teams translation)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching active epic dependencies")
         logger.info(f"Parameters: team_name={team_name}, isGroup={isGroup}")
@@ -1548,7 +1596,7 @@ async def get_active_epic_dependencies(
             logger.info("Executing SQL for active epic dependencies for all teams")
         
         # Execute query with parameters (SECURE: prevents SQL injection)
-        result = conn.execute(sql_query_text, params)
+        result = await conn.execute(sql_query_text, params)
         
         # Convert rows to list of dictionaries - return all columns as-is
         dependencies = []
@@ -1598,7 +1646,7 @@ async def get_active_epic_dependencies(
 async def get_active_sprint_stories_by_epic(
     team_name: Optional[str] = Query(None, description="Team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get active sprint stories by epic for a team or group.
@@ -1617,7 +1665,7 @@ async def get_active_sprint_stories_by_epic(
         from database_team_metrics import resolve_team_names_from_filter
         
         # Resolve team names (handles group to teams translation)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching active sprint stories by epic")
         logger.info(f"Parameters: team_name={team_name}, isGroup={isGroup}")
@@ -1649,7 +1697,7 @@ async def get_active_sprint_stories_by_epic(
             logger.info("Executing SQL for active sprint stories by epic for all teams")
         
         # Execute query with parameters (SECURE: prevents SQL injection)
-        result = conn.execute(sql_query_text, params)
+        result = await conn.execute(sql_query_text, params)
         
         # Convert rows to list of dictionaries - return all columns as-is
         stories = []
@@ -1697,7 +1745,7 @@ async def get_active_sprint_stories_by_epic(
 
 @issues_router.get("/issues/issue-types")
 async def get_issue_types(
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get all issue types from the issue_types table.
@@ -1723,7 +1771,7 @@ async def get_issue_types(
         
         logger.info("Executing query to get issue types")
         
-        result = conn.execute(query)
+        result = await conn.execute(query)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -1758,7 +1806,7 @@ async def get_issue_types(
 
 @issues_router.get("/issues/issue-types-hierarchy")
 async def get_issue_types_hierarchy(
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get all issue types grouped by hierarchy level.
@@ -1783,7 +1831,7 @@ async def get_issue_types_hierarchy(
         
         logger.info("Executing query to get issue types grouped by hierarchy")
         
-        result = conn.execute(query)
+        result = await conn.execute(query)
         rows = result.fetchall()
         
         # Group issue types by hierarchy level
@@ -1859,7 +1907,7 @@ async def get_cycle_time_with_issue_keys(
     team_name: Optional[str] = Query(None, description="Team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     issue_type: Optional[str] = Query(None, description="Filter by issue type(s) - can be single value, comma-separated, or multiple params (e.g., 'Story,Bug' or ?issue_type=Story&issue_type=Bug)"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get issues with cycle time for a specific period.
@@ -1915,7 +1963,7 @@ async def get_cycle_time_with_issue_keys(
             issue_type_values = _normalize_multi_value_issue_type(issue_type)
         
         # Resolve team names using shared helper function
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Build WHERE clause conditions
         where_conditions = [
@@ -1965,7 +2013,7 @@ async def get_cycle_time_with_issue_keys(
         
         logger.info(f"Executing query to get cycle time with issue keys: period_start={period_start}, period_end={period_end}, team_name={team_name}, isGroup={isGroup}, issue_type={issue_type_values}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -2010,7 +2058,7 @@ async def get_history_info(
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     issue_type: Optional[str] = Query(None, description="Filter by issue type (e.g., 'Story', 'Bug', 'Epic')"),
     metric_type: str = Query(..., description="Metric type: 'issues_completed', 'issues_removed', 'total_scope', 'wip_in_progress', or 'actual_remaining'"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get history info for issues on a specific date in a sprint.
@@ -2055,20 +2103,21 @@ async def get_history_info(
         
         # Resolve team names using shared helper function
         # Returns None if no team_name provided (meaning all teams)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching history info: date={date}, sprint_id={sprint_id}, team_name={team_name}, isGroup={isGroup}, issue_type={issue_type}, metric_type={metric_type}")
         if team_names_list:
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Call database helper function
-        issues = get_sprint_history_issues_db(
+        issues = await run_sync_db(
+            conn,
+            get_sprint_history_issues_db,
             sprint_id=sprint_id,
             target_date=target_date,
             team_names=team_names_list,
             issue_type=issue_type,
-            metric_type=metric_type,
-            conn=conn
+            metric_type=metric_type
         )
         
         # Build response
@@ -2117,7 +2166,7 @@ async def get_pi_history_info(
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     issue_type: Optional[str] = Query(None, description="Filter by issue type (e.g., 'Story', 'Bug', 'Epic')"),
     metric_type: str = Query(..., description="Metric type: 'issues_completed', 'issues_removed', 'total_scope', 'wip_in_progress', or 'actual_remaining'"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get history info for issues on a specific date in a PI.
@@ -2163,20 +2212,21 @@ async def get_pi_history_info(
         
         # Resolve team names using shared helper function
         # Returns None if no team_name provided (meaning all teams)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching PI history info: date={date}, pi={pi}, team_name={team_name}, isGroup={isGroup}, issue_type={issue_type}, metric_type={metric_type}")
         if team_names_list:
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Call database helper function
-        issues = get_pi_history_issues_db(
+        issues = await run_sync_db(
+            conn,
+            get_pi_history_issues_db,
             pi_name=pi,
             target_date=target_date,
             team_names=team_names_list,
             issue_type=issue_type,
-            metric_type=metric_type,
-            conn=conn
+            metric_type=metric_type
         )
         
         # Build response
@@ -2217,10 +2267,99 @@ async def get_pi_history_info(
         )
 
 
+@issues_router.get("/issues/history-export")
+async def export_issue_history(
+    start_date: str = Query(..., description="First snapshot date (YYYY-MM-DD, inclusive)"),
+    end_date: str = Query(..., description="Last snapshot date (YYYY-MM-DD, inclusive)"),
+    team_name: Optional[str] = Query(None, description="Team name or group name (if isGroup=true)"),
+    isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
+    sprint_id: Optional[int] = Query(None, description="Only snapshots where the issue was in this sprint"),
+    pi: Optional[str] = Query(None, description="Only snapshots in this PI (quarter_pi)"),
+    issue_type: Optional[str] = Query(None, description="Filter by issue type (e.g., 'Story', 'Bug', 'Epic')"),
+    response_format: str = Query(EXPORT_FORMAT_NDJSON, alias="format", description="ndjson (default) or csv"),
+    conn: AsyncConnection = Depends(get_async_db_connection)
+):
+    """
+    Export a slice of jira_issue_history (every snapshot row in the date range) as a stream.
+    
+    CSV is produced by Postgres COPY ... TO STDOUT; NDJSON is read from a server-side cursor.
+    Rows are streamed as they are produced, so large slices never sit in worker memory.
+    
+    Args:
+        start_date: First snapshot date (YYYY-MM-DD, inclusive)
+        end_date: Last snapshot date (YYYY-MM-DD, inclusive)
+        team_name: Optional team name or group name (if isGroup=true)
+        isGroup: If true, team_name is treated as a group name
+        sprint_id: Optional sprint ID filter
+        pi: Optional PI name filter
+        issue_type: Optional filter by issue type
+        response_format: "ndjson" or "csv"
+    
+    Returns:
+        Streaming NDJSON or CSV download, ordered by snapshot_date, issue_key
+    """
+    from database_team_metrics import resolve_team_names_from_filter
+    
+    if response_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Invalid format. Must be one of: {', '.join(EXPORT_FORMATS)}")
+    
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid date format. Expected YYYY-MM-DD format. Error: {str(e)}"
+        )
+    if end < start:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+    if (end - start).days + 1 > config.ISSUE_HISTORY_EXPORT_MAX_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range too long (max {config.ISSUE_HISTORY_EXPORT_MAX_DAYS} days per export)"
+        )
+    
+    try:
+        team_names_list = None
+        if team_name:
+            team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
+    except Exception as e:
+        logger.error(f"Error resolving teams for issue history export: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to resolve teams: {str(e)}")
+    
+    sql, params = build_issue_history_export_query(
+        start, end, team_names=team_names_list, sprint_id=sprint_id, pi_name=pi, issue_type=issue_type
+    )
+    logger.info(f"Exporting issue history ({response_format}): {start_date}..{end_date}, team_name={team_name}, isGroup={isGroup}, sprint_id={sprint_id}, pi={pi}, issue_type={issue_type}")
+    
+    async def _export():
+        # The stream holds its own pooled connection (the request dependency is released before the body is sent)
+        try:
+            async with async_db_connection() as export_conn:
+                if response_format == EXPORT_FORMAT_CSV:
+                    chunks = stream_issue_history_csv(export_conn, sql, params)
+                else:
+                    chunks = stream_issue_history_ndjson(export_conn, sql, params)
+                async for chunk in chunks:
+                    yield chunk
+        except Exception as e:
+            logger.error(f"Issue history export failed: {e}")
+            if response_format == EXPORT_FORMAT_NDJSON:
+                yield (json.dumps({"error": f"Export failed: {str(e)}"}) + "\n").encode()
+    
+    filename = f"issue_history_{start.isoformat()}_{end.isoformat()}.{response_format}"
+    media_type = "text/csv" if response_format == EXPORT_FORMAT_CSV else NDJSON_MEDIA_TYPE
+    return StreamingResponse(
+        _export(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @issues_router.get("/issues/{issue_id}")
 async def get_issue(
     issue_id: str,
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get a single issue by ID.
@@ -2243,7 +2382,7 @@ async def get_issue(
         
         logger.info(f"Executing query to get issue with ID: {issue_id}")
         
-        result = conn.execute(query, {"issue_id": issue_id})
+        result = await conn.execute(query, {"issue_id": issue_id})
         row = result.fetchone()
         
         if not row:
@@ -2281,7 +2420,7 @@ async def get_cycle_time_with_issue_keys(
     team_name: Optional[str] = Query(None, description="Team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     issue_type: Optional[str] = Query(None, description="Filter by issue type(s) - can be single value, comma-separated, or multiple params (e.g., 'Story,Bug' or ?issue_type=Story&issue_type=Bug)"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get issues with cycle time for a specific period.
@@ -2337,7 +2476,7 @@ async def get_cycle_time_with_issue_keys(
             issue_type_values = _normalize_multi_value_issue_type(issue_type)
         
         # Resolve team names using shared helper function
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Build WHERE clause conditions
         where_conditions = [
@@ -2387,7 +2526,7 @@ async def get_cycle_time_with_issue_keys(
         
         logger.info(f"Executing query to get cycle time with issue keys: period_start={period_start}, period_end={period_end}, team_name={team_name}, isGroup={isGroup}, issue_type={issue_type_values}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -0,0 +1,293 @@
+"""
+LLM Context Encoding - compact text encoding of report data for LLM prompts.
+
+Report results are sent to the LLM as text. Instead of indented JSON (which repeats every
+key on every row), row data is encoded as a table: one header line with the column names,
+then one "|"-separated line per row. Series longer than the row limit are sent as a
+per-column summary (numeric min/max/mean/first/last, date ranges, top categorical values)
+followed by a sample of the rows - picked with LTTB along the definition's downsample
+spec when it has one, evenly spaced otherwise - so the LLM still sees the whole range.
+
+Per-report settings live in the definition's meta_schema["llm_context"]:
+
+    {"exclude": true}     - never send this report to the LLM
+    {"max_rows": 50}      - row limit before a table is summarized (default LLM_CONTEXT_MAX_ROWS)
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import config
+
+logger = logging.getLogger(__name__)
+
+CELL_SEPARATOR = " | "
+TRUNCATED_CELL_MARKER = "..."
+
+
+def get_llm_context_spec(definition: Mapping[str, Any]) -> Dict[str, Any]:
+    """The definition's LLM context settings (meta_schema["llm_context"], plus legacy max_records_for_llm)."""
+    meta_schema = definition.get("meta_schema") or {}
+    spec = dict(meta_schema.get("llm_context") or {}) if isinstance(meta_schema, Mapping) else {}
+    if "max_rows" not in spec and definition.get("max_records_for_llm"):
+        spec["max_rows"] = definition["max_records_for_llm"]
+    return spec
+
+
+def is_excluded_from_llm(definition: Mapping[str, Any]) -> bool:
+    """True if the report definition opts out of LLM context."""
+    return bool(get_llm_context_spec(definition).get("exclude"))
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    return None
+
+
+def _is_iso_date(value: Any) -> bool:
+    """ISO date / datetime strings (cached report payloads carry dates as strings)."""
+    if not isinstance(value, str) or len(value) < 10:
+        return False
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return True
+    except ValueError:
+        return False
+
+
+def format_cell(value: Any) -> str:
+    """One value as compact single-line text."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (float, Decimal)):
+        number = float(value)
+        if number.is_integer():
+            return str(int(number))
+        return f"{number:.2f}".rstrip("0").rstrip(".")
+    if isinstance(value, (dict, list, tuple)):
+        text = json.dumps(value, separators=(",", ":"), default=str)
+    else:
+        text = str(value)
+    text = text.replace("\r", " ").replace("\n", " ").replace("|", "/")
+    max_chars = config.LLM_CONTEXT_MAX_CELL_CHARS
+    if len(text) > max_chars:
+        text = text[:max(max_chars - len(TRUNCATED_CELL_MARKER), 0)] + TRUNCATED_CELL_MARKER
+    return text
+
+
+def compact_json(value: Any) -> str:
+    """JSON without whitespace (for filters and other small objects)."""
+    return json.dumps(value, separators=(",", ":"), default=format_cell)
+
+
+def _columns(rows: Sequence[Mapping[str, Any]]) -> List[str]:
+    """Union of the row keys, in first-seen order."""
+    columns: Dict[str, None] = {}
+    for row in rows:
+        for key in row.keys():
+            columns.setdefault(key, None)
+    return list(columns)
+
+
+def _is_row_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+
+def _is_columnar(value: Any) -> bool:
+    return isinstance(value, dict) and isinstance(value.get("values"), dict) and "columns" in value
+
+
+def _columnar_to_rows(table: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    values = table["values"]
+    columns = list(table.get("columns") or values.keys())
+    column_values = [values.get(name) or [] for name in columns]
+    count = max((len(column) for column in column_values), default=0)
+    return [
+        {name: column[i] if i < len(column) else None for name, column in zip(columns, column_values)}
+        for i in range(count)
+    ]
+
+
+def summarize_column(name: str, values: Sequence[Any]) -> str:
+    """
+    One-line statistical summary of a column.
+
+    Numeric columns get count/min/max/mean/first/last, date columns their range, and
+    anything else its distinct count and most frequent values.
+    """
+    present = [value for value in values if value is not None and value != ""]
+    nulls = len(values) - len(present)
+    null_note = f", {nulls} empty" if nulls else ""
+    if not present:
+        return f"{name}: all empty"
+
+    numbers = [_number(value) for value in present]
+    if all(number is not None for number in numbers):
+        mean = sum(numbers) / len(numbers)
+        return (
+            f"{name}: n={len(numbers)}, min={format_cell(min(numbers))}, max={format_cell(max(numbers))}, "
+            f"mean={format_cell(mean)}, first={format_cell(numbers[0])}, last={format_cell(numbers[-1])}{null_note}"
+        )
+
+    if all(isinstance(value, (datetime, date)) or _is_iso_date(value) for value in present):
+        iso_values = [format_cell(value) for value in present]
+        return f"{name}: {min(iso_values)} to {max(iso_values)}{null_note}"
+
+    counts: Dict[str, int] = {}
+    for value in present:
+        cell = format_cell(value)
+        counts[cell] = counts.get(cell, 0) + 1
+    top = sorted(counts.items(), key=lambda item: -item[1])[:config.LLM_CONTEXT_TOP_VALUES]
+    top_text = ", ".join(f"{value} ({count})" for value, count in top)
+    return f"{name}: {len(counts)} distinct; top: {top_text}{null_note}"
+
+
+def _sample_indices(
+    rows: Sequence[Mapping[str, Any]],
+    max_rows: int,
+    downsample_spec: Optional[Mapping[str, Any]]
+) -> List[int]:
+    """Rows to show for a long table: LTTB along the downsample spec, else evenly spaced."""
+    count = len(rows)
+    if downsample_spec and downsample_spec.get("x") and not downsample_spec.get("group_by"):
+        try:
+            from report_downsampling import lttb_indices, series_x_values
+
+            x_all = series_x_values([row.get(downsample_spec["x"]) for row in rows])
+            order = sorted(range(count), key=x_all.__getitem__)
+            x = [x_all[i] for i in order]
+            ys = [[rows[i].get(y_name) for i in order] for y_name in downsample_spec.get("y") or []]
+            return sorted(order[position] for position in lttb_indices(x, ys, max_rows))
+        except Exception as e:
+            logger.warning(f"LTTB sampling failed for LLM context, using evenly spaced rows: {e}")
+    if max_rows <= 1:
+        return [0]
+    return sorted({round(i * (count - 1) / (max_rows - 1)) for i in range(max_rows)})
+
+
+def encode_rows(
+    rows: Sequence[Mapping[str, Any]],
+    max_rows: Optional[int] = None,
+    downsample_spec: Optional[Mapping[str, Any]] = None
+) -> str:
+    """
+    Encode row dicts as a header line plus one line per row.
+
+    Tables longer than max_rows are sent as a per-column summary plus a sample of max_rows rows.
+
+    Args:
+        rows: List of row dicts
+        max_rows: Row limit before summarizing (default LLM_CONTEXT_MAX_ROWS)
+        downsample_spec: The definition's meta_schema["downsample"], used to pick the sample
+
+    Returns:
+        Encoded table text
+    """
+    max_rows = max_rows or config.LLM_CONTEXT_MAX_ROWS
+    columns = _columns(rows)
+    lines: List[str] = []
+
+    shown = list(range(len(rows)))
+    if len(rows) > max_rows:
+        lines.append(f"{len(rows)} rows. Column summary:")
+        lines.extend(f"- {summarize_column(name, [row.get(name) for row in rows])}" for name in columns)
+        shown = _sample_indices(rows, max_rows, downsample_spec)
+        lines.append(f"Sample of {len(shown)} rows:")
+    else:
+        lines.append(f"{len(rows)} rows:")
+
+    lines.append(CELL_SEPARATOR.join(columns))
+    for index in shown:
+        row = rows[index]
+        lines.append(CELL_SEPARATOR.join(format_cell(row.get(name)) for name in columns))
+    return "\n".join(lines)
+
+
+def encode_value(
+    value: Any,
+    max_rows: Optional[int] = None,
+    downsample_spec: Optional[Mapping[str, Any]] = None,
+    path: str = ""
+) -> str:
+    """
+    Encode a report result (row list, {columns, values} table, or a dict of those) as compact text.
+
+    Args:
+        value: Report result
+        max_rows: Row limit per table before summarizing
+        downsample_spec: The definition's meta_schema["downsample"] (applied to the table at its path)
+        path: Key path of value within the result (for nested dicts)
+
+    Returns:
+        Encoded text
+    """
+    table_spec = downsample_spec if downsample_spec and (downsample_spec.get("path") or "") == path else None
+
+    if _is_columnar(value):
+        return encode_rows(_columnar_to_rows(value), max_rows, table_spec)
+    if _is_row_list(value):
+        return encode_rows(value, max_rows, table_spec)
+    if isinstance(value, list):
+        if not value:
+            return "(none)"
+        if len(value) > (max_rows or config.LLM_CONTEXT_MAX_ROWS):
+            return summarize_column("values", value)
+        return compact_json(value)
+    if not isinstance(value, dict):
+        return format_cell(value)
+
+    # Scalars as "key: value" lines, nested tables and objects under their own "key:" line
+    lines: List[str] = []
+    for key, item in value.items():
+        item_path = f"{path}.{key}" if path else str(key)
+        if _is_columnar(item) or _is_row_list(item) or (isinstance(item, dict) and item):
+            lines.append(f"{key}:")
+            lines.append(encode_value(item, max_rows, downsample_spec, item_path))
+        else:
+            lines.append(f"{key}: {encode_value(item, max_rows, downsample_spec, item_path)}")
+    return "\n".join(lines)
+
+
+def encode_report_for_llm(
+    report_name: str,
+    description: Optional[str],
+    filters: Mapping[str, Any],
+    result: Any,
+    definition: Mapping[str, Any]
+) -> str:
+    """
+    Format one report as an LLM context section.
+
+    Args:
+        report_name: Report display name
+        description: Report description (optional)
+        filters: Filters the report was resolved with
+        result: Report result data
+        definition: Report definition (for meta_schema llm_context / downsample)
+
+    Returns:
+        Section text starting with a "## <report name>" heading
+    """
+    spec = get_llm_context_spec(definition)
+    meta_schema = definition.get("meta_schema") or {}
+    downsample_spec = meta_schema.get("downsample") if isinstance(meta_schema, Mapping) else None
+
+    # Empty filters carry no information for the LLM
+    used_filters = {key: value for key, value in filters.items() if value not in (None, "", [], {})}
+
+    section = f"\n## {report_name}\n"
+    if description:
+        section += f"Description: {description}\n"
+    section += f"Filters: {compact_json(used_filters)}\n"
+    section += f"Data:\n{encode_value(result, spec.get('max_rows'), downsample_spec)}\n"
+    return section
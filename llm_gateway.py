@@ -0,0 +1,248 @@
+"""
+LLM Gateway - per-worker admission control for outbound LLM service calls.
+
+Every call to the LLM service takes a slot from its gateway first (see
+http_clients.acquire_endpoint_slot). Slots are capped per service
+(LLM_GATEWAY_MAX_CONCURRENCY) and per endpoint (ENDPOINTS[...]["max_concurrency"]).
+When no slot is free the call waits in a bounded queue; waiters are served by priority
+(interactive chat before agent jobs), then in arrival order. Instead of piling up on the
+upstream until everything times out together, excess load is turned away early:
+
+    queue full                               -> 429 Too Many Requests + Retry-After
+    no slot within LLM_GATEWAY_MAX_WAIT_SECONDS -> 503 Service Unavailable + Retry-After
+
+Queue depth, wait times and rejections are reported by get_llm_gateway_stats().
+"""
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from fastapi import HTTPException
+
+import config
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0  # Chat turns and user-triggered generation
+PRIORITY_BACKGROUND = 1  # Agent jobs and housekeeping (e.g. chat summaries)
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+DEFAULT_HOLD_SECONDS = 5.0  # Assumed call duration until one has been measured
+RECENT_WAITS_KEPT = 500  # Wait times kept for the percentile metrics
+
+# Gateways by service name (created by http_clients)
+_gateways: Dict[str, "LLMGateway"] = {}
+
+
+class _Waiter:
+    __slots__ = ("endpoint", "priority", "seq", "future", "enqueued_at")
+
+    def __init__(self, endpoint: str, priority: int, seq: int, future: "asyncio.Future"):
+        self.endpoint = endpoint
+        self.priority = priority
+        self.seq = seq
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class LLMGatewayLease:
+    """A held gateway slot. release() is idempotent, so every exit path may call it."""
+
+    def __init__(self, gateway: "LLMGateway", endpoint: str, waited_seconds: float):
+        self.gateway = gateway
+        self.endpoint = endpoint
+        self.waited_seconds = waited_seconds
+        self.acquired_at = time.monotonic()
+        self.released = False
+
+    def release(self) -> None:
+        if self.released:
+            return
+        self.released = True
+        self.gateway._release(self.endpoint, time.monotonic() - self.acquired_at)
+
+
+class LLMGateway:
+    """Concurrency caps and a bounded priority wait queue for one upstream service."""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        endpoint_limits: Dict[str, int],
+        max_queue: int,
+        max_wait_seconds: float
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.endpoint_limits = dict(endpoint_limits)
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+
+        self.in_flight = 0
+        self.endpoint_in_flight: Dict[str, int] = {endpoint: 0 for endpoint in endpoint_limits}
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._avg_hold_seconds: Optional[float] = None
+        self._recent_waits: Deque[float] = deque(maxlen=RECENT_WAITS_KEPT)
+        self.counters: Dict[str, int] = {
+            "admitted": 0,
+            "admitted_after_wait": 0,
+            "rejected_queue_full": 0,
+            "rejected_wait_timeout": 0,
+            "max_queue_depth": 0,
+        }
+
+    def _has_capacity(self, endpoint: str) -> bool:
+        endpoint_limit = self.endpoint_limits.get(endpoint, self.max_concurrency)
+        return self.in_flight < self.max_concurrency and self.endpoint_in_flight.get(endpoint, 0) < endpoint_limit
+
+    def _take(self, endpoint: str) -> None:
+        self.in_flight += 1
+        self.endpoint_in_flight[endpoint] = self.endpoint_in_flight.get(endpoint, 0) + 1
+
+    def _release(self, endpoint: str, hold_seconds: float) -> None:
+        self.in_flight -= 1
+        self.endpoint_in_flight[endpoint] -= 1
+        if hold_seconds > 0:
+            # Moving average of call duration, for Retry-After estimates
+            previous = self._avg_hold_seconds
+            self._avg_hold_seconds = hold_seconds if previous is None else 0.8 * previous + 0.2 * hold_seconds
+        self._grant_waiters()
+
+    def _grant_waiters(self) -> None:
+        """Hand free slots to waiters: highest priority first, then oldest."""
+        while self._waiters:
+            eligible = [waiter for waiter in self._waiters if self._has_capacity(waiter.endpoint)]
+            if not eligible:
+                return
+            waiter = min(eligible, key=lambda w: (w.priority, w.seq))
+            self._waiters.remove(waiter)
+            if waiter.future.done():
+                continue  # Gave up (timeout / disconnect) in the meantime
+            self._take(waiter.endpoint)
+            waiter.future.set_result(None)
+
+    def retry_after_seconds(self) -> int:
+        """Estimated seconds until the queue has drained enough to admit a new call."""
+        hold = self._avg_hold_seconds or DEFAULT_HOLD_SECONDS
+        estimate = math.ceil(hold * (len(self._waiters) + 1) / max(self.max_concurrency, 1))
+        return max(1, min(estimate, config.LLM_GATEWAY_RETRY_AFTER_MAX_SECONDS))
+
+    def _reject(self, status_code: int, reason: str) -> HTTPException:
+        retry_after = self.retry_after_seconds()
+        logger.warning(
+            f"🚦 LLM gateway '{self.name}' rejected a call ({reason}) - "
+            f"in_flight={self.in_flight}/{self.max_concurrency}, queued={len(self._waiters)}, retry_after={retry_after}s"
+        )
+        return HTTPException(
+            status_code=status_code,
+            detail=f"LLM service is busy ({reason}), retry in {retry_after}s",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    async def acquire(self, endpoint: str, priority: int = PRIORITY_INTERACTIVE) -> LLMGatewayLease:
+        """
+        Take a slot for one call to endpoint, waiting in the queue if necessary.
+
+        Args:
+            endpoint: Endpoint name (key in http_clients.ENDPOINTS)
+            priority: PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND (lower is served first)
+
+        Returns:
+            Lease to release() when the call is finished
+
+        Raises:
+            HTTPException(429): The wait queue is full
+            HTTPException(503): No slot became free within max_wait_seconds
+        """
+        if self._has_capacity(endpoint):
+            # Free slots are handed to waiters as soon as they appear, so nobody is queued for this one
+            self._take(endpoint)
+            self.counters["admitted"] += 1
+            self._recent_waits.append(0.0)
+            return LLMGatewayLease(self, endpoint, 0.0)
+
+        if len(self._waiters) >= self.max_queue:
+            self.counters["rejected_queue_full"] += 1
+            raise self._reject(429, "queue full")
+
+        waiter = _Waiter(endpoint, priority, next(self._seq), asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self.counters["max_queue_depth"] = max(self.counters["max_queue_depth"], len(self._waiters))
+
+        try:
+            await asyncio.wait_for(waiter.future, timeout=self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            self.counters["rejected_wait_timeout"] += 1
+            raise self._reject(503, f"no slot within {self.max_wait_seconds:g}s")
+        except asyncio.CancelledError:
+            # Caller went away: drop out of the queue, or give back a slot granted at the same moment
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                self._release(endpoint, 0.0)
+            raise
+
+        waited = time.monotonic() - waiter.enqueued_at
+        self.counters["admitted"] += 1
+        self.counters["admitted_after_wait"] += 1
+        self._recent_waits.append(waited)
+        if waited >= 1:
+            logger.info(f"🚦 LLM gateway '{self.name}': {endpoint} call waited {waited:.1f}s for a slot")
+        return LLMGatewayLease(self, endpoint, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._recent_waits)
+        queued_by_priority: Dict[str, int] = {}
+        for waiter in self._waiters:
+            name = PRIORITY_NAMES.get(waiter.priority, str(waiter.priority))
+            queued_by_priority[name] = queued_by_priority.get(name, 0) + 1
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queue_depth": len(self._waiters),
+            "max_queue": self.max_queue,
+            "max_wait_seconds": self.max_wait_seconds,
+            "queued_by_priority": queued_by_priority,
+            "endpoints": {
+                endpoint: {"in_flight": self.endpoint_in_flight.get(endpoint, 0), "max_concurrency": limit}
+                for endpoint, limit in self.endpoint_limits.items()
+            },
+            "avg_call_seconds": round(self._avg_hold_seconds, 2) if self._avg_hold_seconds is not None else None,
+            "wait_ms": {
+                "samples": len(waits),
+                "avg": round(sum(waits) / len(waits) * 1000, 1) if waits else 0,
+                "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0,
+                "max": round(waits[-1] * 1000, 1) if waits else 0,
+            },
+            **self.counters,
+        }
+
+
+def get_llm_gateway(name: str) -> Optional[LLMGateway]:
+    return _gateways.get(name)
+
+
+def register_llm_gateway(gateway: LLMGateway) -> LLMGateway:
+    _gateways[gateway.name] = gateway
+    logger.info(
+        f"🚦 LLM gateway '{gateway.name}' ready (max_concurrency={gateway.max_concurrency}, "
+        f"endpoints={gateway.endpoint_limits}, max_queue={gateway.max_queue}, max_wait={gateway.max_wait_seconds:g}s)"
+    )
+    return gateway
+
+
+def get_llm_gateway_stats() -> Dict[str, Any]:
+    """Queue depth, in-flight calls, wait times and rejections per gateway (this worker)."""
+    return {
+        "enabled": config.LLM_GATEWAY_ENABLED,
+        "gateways": {name: gateway.stats() for name, gateway in _gateways.items()},
+    }
@@ -0,0 +1,202 @@
+"""
+LLM Response Cache - content-addressed cache for repeated LLM prompts.
+
+Agent jobs and PI goal generation often resend byte-identical prompts (e.g. a re-run on
+unchanged epics). Responses are stored in Redis under a SHA-256 of (endpoint, system
+prompt, prompt, model settings from llm_settings), so an identical request is answered
+without calling the LLM service. Changing the provider, a model or a temperature in
+llm_settings changes the key, so answers from other model settings are never reused.
+API keys are not part of the key.
+
+Hits, misses, stores, opt-outs and the LLM latency saved by hits are counted in a Redis
+hash shared by all workers (get_llm_response_cache_stats).
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import config
+from cache_utils import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+LLM_RESPONSE_CACHE_PREFIX = "llm_response:"
+LLM_RESPONSE_CACHE_STATS_KEY = "llm_response_cache:stats"
+
+# Per-worker snapshot of the llm_settings that shape responses: (loaded_at, settings)
+_settings_snapshot: Optional[Tuple[float, Dict[str, str]]] = None
+
+
+def _response_settings(all_settings: Dict[str, str]) -> Dict[str, str]:
+    """llm_settings entries that change the LLM's answer (everything except API keys)."""
+    from llm_settings_service import LLM_API_KEY_KEYS, LLM_SETTINGS_KEYS
+
+    return {
+        key: all_settings[key]
+        for key in LLM_SETTINGS_KEYS
+        if key not in LLM_API_KEY_KEYS and key in all_settings
+    }
+
+
+async def get_llm_response_settings() -> Optional[Dict[str, str]]:
+    """
+    Model settings for cache keys, reloaded every LLM_RESPONSE_CACHE_SETTINGS_TTL seconds.
+
+    Returns:
+        Settings dict, or None if they cannot be read (the cache is then bypassed)
+    """
+    global _settings_snapshot
+    now = time.monotonic()
+    if _settings_snapshot is not None and now - _settings_snapshot[0] < config.LLM_RESPONSE_CACHE_SETTINGS_TTL:
+        return _settings_snapshot[1]
+
+    from database_connection import async_db_connection, run_sync_db
+    from database_general import get_all_llm_settings_db
+
+    try:
+        async with async_db_connection() as conn:
+            all_settings = await run_sync_db(conn, get_all_llm_settings_db)
+    except Exception as e:
+        logger.warning(f"LLM response cache: could not read llm_settings, bypassing cache: {e}")
+        return None
+
+    settings = _response_settings(all_settings)
+    _settings_snapshot = (now, settings)
+    return settings
+
+
+def invalidate_llm_response_settings() -> None:
+    """Drop this worker's llm_settings snapshot (call after llm_settings change)."""
+    global _settings_snapshot
+    _settings_snapshot = None
+
+
+def build_llm_response_cache_key(
+    endpoint: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    settings: Dict[str, str]
+) -> str:
+    """
+    Content address of an LLM request.
+
+    Args:
+        endpoint: LLM service endpoint name (e.g. "llm_process_single")
+        prompt: Prompt text
+        system_prompt: System prompt (None and "" are the same request)
+        settings: Model settings from get_llm_response_settings()
+
+    Returns:
+        Redis key
+    """
+    canonical = json.dumps(
+        {"endpoint": endpoint, "system_prompt": system_prompt or "", "prompt": prompt, "settings": settings},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return LLM_RESPONSE_CACHE_PREFIX + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _count(client, field: str, amount: float = 1) -> None:
+    try:
+        if isinstance(amount, float):
+            client.hincrbyfloat(LLM_RESPONSE_CACHE_STATS_KEY, field, amount)
+        else:
+            client.hincrby(LLM_RESPONSE_CACHE_STATS_KEY, field, amount)
+    except Exception as e:
+        logger.warning(f"LLM response cache stats error: {e}")
+
+
+def record_llm_cache_bypass() -> None:
+    """Count a request that opted out of the cache."""
+    client = get_redis_client()
+    if client:
+        _count(client, "bypassed")
+
+
+def get_cached_llm_response(cache_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached LLM response and count the hit or miss.
+
+    Returns:
+        The LLM service response dict, or None on a miss
+    """
+    client = get_redis_client()
+    if not client:
+        return None
+    try:
+        cached = client.get(cache_key)
+        entry = json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning(f"LLM response cache retrieval error: {e}")
+        return None
+
+    if not entry:
+        _count(client, "misses")
+        logger.info(f"❌ LLM response cache MISS: {cache_key[len(LLM_RESPONSE_CACHE_PREFIX):][:12]}")
+        return None
+
+    latency_ms = float(entry.get("latency_ms") or 0.0)
+    _count(client, "hits")
+    _count(client, "saved_latency_ms", latency_ms)
+    logger.info(f"✅ LLM response cache HIT: {cache_key[len(LLM_RESPONSE_CACHE_PREFIX):][:12]} (saved ~{latency_ms:.0f} ms)")
+    return entry["response"]
+
+
+def set_cached_llm_response(cache_key: str, response: Dict[str, Any], latency_ms: float, ttl: Optional[int] = None) -> bool:
+    """
+    Store a successful LLM response with the latency it took to produce.
+
+    Args:
+        cache_key: From build_llm_response_cache_key()
+        response: LLM service response dict
+        latency_ms: LLM call latency (credited as saved on every hit)
+        ttl: Expiry in seconds (default LLM_RESPONSE_CACHE_TTL)
+
+    Returns:
+        True if stored
+    """
+    client = get_redis_client()
+    if not client:
+        return False
+    try:
+        entry = {"response": response, "latency_ms": round(latency_ms, 1), "cached_at": time.time()}
+        client.setex(cache_key, ttl or config.LLM_RESPONSE_CACHE_TTL, json.dumps(entry, default=str))
+        _count(client, "stores")
+        return True
+    except Exception as e:
+        logger.warning(f"LLM response cache set error: {e}")
+        return False
+
+
+def get_llm_response_cache_stats() -> Dict[str, Any]:
+    """
+    Hit/miss counters and saved LLM latency (all workers).
+
+    Returns:
+        Stats dict; "available" is False when Redis is not reachable
+    """
+    client = get_redis_client()
+    if not client:
+        return {"enabled": config.LLM_RESPONSE_CACHE_ENABLED, "available": False}
+
+    raw = client.hgetall(LLM_RESPONSE_CACHE_STATS_KEY) or {}
+    hits = int(raw.get("hits") or 0)
+    misses = int(raw.get("misses") or 0)
+    lookups = hits + misses
+    saved_latency_ms = float(raw.get("saved_latency_ms") or 0.0)
+    return {
+        "enabled": config.LLM_RESPONSE_CACHE_ENABLED,
+        "available": True,
+        "ttl_seconds": config.LLM_RESPONSE_CACHE_TTL,
+        "hits": hits,
+        "misses": misses,
+        "stores": int(raw.get("stores") or 0),
+        "bypassed": int(raw.get("bypassed") or 0),
+        "hit_rate_percentage": round(hits / lookups * 100, 2) if lookups else 0,
+        "saved_latency_seconds": round(saved_latency_ms / 1000, 1),
+        "avg_saved_latency_ms": round(saved_latency_ms / hits, 1) if hits else 0,
+    }
@@ -174,6 +174,9 @@ async def update_llm_settings(
                     updated_settings_list.append(f"{key}={request.settings[key]}")
         if updated_settings_list:
             logger.info(f"Updated LLM settings: {', '.join(updated_settings_list)}")
+            # New model settings mean new LLM response cache keys - don't wait for the snapshot to expire
+            from llm_response_cache import invalidate_llm_response_settings
+            invalidate_llm_response_settings()
         
         return {
             "success": True,
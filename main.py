@@ -6,6 +6,8 @@ import logging
 import base64
 import time
 from database_connection import _current_request_path
+from compression_middleware import CompressionMiddleware
+import config
 
 # Import service modules
 from teams_service import teams_router
@@ -123,6 +125,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Add negotiated zstd/brotli/gzip response compression
+if config.RESPONSE_COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=config.RESPONSE_COMPRESSION_MIN_BYTES)
+
 # Paths that should skip START and END message logging
 _SKIP_LOG_PATHS = {"/api/v1/agent-jobs/claim-next"}
 
@@ -213,10 +219,10 @@ app.include_router(pi_goals_router, prefix="/api/v1", tags=["pi-goals"])
 
 @app.on_event("startup")
 async def startup_event():
-    """Application startup - ensure database exists, create engine, initialize tables, populate cache and load JIRA URL"""
+    """Application startup - ensure database exists, create engine, initialize tables, populate caches and load JIRA URL"""
     try:
         # Step 1: Ensure database exists
-        from database_connection import get_connection_string, ensure_database_exists, get_db_engine
+        from database_connection import get_connection_string, ensure_database_exists, get_db_engine, get_async_db_engine
         from database_table_creation import initialize_database_tables_with_engine
         
         logger.info("🚀 Starting application initialization...")
@@ -240,6 +246,18 @@ async def startup_event():
         import database_connection
         database_connection.engine = engine
         
+        # Create shared pooled HTTP clients for LLM / SparksAI-SQL services
+        from http_clients import init_http_clients
+        init_http_clients()
+        
+        # Listen for report cache invalidations broadcast by other workers
+        from cache_utils import start_report_cache_invalidation_listener
+        start_report_cache_invalidation_listener()
+        
+        # Create async engine used by async read paths (pool connects lazily)
+        if not get_async_db_engine():
+            logger.warning("⚠️  Async database engine not available - async routes will return 503.")
+        
         # Step 3: Initialize database tables
         logger.info("📊 Step 3/4: Initializing database tables...")
         initialize_database_tables_with_engine(engine)
@@ -255,12 +273,49 @@ async def startup_event():
             else:
                 logger.warning("⚠️  Cache population failed (Redis unavailable).")
             
+            # Load report definitions into the in-memory registry
+            from report_registry import load_report_registry
+            try:
+                load_report_registry(conn)
+            except Exception as e:
+                logger.warning(f"⚠️  Report registry load failed, definitions will be read from the database: {e}")
+            
             # Note: JIRA settings will be loaded on first use via get_jira_url(conn) retry mechanism
+        
+        # Reload report definitions when report_definitions changes
+        from report_registry import start_report_registry_watcher
+        start_report_registry_watcher()
+        
+        # Pre-resolve the most requested reports now and on an interval
+        from report_warmup import start_report_warmup_scheduler
+        start_report_warmup_scheduler()
                 
     except Exception as e:
         logger.warning(f"⚠️  Startup failed: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Application shutdown - stop cache warm-up and listener, close pooled HTTP clients and async database connections"""
+    try:
+        from report_warmup import stop_report_warmup_scheduler
+        await stop_report_warmup_scheduler()
+        
+        from report_registry import stop_report_registry_watcher
+        await stop_report_registry_watcher()
+        
+        from cache_utils import stop_report_cache_invalidation_listener
+        stop_report_cache_invalidation_listener()
+        
+        from http_clients import close_http_clients
+        await close_http_clients()
+        
+        from database_connection import dispose_async_db_engine
+        await dispose_async_db_engine()
+    except Exception as e:
+        logger.warning(f"⚠️  Shutdown cleanup failed: {e}")
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -320,7 +375,8 @@ async def http_exception_handler(request, exc):
         content={
             "error": exc.detail,
             "code": exc.status_code
-        }
+        },
+        headers=getattr(exc, "headers", None)  # e.g. Retry-After on LLM gateway 429/503
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""
+Pagination - keyset (cursor) pagination and NDJSON streaming for collection endpoints.
+
+Collection endpoints order by a unique key (e.g. id DESC). Instead of OFFSET, each page
+returns an opaque next_cursor holding the last row's key; the next request continues with
+WHERE key < :cursor_key, so every page costs one index range scan however deep it is.
+Cursors are bound to the filters they were issued for and rejected with 400 otherwise.
+
+format=ndjson streams the whole filtered collection instead, one JSON object per line,
+read from a server-side cursor in NDJSON_STREAM_BATCH_SIZE batches so memory stays flat.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from database_connection import async_db_connection
+import config
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+FORMAT_JSON = "json"
+FORMAT_NDJSON = "ndjson"
+
+
+def filters_fingerprint(filters: Dict[str, Any]) -> str:
+    """Short hash of the filters a cursor was issued for."""
+    canonical = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
+
+
+def encode_cursor(last_key: Any, filters: Dict[str, Any]) -> str:
+    """
+    Build the opaque cursor for the page after the row with sort key last_key.
+
+    Args:
+        last_key: Sort key of the last row on the current page
+        filters: Filters of the current request (the cursor is only valid with the same filters)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"k": last_key, "f": filters_fingerprint(filters)}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], filters: Dict[str, Any]) -> Any:
+    """
+    Read the sort key back from a cursor.
+
+    Returns:
+        The last key of the previous page, or None when no cursor was given
+
+    Raises:
+        HTTPException(400): If the cursor is malformed or was issued for other filters
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        last_key = payload["k"]
+        fingerprint = payload["f"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if fingerprint != filters_fingerprint(filters):
+        raise HTTPException(status_code=400, detail="Cursor does not match the current filters")
+    return last_key
+
+
+def split_page(rows: Sequence[Any], limit: int, key_index: int, filters: Dict[str, Any]) -> Tuple[List[Any], Optional[str]]:
+    """
+    Split rows fetched with LIMIT limit + 1 into the page and the next cursor.
+
+    Args:
+        rows: Fetched rows (at most limit + 1)
+        limit: Page size
+        key_index: Position of the sort key column in each row
+        filters: Filters of the current request
+
+    Returns:
+        (page rows, next_cursor or None when this is the last page)
+    """
+    if len(rows) <= limit:
+        return list(rows), None
+    page = list(rows[:limit])
+    return page, encode_cursor(page[-1][key_index], filters)
+
+
+def validate_response_format(response_format: str) -> str:
+    if response_format not in (FORMAT_JSON, FORMAT_NDJSON):
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{response_format}' (expected 'json' or 'ndjson')")
+    return response_format
+
+
+async def stream_ndjson_rows(
+    query: Any,
+    params: Dict[str, Any],
+    row_to_dict: Callable[[Any], Dict[str, Any]],
+    batch_size: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream query rows as NDJSON from a server-side cursor.
+
+    The stream checks out its own pooled connection (request-scoped dependencies are
+    released before a streaming body is sent). A failure mid-stream is reported as a
+    final {"error": ...} line, since the 200 status has already been sent.
+    """
+    batch_size = batch_size or config.NDJSON_STREAM_BATCH_SIZE
+    streamed = 0
+    try:
+        async with async_db_connection() as conn:
+            result = await conn.stream(query, params)
+            async for rows in result.partitions(batch_size):
+                lines: List[str] = [json.dumps(row_to_dict(row), default=str) for row in rows]
+                streamed += len(lines)
+                yield ("\n".join(lines) + "\n").encode()
+        logger.info(f"📤 NDJSON stream finished ({streamed} rows)")
+    except Exception as e:
+        logger.error(f"NDJSON stream failed after {streamed} rows: {e}")
+        yield (json.dumps({"error": f"Stream failed after {streamed} rows: {str(e)}"}) + "\n").encode()
+
+
+def ndjson_response(
+    query: Any,
+    params: Dict[str, Any],
+    row_to_dict: Callable[[Any], Dict[str, Any]],
+) -> StreamingResponse:
+    """StreamingResponse for stream_ndjson_rows()."""
+    return StreamingResponse(stream_ndjson_rows(query, params, row_to_dict), media_type=NDJSON_MEDIA_TYPE)
@@ -24,6 +24,7 @@ from database_general import (
     delete_pi_goal_by_id
 )
 from agent_llm_service import call_llm_service_process_single
+from llm_gateway import PRIORITY_INTERACTIVE
 from pydantic import BaseModel
 import config
 
@@ -554,6 +555,7 @@ class PIGoalGenerateRequest(BaseModel):
     team_name: Optional[str] = None
     isGroup: bool = False
     quarter: Optional[str] = None
+    use_cache: bool = True  # False forces a fresh LLM call even if the same epics were sent before
 
 
 class MoveGoalsAIToUserRequest(BaseModel):
@@ -576,7 +578,7 @@ async def generate_ai_pi_goals(
     5. Returns the generated goals
     
     Args:
-        request: PIGoalGenerateRequest with pi, team_name, isGroup, and quarter
+        request: PIGoalGenerateRequest with pi, team_name, isGroup, quarter and use_cache
         conn: Database connection
         
     Returns:
@@ -642,7 +644,9 @@ async def generate_ai_pi_goals(
         llm_response = await call_llm_service_process_single(
             prompt=prompt,
             system_prompt=None,
-            metadata=metadata
+            metadata=metadata,
+            use_cache=request.use_cache,
+            priority=PRIORITY_INTERACTIVE  # A user is waiting on this one - ahead of agent jobs
         )
         
         # Step 6: Extract response text
@@ -8,11 +8,12 @@ Uses FastAPI dependencies for clean connection management and SQL injection prot
 from fastapi import APIRouter, HTTPException, Depends, Query, Path
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
 from typing import List, Dict, Any, Union, Optional
 from datetime import date, datetime, timedelta
 import logging
 import re
-from database_connection import get_db_connection
+from database_connection import get_async_db_connection, run_sync_db
 from database_pi import fetch_pi_predictability_data, fetch_pi_burndown_data, fetch_scope_changes_data, fetch_pi_summary_data, fetch_pi_summary_data_by_team, get_pi_participating_teams_db, fetch_epic_inbound_dependency_data, fetch_epic_outbound_dependency_data
 from database_team_metrics import resolve_team_names_from_filter
 import config
@@ -351,7 +352,7 @@ def get_pi_in_progress_issues_status(
         return "green"
 
 @pis_router.get("/pis/getPis")
-async def get_pis(conn: Connection = Depends(get_db_connection)):
+async def get_pis(conn: AsyncConnection = Depends(get_async_db_connection)):
     """
     Get all PIs from pis table.
     Uses parameterized queries to prevent SQL injection.
@@ -370,7 +371,7 @@ async def get_pis(conn: Connection = Depends(get_db_connection)):
         logger.info(f"Executing query to get all PIs from pis table")
         
         # Execute query with connection from dependency
-        result = conn.execute(query)
+        result = await conn.execute(query)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -405,7 +406,7 @@ async def get_pis(conn: Connection = Depends(get_db_connection)):
 @pis_router.get("/pis/current-and-next")
 async def get_current_and_next_pis(
     window_days: int = Query(5, description="Days after current PI end date to look for next PIs (default: 5)"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get current PIs (where today is between start_date and end_date) and next/future PIs.
@@ -435,7 +436,7 @@ async def get_current_and_next_pis(
             ORDER BY start_date ASC
         """)
         
-        result = conn.execute(query)
+        result = await conn.execute(query)
         rows = result.fetchall()
         
         # Convert rows to list of dictionaries
@@ -532,7 +533,7 @@ async def get_pi_predictability(
     pi_names: Optional[Union[str, List[str]]] = Query(None, description="Optional: Single PI name or array of PI names (comma-separated). If not provided, returns data for all PIs."),
     team_name: str = Query(None, description="Team name filter (or group name if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get PI predictability report data for specified PI(s).
@@ -558,7 +559,7 @@ async def get_pi_predictability(
                 FROM {config.PIS_TABLE}
                 WHERE pi_name IS NOT NULL
             """)
-            pis_rows = conn.execute(pis_query).fetchall()
+            pis_rows = (await conn.execute(pis_query)).fetchall()
             pi_names = [row[0] for row in pis_rows if row[0]]
             logger.info(f"No pi_names provided, fetching all PIs: {pi_names}")
         
@@ -578,7 +579,7 @@ async def get_pi_predictability(
                 pi_names = [pi_names]
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching PI predictability data for PIs: {pi_names}")
         logger.info(f"Team filter: {team_name if team_name else 'None'}, isGroup: {isGroup}")
@@ -586,10 +587,11 @@ async def get_pi_predictability(
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Call database function with team_names list
-        predictability_data = fetch_pi_predictability_data(
+        predictability_data = await run_sync_db(
+            conn,
+            fetch_pi_predictability_data,
             pi_names=pi_names,
-            team_names=team_names_list,
-            conn=conn
+            team_names=team_names_list
         )
         
         # Build response metadata
@@ -635,7 +637,7 @@ async def get_pi_burndown(
     issue_type: str = Query(None, description="Issue type filter"),
     team_name: str = Query(None, description="Team name filter (or group name if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get PI burndown data for a specific PI.
@@ -663,7 +665,7 @@ async def get_pi_burndown(
             issue_type = "Epic"
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching PI burndown data for PI: {pi}")
         logger.info(f"Filters: project={project}, issue_type={issue_type}, team_name={team_name}, isGroup={isGroup}")
@@ -671,12 +673,13 @@ async def get_pi_burndown(
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Call database function with resolved team names list
-        burndown_data = fetch_pi_burndown_data(
+        burndown_data = await run_sync_db(
+            conn,
+            fetch_pi_burndown_data,
             pi_name=pi,
             project_keys=project,
             issue_type=issue_type,
-            team_names=team_names_list,
-            conn=conn
+            team_names=team_names_list
         )
         
         # Build response metadata
@@ -721,7 +724,7 @@ async def get_scope_changes(
     pi_names: Optional[Union[str, List[str]]] = Query(None, description="Optional: Single PI name or array of PI names (comma-separated). If not provided, returns data for all PIs."),
     team_name: str = Query(None, description="Team name filter (or group name if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get scope changes data for specified PIs.
@@ -744,7 +747,7 @@ async def get_scope_changes(
                 FROM {config.PIS_TABLE}
                 WHERE pi_name IS NOT NULL
             """)
-            pis_rows = conn.execute(pis_query).fetchall()
+            pis_rows = (await conn.execute(pis_query)).fetchall()
             pi_names = [row[0] for row in pis_rows if row[0]]
             logger.info(f"No pi_names provided, fetching all PIs: {pi_names}")
         
@@ -771,7 +774,7 @@ async def get_scope_changes(
             )
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching scope changes data for PIs: {pi_names}")
         logger.info(f"Filters: team_name={team_name}, isGroup={isGroup}")
@@ -779,10 +782,11 @@ async def get_scope_changes(
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Call database function
-        scope_data = fetch_scope_changes_data(
+        scope_data = await run_sync_db(
+            conn,
+            fetch_scope_changes_data,
             pi_names=pi_names,
-            team_names=team_names_list,
-            conn=conn
+            team_names=team_names_list
         )
         
         # Build response metadata
@@ -828,7 +832,7 @@ async def get_pi_status_for_today(
     team_name: str = Query(None, description="Team name filter (or group name if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     plan_grace_period: int = Query(None, description="Planned grace period in days"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get PI status for today using the get_pi_summary_data database function.
@@ -858,7 +862,7 @@ async def get_pi_status_for_today(
             issue_type = "Epic"
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching PI status for today")
         logger.info(f"Parameters: pi={pi}, project={project}, issue_type={issue_type}, team_name={team_name}, isGroup={isGroup}, plan_grace_period={plan_grace_period}")
@@ -866,24 +870,26 @@ async def get_pi_status_for_today(
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Call database function with resolved team names list
-        summary_data = fetch_pi_summary_data(
+        summary_data = await run_sync_db(
+            conn,
+            fetch_pi_summary_data,
             target_pi_name=pi,
             target_project_keys=project,
             target_issue_type=issue_type,
             target_team_names=team_names_list,
-            planned_grace_period_days=plan_grace_period,
-            conn=conn
+            planned_grace_period_days=plan_grace_period
         )
         
         # Fetch WIP data using the same logic as WIP endpoint
         wip_data = None
         if pi:  # Only fetch WIP if PI is provided
             # Pass team_names_list to fetch_wip_data_from_db (now supports multiple teams)
-            wip_data = fetch_wip_data_from_db(
+            wip_data = await run_sync_db(
+                conn,
+                fetch_wip_data_from_db,
                 pi=pi,
                 team_names=team_names_list,
-                project=project,
-                conn=conn
+                project=project
             )
         
         # Add progress_delta_pct_status and WIP fields to each record
@@ -931,7 +937,7 @@ async def get_pi_status_for_today_by_team(
     team_name: str = Query(None, description="Team name filter (or group name if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     plan_grace_period: int = Query(None, description="Planned grace period in days"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get PI status for today grouped by team using the get_pi_summary_data_by_team database function.
@@ -960,7 +966,7 @@ async def get_pi_status_for_today_by_team(
             issue_type = "Epic"
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching PI status for today by team")
         logger.info(f"Parameters: pi={pi}, project={project}, issue_type={issue_type}, team_name={team_name}, isGroup={isGroup}, plan_grace_period={plan_grace_period}")
@@ -968,13 +974,14 @@ async def get_pi_status_for_today_by_team(
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Call database function with resolved team names list
-        summary_data = fetch_pi_summary_data_by_team(
+        summary_data = await run_sync_db(
+            conn,
+            fetch_pi_summary_data_by_team,
             target_pi_name=pi,
             target_project_keys=project,
             target_issue_type=issue_type,
             target_team_names=team_names_list,
-            planned_grace_period_days=plan_grace_period,
-            conn=conn
+            planned_grace_period_days=plan_grace_period
         )
         
         # Fetch per-team WIP data
@@ -1007,7 +1014,7 @@ async def get_pi_status_for_today_by_team(
             """)
             
             logger.info(f"Executing per-team WIP query for PI: {pi}")
-            wip_result = conn.execute(wip_query, wip_params)
+            wip_result = await conn.execute(wip_query, wip_params)
             
             for row in wip_result:
                 team_name = row[0]
@@ -1084,7 +1091,7 @@ async def get_pi_wip(
     team_name: str = Query(None, description="Team name filter (or group name if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     project: str = Query(None, description="Project key filter (optional)"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get WIP (Work In Progress) counts for epics in a specific PI.
@@ -1116,7 +1123,7 @@ async def get_pi_wip(
             )
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching PI WIP counts for PI: {pi}")
         logger.info(f"Parameters: pi={pi}, team_name={team_name}, isGroup={isGroup}, project={project}")
@@ -1124,11 +1131,12 @@ async def get_pi_wip(
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Use shared helper function to fetch WIP data
-        wip_data = fetch_wip_data_from_db(
+        wip_data = await run_sync_db(
+            conn,
+            fetch_wip_data_from_db,
             pi=pi,
             team_names=team_names_list,
-            project=project,
-            conn=conn
+            project=project
         )
         
         # Build response metadata
@@ -1180,7 +1188,7 @@ async def get_pi_progress(
     team_name: str = Query(None, description="Team name filter (or group name if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     plan_grace_period: int = Query(None, description="Planned grace period in days"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get PI progress with calculated metrics similar to current sprint progress.
@@ -1214,7 +1222,7 @@ async def get_pi_progress(
             issue_type = "Epic"
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         logger.info(f"Fetching PI progress")
         logger.info(f"Parameters: pi={pi}, project={project}, issue_type={issue_type}, team_name={team_name}, isGroup={isGroup}, plan_grace_period={plan_grace_period}")
@@ -1222,13 +1230,14 @@ async def get_pi_progress(
             logger.info(f"Resolved team names: {team_names_list}")
         
         # Call database function (same as get-pi-status-for-today)
-        summary_data = fetch_pi_summary_data(
+        summary_data = await run_sync_db(
+            conn,
+            fetch_pi_summary_data,
             target_pi_name=pi,
             target_project_keys=project,
             target_issue_type=issue_type,
             target_team_names=team_names_list,
-            planned_grace_period_days=plan_grace_period,
-            conn=conn
+            planned_grace_period_days=plan_grace_period
         )
         
         # Handle empty result
@@ -1396,7 +1405,7 @@ async def get_top_dependencies_summary(
     pi: str = Query(..., description="PI name (quarter_pi_of_epic) - required"),
     team_name: Optional[str] = Query(None, description="Filter by team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get top 3 teams with most uncompleted dependencies (inbound and outbound) for a PI.
@@ -1414,11 +1423,11 @@ async def get_top_dependencies_summary(
     """
     try:
         # Resolve team names FIRST
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Fetch ALL rows (each row is already per team - no aggregation needed)
-        inbound_rows = fetch_epic_inbound_dependency_data(pi, team_names_list, conn)
-        outbound_rows = fetch_epic_outbound_dependency_data(pi, team_names_list, conn)
+        inbound_rows = await run_sync_db(conn, fetch_epic_inbound_dependency_data, pi, team_names_list)
+        outbound_rows = await run_sync_db(conn, fetch_epic_outbound_dependency_data, pi, team_names_list)
         
         # Process inbound dependencies: calculate uncompleted for each row
         inbound_with_uncompleted = []
@@ -1504,7 +1513,7 @@ async def get_average_epic_cycle_time(
     months: int = Query(3, description="Number of months to look back (default: 3)", ge=1, le=12),
     team_name: Optional[str] = Query(None, description="Filter by team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get average cycle time (in days) for completed epics over the last N months.
@@ -1522,7 +1531,7 @@ async def get_average_epic_cycle_time(
         start_date = datetime.now().date() - timedelta(days=months * 30)
         
         # Resolve team names using shared helper function
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Build WHERE clause conditions
         where_conditions = [
@@ -1556,7 +1565,7 @@ async def get_average_epic_cycle_time(
         
         logger.info(f"Executing query to get average epic cycle time: months={months}, team_name={team_name}, isGroup={isGroup}")
         
-        result = conn.execute(query, params)
+        result = await conn.execute(query, params)
         row = result.fetchone()
         
         # Extract results
@@ -1610,7 +1619,7 @@ async def get_average_epic_cycle_time(
 @pis_router.get("/pis/{pi}/participating-teams")
 async def get_pi_participating_teams(
     pi: str = Path(..., description="Program Increment (quarter_pi_of_epic) - mandatory"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get list of teams that have any issues in the jira_issues table for a specific PI.
@@ -1628,7 +1637,7 @@ async def get_pi_participating_teams(
         validated_pi = validate_pi(pi)
         
         # Use reusable database function
-        team_names = get_pi_participating_teams_db(validated_pi, conn)
+        team_names = await run_sync_db(conn, get_pi_participating_teams_db, validated_pi)
         
         return {
             "success": True,
@@ -0,0 +1,326 @@
+"""
+Report Downsampling - reduce time-series report data to the resolution a chart can draw.
+
+Report definitions opt in through meta_schema["downsample"]:
+
+    {
+        "x": "snapshot_day",                 # x column (dates, datetimes, ISO strings or numbers)
+        "y": ["work_in_progress"],           # value columns the shape is judged on
+        "group_by": "issuetype",             # optional: one series per value of this column
+        "path": "burndown_data",             # optional: key inside data holding the series
+        "strategy": "lttb",                  # "lttb" | "change_point" | "bucket"
+        "max_points": 300,                   # optional default; the max_points filter overrides it
+        "max_gap": 5                         # change_point only: keep a point at least every N x-units (days)
+    }
+
+The series may be a list of row dicts or a columnar table ({columns, values}); either way
+the selection runs over column arrays (x is converted once per series) and picks whole
+rows, so every column of a kept row is preserved. max_points applies per series.
+"""
+
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_LTTB = "lttb"
+STRATEGY_CHANGE_POINT = "change_point"
+STRATEGY_BUCKET = "bucket"
+STRATEGY_NONE = "none"
+DOWNSAMPLE_STRATEGIES = (STRATEGY_LTTB, STRATEGY_CHANGE_POINT, STRATEGY_BUCKET)
+
+MIN_MAX_POINTS = 3  # LTTB always keeps the first and last point plus at least one in between
+
+
+def _x_number(value: Any) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp() / 86400.0
+    if isinstance(value, date):
+        return float(value.toordinal())
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        if "T" in value or " " in value.strip():
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() / 86400.0
+        return float(date.fromisoformat(value).toordinal())
+    raise ValueError(f"Unsupported x value {value!r}")
+
+
+def series_x_values(column: Sequence[Any]) -> List[float]:
+    """
+    Convert an x column to numbers once (dates become day numbers, so gaps are in days).
+    Falls back to positions when any value cannot be converted.
+    """
+    try:
+        return [_x_number(value) for value in column]
+    except (ValueError, TypeError):
+        return [float(index) for index in range(len(column))]
+
+
+def _y_number(value: Any) -> float:
+    if value is None or isinstance(value, bool):
+        return float(bool(value))
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _normalized(column: Sequence[Any]) -> List[float]:
+    """Scale a y column to 0..1 so several y columns weigh equally in LTTB areas."""
+    values = [_y_number(value) for value in column]
+    if not values:
+        return values
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    return [(value - low) / span for value in values]
+
+
+def lttb_indices(x: Sequence[float], ys: Sequence[Sequence[Any]], max_points: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets: keep the points that preserve the visual shape.
+
+    Args:
+        x: Ascending x values
+        ys: Value columns (areas are summed over all of them, each normalized)
+        max_points: Number of points to keep (>= 3)
+
+    Returns:
+        Sorted indices of the kept points (always including the first and last)
+    """
+    n = len(x)
+    if max_points >= n or n <= 2:
+        return list(range(n))
+
+    normalized = [_normalized(column) for column in ys] or [[0.0] * n]
+    selected = [0]
+    every = (n - 2) / (max_points - 2)
+    anchor = 0
+    for bucket in range(max_points - 2):
+        # Average of the next bucket is the third triangle vertex
+        avg_start = int((bucket + 1) * every) + 1
+        avg_end = min(int((bucket + 2) * every) + 1, n)
+        avg_count = avg_end - avg_start
+        avg_x = sum(x[avg_start:avg_end]) / avg_count
+        avg_ys = [sum(column[avg_start:avg_end]) / avg_count for column in normalized]
+
+        range_start = int(bucket * every) + 1
+        range_end = int((bucket + 1) * every) + 1
+        anchor_x = x[anchor]
+        best_index, best_area = range_start, -1.0
+        for index in range(range_start, range_end):
+            area = 0.0
+            for column, avg_y in zip(normalized, avg_ys):
+                anchor_y = column[anchor]
+                area += abs((anchor_x - avg_x) * (column[index] - anchor_y) - (anchor_x - x[index]) * (avg_y - anchor_y))
+            if area > best_area:
+                best_index, best_area = index, area
+        selected.append(best_index)
+        anchor = best_index
+    selected.append(n - 1)
+    return selected
+
+
+def bucket_indices(x: Sequence[float], max_points: int) -> List[int]:
+    """
+    Fixed-width buckets over the x range: keep the first point and the last point of each bucket
+    (the end-of-period value, which is what cumulative series such as burndowns need).
+    """
+    n = len(x)
+    if max_points >= n or n <= 2:
+        return list(range(n))
+
+    buckets = max_points - 1
+    start, span = x[0], (x[-1] - x[0]) or 1.0
+    last_in_bucket: Dict[int, int] = {}
+    for index in range(1, n):
+        bucket = min(int((x[index] - start) / span * buckets), buckets - 1)
+        last_in_bucket[bucket] = index
+    return [0] + sorted(last_in_bucket.values())
+
+
+def change_point_indices(
+    x: Sequence[float],
+    ys: Sequence[Sequence[Any]],
+    max_gap: Optional[float] = None,
+    gap: Optional[Callable[[int, int], float]] = None,
+) -> List[int]:
+    """
+    Keep the first and last points, every point where any y column changes from the previous
+    point, and a marker point whenever max_gap x-units pass without a kept point.
+
+    gap(last_kept_index, index) replaces x[index] - x[last_kept_index] as the distance
+    measure, for callers whose x values are not all comparable.
+    """
+    n = len(x)
+    if n <= 2:
+        return list(range(n))
+    if gap is None:
+        def gap(last_kept: int, index: int) -> float:
+            return x[index] - x[last_kept]
+
+    selected = [0]
+    for index in range(1, n - 1):
+        changed = any(column[index] != column[index - 1] for column in ys)
+        if changed or (max_gap is not None and gap(selected[-1], index) >= max_gap):
+            selected.append(index)
+    selected.append(n - 1)
+    return selected
+
+
+def select_indices(
+    strategy: str,
+    x: Sequence[float],
+    ys: Sequence[Sequence[Any]],
+    max_points: Optional[int],
+    max_gap: Optional[float] = None,
+) -> List[int]:
+    """
+    Pick the points of one series (x ascending) to keep.
+
+    Returns:
+        Sorted indices into x
+    """
+    if strategy == STRATEGY_CHANGE_POINT:
+        selected = change_point_indices(x, ys, max_gap)
+        if max_points and len(selected) > max_points:
+            # Still too many change points for the chart: keep the most shape-defining ones
+            reduced = lttb_indices([x[i] for i in selected], [[column[i] for i in selected] for column in ys], max_points)
+            selected = [selected[i] for i in reduced]
+        return selected
+    if not max_points:
+        return list(range(len(x)))
+    if strategy == STRATEGY_LTTB:
+        return lttb_indices(x, ys, max_points)
+    if strategy == STRATEGY_BUCKET:
+        return bucket_indices(x, max_points)
+    raise ValueError(f"Unknown downsampling strategy '{strategy}'")
+
+
+def _parse_max_points(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    try:
+        max_points = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid max_points '{value}' (expected an integer)")
+    if max_points < MIN_MAX_POINTS:
+        raise ValueError(f"max_points must be at least {MIN_MAX_POINTS}")
+    return max_points
+
+
+def downsample_series(
+    series: Any,
+    spec: Mapping[str, Any],
+    strategy: str,
+    max_points: Optional[int],
+) -> Tuple[Any, int, int]:
+    """
+    Downsample one series (list of row dicts or {columns, values} table).
+
+    Returns:
+        (downsampled series, original point count, kept point count)
+    """
+    columnar = isinstance(series, dict) and "values" in series
+    if columnar:
+        values = series["values"]
+        count = len(values.get(spec["x"], []))
+
+        def column(name: str) -> List[Any]:
+            return values.get(name) or [None] * count
+    elif isinstance(series, list):
+        count = len(series)
+
+        def column(name: str) -> List[Any]:
+            return [row.get(name) for row in series]
+    else:
+        return series, 0, 0
+
+    # Split into series per group, each ordered by x
+    x_all = series_x_values(column(spec["x"]))
+    y_columns = [column(name) for name in spec.get("y") or []]
+    group_by = spec.get("group_by")
+    groups: Dict[Any, List[int]] = {}
+    if group_by:
+        for index, key in enumerate(column(group_by)):
+            groups.setdefault(key, []).append(index)
+    else:
+        groups[None] = list(range(count))
+
+    keep: List[int] = []
+    for indices in groups.values():
+        indices.sort(key=lambda index: x_all[index])
+        picked = select_indices(
+            strategy,
+            [x_all[index] for index in indices],
+            [[y_column[index] for index in indices] for y_column in y_columns],
+            max_points,
+            spec.get("max_gap"),
+        )
+        keep.extend(indices[position] for position in picked)
+    keep.sort()
+
+    if len(keep) == count:
+        return series, count, count
+    if columnar:
+        return (
+            {**series, "values": {name: [values_list[i] for i in keep] for name, values_list in series["values"].items()}},
+            count,
+            len(keep),
+        )
+    return [series[i] for i in keep], count, len(keep)
+
+
+def downsample_report_result(
+    result: Dict[str, Any],
+    spec: Mapping[str, Any],
+    filters: Mapping[str, Any],
+) -> Dict[str, Any]:
+    """
+    Downsampling stage for resolve_report_data.
+
+    Args:
+        result: Fetcher result ({"data", "meta"})
+        spec: The definition's meta_schema["downsample"]
+        filters: Request filters (max_points, and downsample to override the strategy or "none")
+
+    Returns:
+        Result with the series downsampled and meta["downsampling"] describing it
+
+    Raises:
+        ValueError: On an unknown strategy or invalid max_points
+    """
+    strategy = filters.get("downsample") or spec.get("strategy") or STRATEGY_LTTB
+    if strategy == STRATEGY_NONE:
+        return result
+    if strategy not in DOWNSAMPLE_STRATEGIES:
+        raise ValueError(
+            f"Unknown downsampling strategy '{strategy}' (expected one of: {', '.join(DOWNSAMPLE_STRATEGIES)}, none)"
+        )
+    max_points = _parse_max_points(filters.get("max_points"))
+    if max_points is None:
+        max_points = _parse_max_points(spec.get("max_points"))
+    if max_points is None and strategy != STRATEGY_CHANGE_POINT:
+        return result
+
+    data = result.get("data")
+    path = spec.get("path")
+    series = data.get(path) if path and isinstance(data, dict) else data
+    downsampled, original_points, points = downsample_series(series, spec, strategy, max_points)
+    if downsampled is series:
+        return result
+
+    logger.info(f"Downsampled report series with '{strategy}' from {original_points} to {points} points")
+    new_data = {**data, path: downsampled} if path else downsampled
+    meta = {
+        **(result.get("meta") or {}),
+        "downsampling": {
+            "strategy": strategy,
+            "max_points": max_points,
+            "original_points": original_points,
+            "points": points,
+        },
+    }
+    return {**result, "data": new_data, "meta": meta}
@@ -0,0 +1,180 @@
+"""
+Report Definitions Registry - in-memory snapshot of the report_definitions table.
+
+Definitions are loaded at startup into an immutable snapshot stamped with a version
+(max(updated_at) and row count). Lookups never touch the database. The snapshot is
+replaced wholesale when:
+- a worker receives a reload signal on the Redis pub/sub channel, or
+- the periodic version check sees max(updated_at)/count change.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from cache_utils import get_redis_client, register_pubsub_handler
+from database_reports import get_all_report_definitions
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class ReportRegistry:
+    """Immutable snapshot of report definitions keyed by report_id."""
+
+    def __init__(self, definitions: List[Dict[str, Any]], version: str):
+        self.definitions: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+            definition["report_id"]: MappingProxyType(definition) for definition in definitions
+        })
+        # Preserve the table's ORDER BY report_name for listings
+        self.ordered_ids: Tuple[str, ...] = tuple(definition["report_id"] for definition in definitions)
+        self.version = version
+        self.loaded_at = time.time()
+
+    def get(self, report_id: str) -> Optional[Mapping[str, Any]]:
+        return self.definitions.get(report_id)
+
+    def all(self) -> List[Mapping[str, Any]]:
+        return [self.definitions[report_id] for report_id in self.ordered_ids]
+
+
+_registry: Optional[ReportRegistry] = None
+_watcher_task: Optional[asyncio.Task] = None
+
+
+def _version_stamp(max_updated_at: Any, count: int) -> str:
+    return f"{max_updated_at.isoformat() if max_updated_at is not None else 'none'}:{count}"
+
+
+def get_report_definitions_version(conn: Connection) -> str:
+    """
+    Cheap version check of the report_definitions table.
+    
+    Returns:
+        Version stamp "<max(updated_at)>:<count>"
+    """
+    query = text(f"""
+        SELECT MAX(updated_at) AS max_updated_at, COUNT(*) AS definitions_count
+        FROM {config.REPORT_DEFINITIONS_TABLE}
+    """)
+    row = conn.execute(query).fetchone()
+    return _version_stamp(row[0], row[1])
+
+
+def load_report_registry(conn: Connection) -> ReportRegistry:
+    """
+    Load all report definitions into a new snapshot and make it current.
+    
+    Args:
+        conn: Database connection
+    
+    Returns:
+        The new registry snapshot
+    """
+    global _registry
+    definitions = get_all_report_definitions(conn)
+    version = _version_stamp(
+        max((d["updated_at"] for d in definitions if d.get("updated_at") is not None), default=None),
+        len(definitions),
+    )
+    _registry = ReportRegistry(definitions, version)
+    logger.info(f"📚 Report registry loaded: {len(definitions)} definitions (version {version})")
+    return _registry
+
+
+def refresh_report_registry_if_changed(conn: Connection) -> bool:
+    """
+    Reload the registry if the table's version stamp differs from the loaded one.
+    
+    Returns:
+        True if the registry was reloaded
+    """
+    version = get_report_definitions_version(conn)
+    if _registry is not None and _registry.version == version:
+        return False
+    load_report_registry(conn)
+    return True
+
+
+def get_report_registry() -> Optional[ReportRegistry]:
+    """Current registry snapshot, or None if it has not been loaded yet."""
+    return _registry
+
+
+def get_registered_report_definition(report_id: str) -> Optional[Mapping[str, Any]]:
+    """
+    Look up a report definition in memory.
+    
+    Returns:
+        Read-only definition, or None if the registry is not loaded or does not know the report
+        (callers fall back to database_reports.get_report_definition_by_id)
+    """
+    if _registry is None:
+        return None
+    return _registry.get(report_id)
+
+
+def publish_report_registry_reload() -> None:
+    """Ask every worker to reload its registry (call after report_definitions changes)."""
+    try:
+        client = get_redis_client()
+        if client:
+            client.publish(config.REPORT_REGISTRY_RELOAD_CHANNEL, json.dumps({"reload": True}))
+    except Exception as e:
+        logger.warning(f"Report registry reload publish error: {e}")
+
+
+def _handle_reload_message(message: dict) -> None:
+    """Pub/sub handler (listener thread): reload on the sync engine."""
+    from database_connection import get_db_engine
+    engine = get_db_engine()
+    if engine is None:
+        return
+    with engine.connect() as conn:
+        load_report_registry(conn)
+
+
+register_pubsub_handler(config.REPORT_REGISTRY_RELOAD_CHANNEL, _handle_reload_message)
+
+
+async def _watch_loop() -> None:
+    from database_connection import get_async_db_engine, run_sync_db
+    while True:
+        await asyncio.sleep(config.REPORT_REGISTRY_CHECK_INTERVAL_SECONDS)
+        try:
+            async_engine = get_async_db_engine()
+            if async_engine is None:
+                continue
+            async with async_engine.connect() as conn:
+                await run_sync_db(conn, refresh_report_registry_if_changed)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️  Report registry version check failed: {e}")
+
+
+def start_report_registry_watcher() -> None:
+    """Start the periodic version check (called at startup)."""
+    global _watcher_task
+    if _watcher_task is not None and not _watcher_task.done():
+        return
+    _watcher_task = asyncio.get_running_loop().create_task(_watch_loop())
+
+
+async def stop_report_registry_watcher() -> None:
+    """Cancel the periodic version check (called on shutdown)."""
+    global _watcher_task
+    if _watcher_task is None:
+        return
+    _watcher_task.cancel()
+    try:
+        await _watcher_task
+    except asyncio.CancelledError:
+        pass
+    _watcher_task = None
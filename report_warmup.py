@@ -0,0 +1,239 @@
+"""
+Report Cache Warm-up - keeps the most requested dashboard reports resolved.
+
+get_report_instance and the batch endpoint count every (report_id, filters, format)
+combination they serve that is not an in-process (L1) cache hit. Counts are kept in a
+per-worker Counter - no Redis round trip on the request path - and flushed to a Redis
+sorted set every REPORT_WARMUP_FLUSH_INTERVAL_SECONDS with pipelined ZINCRBYs.
+A background loop pre-resolves the top N combinations at startup and on a fixed
+interval, so the first dashboard load after a deploy or a Redis flush is not cold.
+Scores decay each cycle so the set follows current usage.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from cache_utils import CachedReport, get_redis_client, generate_cache_key, get_cached_report_entry, single_flight_report
+import config
+
+logger = logging.getLogger(__name__)
+
+# Redis keys
+POPULARITY_KEY = "report-warmup:popularity"  # Sorted set: member = {"report_id", "filters"[, "format"]} JSON, score = request count
+CYCLE_LOCK_KEY = "report-warmup:lock"  # Only one worker warms per interval
+
+_warmup_task: Optional[asyncio.Task] = None
+
+# Request counts not yet flushed to POPULARITY_KEY (member -> count)
+_pending_request_counts: "Counter[str]" = Counter()
+
+
+def record_report_request(report_id: str, filters: Dict[str, Any], result_format: str = "rows") -> None:
+    """
+    Count a request for a (report_id, filters, format) combination (in memory, flushed later).
+    
+    Args:
+        report_id: The report identifier
+        filters: Merged filters the report was resolved with
+        result_format: Result format the report was requested in
+    """
+    if not config.REPORT_WARMUP_ENABLED or not config.REDIS_ENABLED:
+        return
+    try:
+        tracked: Dict[str, Any] = {"report_id": report_id, "filters": filters}
+        if result_format != "rows":
+            tracked["format"] = result_format
+        _pending_request_counts[json.dumps(tracked, sort_keys=True, default=str)] += 1
+    except Exception as e:
+        logger.warning(f"Warm-up request tracking error for report {report_id}: {e}")
+
+
+def flush_report_request_counts() -> int:
+    """
+    Push this worker's pending request counts to the popularity set (one pipelined round trip).
+    
+    Returns:
+        Number of combinations flushed
+    """
+    global _pending_request_counts
+    if not _pending_request_counts:
+        return 0
+    pending, _pending_request_counts = _pending_request_counts, Counter()
+    try:
+        client = get_redis_client()
+        if not client:
+            return 0
+        pipe = client.pipeline(transaction=False)
+        for member, count in pending.items():
+            pipe.zincrby(POPULARITY_KEY, count, member)
+        pipe.execute()
+        return len(pending)
+    except Exception as e:
+        logger.warning(f"Warm-up request count flush error ({len(pending)} combinations dropped): {e}")
+        return 0
+
+
+def get_top_report_requests(limit: int) -> List[Tuple[str, Dict[str, Any], str]]:
+    """
+    Get the most requested (report_id, filters, format) combinations.
+    
+    Args:
+        limit: Maximum number of combinations to return
+    
+    Returns:
+        List of (report_id, filters, result_format), most requested first
+    """
+    client = get_redis_client()
+    if not client:
+        return []
+    
+    top: List[Tuple[str, Dict[str, Any], str]] = []
+    for member in client.zrevrange(POPULARITY_KEY, 0, limit - 1):
+        try:
+            entry = json.loads(member)
+            top.append((entry["report_id"], entry.get("filters") or {}, entry.get("format") or "rows"))
+        except (ValueError, KeyError):
+            client.zrem(POPULARITY_KEY, member)
+    return top
+
+
+def _decay_and_trim() -> None:
+    """Decay all scores and keep only the REPORT_WARMUP_TRACKED_MAX most requested combinations."""
+    client = get_redis_client()
+    if not client:
+        return
+    pipe = client.pipeline(transaction=False)
+    pipe.zunionstore(POPULARITY_KEY, {POPULARITY_KEY: config.REPORT_WARMUP_DECAY})
+    pipe.zremrangebyrank(POPULARITY_KEY, 0, -(config.REPORT_WARMUP_TRACKED_MAX + 1))
+    pipe.execute()
+
+
+async def _warm_one(report_id: str, filters: Dict[str, Any], result_format: str, semaphore: asyncio.Semaphore) -> str:
+    """
+    Resolve one combination into the cache unless a fresh entry already exists.
+    
+    Returns:
+        "fresh", "warmed", "skipped" or "failed"
+    """
+    # Imported here to avoid a circular import (reports_service records requests via this module)
+    from database_connection import async_db_connection
+    from reports_service import get_report_definition, resolve_and_cache_report
+    
+    cache_key = generate_cache_key(report_id, filters, result_format)
+    entry = get_cached_report_entry(cache_key, log_miss=False)
+    if entry is not None and not entry.is_stale:
+        return "fresh"
+    
+    async with semaphore:
+        try:
+            definition = await get_report_definition(report_id)
+            if not definition:
+                return "skipped"
+            
+            async def _resolve() -> CachedReport:
+                async with async_db_connection() as conn:
+                    return await resolve_and_cache_report(conn, report_id, definition, filters, cache_key, result_format=result_format)
+            
+            await single_flight_report(cache_key, _resolve)
+            return "warmed"
+        except Exception as e:
+            logger.warning(f"Warm-up failed for report {report_id} ({cache_key}): {e}")
+            return "failed"
+
+
+async def warm_report_cache(top_n: Optional[int] = None) -> Dict[str, int]:
+    """
+    Pre-resolve the most requested report combinations.
+    
+    At most REPORT_WARMUP_CONCURRENCY reports are resolved at a time so warm-up
+    never takes more than a few pooled connections away from live traffic.
+    
+    Args:
+        top_n: Number of combinations to warm (default: REPORT_WARMUP_TOP_N)
+    
+    Returns:
+        Count of combinations per outcome ("fresh", "warmed", "skipped", "failed")
+    """
+    limit = top_n if top_n is not None else config.REPORT_WARMUP_TOP_N
+    top = get_top_report_requests(limit)
+    outcome_counts = {"fresh": 0, "warmed": 0, "skipped": 0, "failed": 0}
+    if not top:
+        return outcome_counts
+    
+    started = time.monotonic()
+    semaphore = asyncio.Semaphore(config.REPORT_WARMUP_CONCURRENCY)
+    outcomes = await asyncio.gather(
+        *(_warm_one(report_id, filters, result_format, semaphore) for report_id, filters, result_format in top)
+    )
+    for outcome in outcomes:
+        outcome_counts[outcome] += 1
+    
+    logger.info(
+        f"🔥 Report cache warm-up: {outcome_counts['warmed']} warmed, {outcome_counts['fresh']} already fresh, "
+        f"{outcome_counts['skipped']} skipped, {outcome_counts['failed']} failed in {time.monotonic() - started:.2f}s"
+    )
+    return outcome_counts
+
+
+def _claim_cycle() -> bool:
+    """Claim this interval's warm-up for this worker (other workers skip it)."""
+    try:
+        client = get_redis_client()
+        if not client:
+            return False
+        lock_seconds = max(1, config.REPORT_WARMUP_INTERVAL_SECONDS - 1)
+        return bool(client.set(CYCLE_LOCK_KEY, "1", nx=True, ex=lock_seconds))
+    except Exception as e:
+        logger.warning(f"Warm-up lock error: {e}")
+        return False
+
+
+async def _warmup_loop() -> None:
+    await asyncio.sleep(config.REPORT_WARMUP_STARTUP_DELAY_SECONDS)
+    next_cycle = time.monotonic()
+    while True:
+        try:
+            # Every worker flushes its request counts; one worker per interval warms
+            flush_report_request_counts()
+            if time.monotonic() >= next_cycle:
+                next_cycle = time.monotonic() + config.REPORT_WARMUP_INTERVAL_SECONDS
+                if _claim_cycle():
+                    await warm_report_cache()
+                    _decay_and_trim()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️  Report cache warm-up cycle failed: {e}")
+        await asyncio.sleep(max(0.0, min(config.REPORT_WARMUP_FLUSH_INTERVAL_SECONDS, next_cycle - time.monotonic())))
+
+
+def start_report_warmup_scheduler() -> None:
+    """Start the warm-up loop (called at startup). No-op if disabled or already running."""
+    global _warmup_task
+    if not config.REPORT_WARMUP_ENABLED or not config.REDIS_ENABLED:
+        return
+    if _warmup_task is not None and not _warmup_task.done():
+        return
+    _warmup_task = asyncio.get_running_loop().create_task(_warmup_loop())
+    logger.info(
+        f"🔥 Report cache warm-up scheduled: top {config.REPORT_WARMUP_TOP_N} every "
+        f"{config.REPORT_WARMUP_INTERVAL_SECONDS}s (concurrency {config.REPORT_WARMUP_CONCURRENCY})"
+    )
+
+
+async def stop_report_warmup_scheduler() -> None:
+    """Cancel the warm-up loop (called on shutdown)."""
+    global _warmup_task
+    if _warmup_task is None:
+        return
+    _warmup_task.cancel()
+    try:
+        await _warmup_task
+    except asyncio.CancelledError:
+        pass
+    _warmup_task = None
+    flush_report_request_counts()
@@ -4,31 +4,62 @@ Reports Service - REST API endpoints for report metadata and resolved datasets.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, List
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, List
+import asyncio
+import hashlib
+import json
 import logging
+import time
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
-from sqlalchemy.engine import Connection
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Query
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from database_connection import get_db_connection
+from database_connection import get_async_db_connection, async_db_connection, run_sync_db
 from database_reports import (
     get_all_report_definitions,
     get_report_definition_by_id,
     resolve_report_data,
+    get_known_source_tables,
+    get_data_sources_for_tables,
+    get_report_ids_for_data_sources,
+    RESULT_FORMAT_ROWS,
+    SUPPORTED_RESULT_FORMATS,
 )
 from cache_utils import (
     generate_cache_key,
     get_cached_report,
+    get_cached_report_entry,
+    get_cached_report_entries,
+    is_report_cached_locally,
+    CachedReport,
     set_cached_report,
-    get_report_cache_ttl,
+    get_report_cache_ttls,
     invalidate_report_cache,
+    invalidate_report_caches,
+    single_flight_report,
+    schedule_report_refresh,
     get_redis_client,
 )
+from report_warmup import record_report_request
+from compression_middleware import accepts_encoding, available_encodings, encode_bytes
+from report_registry import (
+    get_report_registry,
+    get_registered_report_definition,
+    load_report_registry,
+    publish_report_registry_reload,
+)
 import config
 from config import get_jira_url
 
 reports_router = APIRouter()
 
+STORED_JIRA_URLS_KEPT = 4096  # Payload digests whose stored meta.jira_url is remembered
+
+# Payload digest -> meta.jira_url stored in that payload (so stored-body responses need not decode it)
+_stored_jira_urls: "OrderedDict[str, Optional[str]]" = OrderedDict()
+
 
 def _normalize_filter_value(value: Any) -> Any:
     if value is None:
@@ -105,14 +136,309 @@ def _normalize_multi_value(values: Optional[List[str] | str]) -> Optional[List[s
     return [str(values)]
 
 
+def _normalize_override_filters(raw_params: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """
+    Normalize request filters the same way for every endpoint, so equal filters share a cache key.
+
+    Comma-separated and repeated values are split and trimmed, single values collapse to a
+    scalar, empty values are dropped, and pi_name is an alias of pi_names.
+
+    Args:
+        raw_params: Values per filter key (repeated query parameters give several)
+
+    Returns:
+        Override filters for _merge_filters()
+    """
+    raw_params = dict(raw_params)
+    override_filters: Dict[str, Any] = {}
+
+    # Normalize multi-value parameters and aliases
+    def _assign_multi(target_key: str, *source_keys: str) -> None:
+        collected: List[Any] = []
+        for source_key in source_keys:
+            collected.extend(raw_params.pop(source_key, []))
+        normalized = _normalize_multi_value(collected or None)
+        if normalized:
+            override_filters[target_key] = normalized
+
+    _assign_multi("pi_names", "pi_names", "pi_name")
+
+    # Remaining parameters: collapse repeated values, trim whitespace
+    for key, values in raw_params.items():
+        normalized_values = _normalize_multi_value(values)
+        if not normalized_values:
+            continue
+        if len(normalized_values) == 1:
+            override_filters[key] = normalized_values[0]
+        else:
+            override_filters[key] = normalized_values
+
+    return override_filters
+
+
+def _normalize_body_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize filters from a JSON body like query parameters (non-string scalars keep their type)."""
+    raw_params: Dict[str, List[Any]] = {}
+    typed_filters: Dict[str, Any] = {}
+    for key, value in filters.items():
+        if isinstance(value, str):
+            raw_params[key] = [value]
+        elif isinstance(value, list):
+            raw_params[key] = value
+        elif value is not None:
+            typed_filters[key] = value
+    return {**_normalize_override_filters(raw_params), **typed_filters}
+
+
+async def resolve_and_cache_report(
+    conn: AsyncConnection,
+    report_id: str,
+    definition: Mapping[str, Any],
+    merged_filters: Dict[str, Any],
+    cache_key: str,
+    cache_ttl: Optional[int] = None,
+    result_format: str = RESULT_FORMAT_ROWS,
+) -> CachedReport:
+    """
+    Resolve a report's data, build the response payload and store it in the cache.
+    
+    Args:
+        conn: Database connection
+        report_id: Report identifier
+        definition: Report definition row
+        merged_filters: Defaults merged with request filters
+        cache_key: Key from generate_cache_key(report_id, merged_filters, result_format)
+        cache_ttl: Optional soft TTL override (seconds)
+        result_format: "rows" (list of row dicts) or "columnar" ({columns, values})
+    
+    Returns:
+        CachedReport whose payload is the report (definition, filters, result, meta),
+        as cache hits will return it
+    """
+    default_filters = definition.get("default_filters") or {}
+    try:
+        resolved_payload = await run_sync_db(
+            conn,
+            resolve_report_data,
+            definition["data_source"],
+            merged_filters,
+            result_format=result_format,
+            downsample=(definition.get("meta_schema") or {}).get("downsample"),
+        )
+    except KeyError as err:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Report '{report_id}' has unsupported data source: {err}",
+        ) from err
+    except ValueError as err:
+        raise HTTPException(status_code=400, detail=str(err)) from err
+    except HTTPException:
+        # Re-raise HTTP exceptions as-is (they already have proper status codes)
+        raise
+    except Exception as err:
+        # Log the full error for debugging, especially for URL encoding issues
+        logger = logging.getLogger(__name__)
+        logger.error(f"Failed to resolve report '{report_id}': {type(err).__name__}: {err}", exc_info=True)
+        logger.error(f"Filters used: {merged_filters}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to resolve report '{report_id}': {type(err).__name__}: {str(err)}",
+        ) from err
+
+    response_payload = {
+        "definition": {
+            "report_id": definition["report_id"],
+            "report_name": definition["report_name"],
+            "chart_type": definition["chart_type"],
+            "description": definition.get("description"),
+            "data_source": definition.get("data_source"),
+            "default_filters": default_filters,
+            "meta_schema": definition.get("meta_schema"),
+        },
+        "filters": merged_filters,
+        "result": resolved_payload.get("data"),
+        "meta": resolved_payload.get("meta", {}),
+    }
+
+    # Add JIRA URL to metadata (will retry from DB if null)
+    jira_settings = await run_sync_db(conn, get_jira_url)
+    if jira_settings.get("url"):
+        response_payload["meta"]["jira_url"] = jira_settings["url"]
+
+    # Soft TTL: custom if provided, otherwise smart default; hard TTL leaves room to serve stale
+    soft_ttl, hard_ttl = get_report_cache_ttls(report_id, cache_ttl)
+    
+    # Cache the result before returning
+    entry = set_cached_report(cache_key, response_payload, ttl=hard_ttl, soft_ttl=soft_ttl)
+    if entry is None:
+        # Not cacheable - serve the payload as resolved
+        entry = CachedReport(response_payload, time.time(), soft_ttl)
+    elif entry.digest:
+        _remember_stored_jira_url(entry.digest, response_payload["meta"].get("jira_url"))
+    return entry
+
+
+def _schedule_report_refresh(
+    report_id: str,
+    definition: Dict[str, Any],
+    merged_filters: Dict[str, Any],
+    cache_key: str,
+    cache_ttl: Optional[int] = None,
+    result_format: str = RESULT_FORMAT_ROWS,
+) -> None:
+    """Re-resolve a stale report in the background on its own pooled connection."""
+    async def _refresh() -> None:
+        async with async_db_connection() as refresh_conn:
+            await resolve_and_cache_report(
+                refresh_conn, report_id, definition, merged_filters, cache_key, cache_ttl, result_format
+            )
+
+    schedule_report_refresh(cache_key, _refresh)
+
+
+def _with_jira_url(payload: Dict[str, Any], jira_url: Optional[str]) -> Dict[str, Any]:
+    """Add the JIRA URL to a cached payload's meta (cached payloads are shared, so copy first)."""
+    if not jira_url or "meta" not in payload:
+        return payload
+    return {**payload, "meta": {**payload["meta"], "jira_url": jira_url}}
+
+
+def _remember_stored_jira_url(digest: str, jira_url: Optional[str]) -> None:
+    _stored_jira_urls[digest] = jira_url
+    _stored_jira_urls.move_to_end(digest)
+    while len(_stored_jira_urls) > STORED_JIRA_URLS_KEPT:
+        _stored_jira_urls.popitem(last=False)
+
+
+def _stored_jira_url(entry: CachedReport) -> Optional[str]:
+    """
+    The JIRA URL stored in an entry's meta. Remembered per payload digest, so entries whose
+    payload has not been decoded (stored-body responses) are only decoded once per worker.
+    """
+    if entry.digest and entry.digest in _stored_jira_urls:
+        _stored_jira_urls.move_to_end(entry.digest)
+        return _stored_jira_urls[entry.digest]
+    meta = entry.payload.get("meta")
+    jira_url = meta.get("jira_url") if isinstance(meta, dict) else None
+    if entry.digest:
+        _remember_stored_jira_url(entry.digest, jira_url)
+    return jira_url
+
+
+def _report_etag(entry: CachedReport, jira_url: Optional[str]) -> Optional[str]:
+    """
+    Weak ETag for a cached report: the stored payload digest, combined with the JIRA URL
+    added at response time. Weak because the response envelope also carries per-request
+    fields (message, cached, stale, age_seconds) that are not part of the digest.
+    None for entries written before digests were stored.
+    """
+    if not entry.digest:
+        return None
+    if not jira_url:
+        return f'W/"{entry.digest}"'
+    return f'W/"{hashlib.blake2b(f"{entry.digest}:{jira_url}".encode(), digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison (RFC 9110), so W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def _stored_body_response(
+    entry: CachedReport,
+    jira_url: Optional[str],
+    fields: Dict[str, Any],
+    accept_encoding: Optional[str],
+    etag: Optional[str],
+) -> Optional[Response]:
+    """
+    Build the report response around the stored cache body instead of re-serializing the payload.
+
+    The envelope is written around the stored JSON bytes. A zstd body the client accepts is sent
+    as-is between two small zstd frames (concatenated frames decode as one stream), so the cached
+    report is never decompressed or recompressed. Returns None when the stored body cannot be
+    used (other codecs, or the JIRA URL differs from the one stored in meta).
+    """
+    if entry.body is None:
+        return None
+    if jira_url and _stored_jira_url(entry) != jira_url:
+        return None
+
+    prefix = b'{"success":true,"data":'
+    suffix = b"," + json.dumps(fields, separators=(",", ":"), ensure_ascii=False).encode()[1:]
+    headers = {"Cache-Control": "no-cache", "ETag": etag} if etag else {}
+
+    if entry.body_encoding == "identity":
+        return Response(content=prefix + entry.body + suffix, media_type="application/json", headers=headers)
+
+    if entry.body_encoding == "zstd" and "zstd" in available_encodings() and accepts_encoding(accept_encoding, "zstd"):
+        headers["Content-Encoding"] = "zstd"
+        headers["Vary"] = "Accept-Encoding"
+        content = encode_bytes(prefix, "zstd") + entry.body + encode_bytes(suffix, "zstd")
+        return Response(content=content, media_type="application/json", headers=headers)
+
+    return None
+
+
+def _validate_result_format(result_format: str) -> None:
+    if result_format not in SUPPORTED_RESULT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported format '{result_format}' (expected one of: {', '.join(SUPPORTED_RESULT_FORMATS)})",
+        )
+
+
+def _definition_summary(definition: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "report_id": definition["report_id"],
+        "report_name": definition["report_name"],
+        "chart_type": definition["chart_type"],
+        "description": definition.get("description"),
+        "data_source": definition.get("data_source"),
+        "default_filters": definition.get("default_filters"),
+        "meta_schema": definition.get("meta_schema"),
+    }
+
+
+async def get_report_definition(report_id: str) -> Optional[Mapping[str, Any]]:
+    """
+    Look up a report definition in the in-memory registry, falling back to the database
+    (registry not loaded yet, or a definition added since the last reload).
+    """
+    definition = get_registered_report_definition(report_id)
+    if definition is not None:
+        return definition
+    async with async_db_connection() as conn:
+        return await run_sync_db(conn, get_report_definition_by_id, report_id)
+
+
 @reports_router.get("/reports")
 async def list_reports(
-    conn: Connection = Depends(get_db_connection),
     bypass_cache: Optional[bool] = Query(False, description="Skip cache lookup"),
 ):
     """
     Return all available report definitions.
     """
+    # Serve from the in-memory registry when loaded (no Redis or DB round trip)
+    registry = get_report_registry()
+    if registry is not None and not bypass_cache:
+        summaries = [_definition_summary(definition) for definition in registry.all()]
+        return {
+            "success": True,
+            "data": summaries,
+            "count": len(summaries),
+            "message": f"Retrieved {len(summaries)} report definitions",
+            "cached": True,
+            "version": registry.version,
+        }
+
     # Try cache first (definitions change rarely, so use a long TTL)
     cache_key = "report:definitions:all"
     
@@ -127,19 +453,9 @@ async def list_reports(
                 "cached": True,
             }
     
-    definitions = get_all_report_definitions(conn)
-    summaries = [
-        {
-            "report_id": definition["report_id"],
-            "report_name": definition["report_name"],
-            "chart_type": definition["chart_type"],
-            "description": definition.get("description"),
-            "data_source": definition.get("data_source"),
-            "default_filters": definition.get("default_filters"),
-            "meta_schema": definition.get("meta_schema"),
-        }
-        for definition in definitions
-    ]
+    async with async_db_connection() as conn:
+        definitions = await run_sync_db(conn, get_all_report_definitions)
+    summaries = [_definition_summary(definition) for definition in definitions]
 
     response_data = {
         "data": summaries,
@@ -163,10 +479,11 @@ async def list_reports(
 async def get_report_instance(
     report_id: str,
     request: Request,
-    conn: Connection = Depends(get_db_connection),
+    response: Response,
     # Cache control parameters
     cache_ttl: Optional[int] = Query(None, description="Cache TTL in seconds (overrides default)"),
     bypass_cache: Optional[bool] = Query(False, description="Skip cache lookup"),
+    result_format: str = Query(RESULT_FORMAT_ROWS, alias="format", description="Result format: rows (default) or columnar"),
     # Dynamically accept all possible filters
     team_name: Optional[str] = Query(None),
     issue_type: Optional[str] = Query(None),
@@ -189,6 +506,9 @@ async def get_report_instance(
     """
     Resolve a specific report by ID, merging defaults with provided filters.
     
+    format=columnar returns row lists as {"columns": [...], "values": {column: [...]}}
+    (column names once instead of on every row).
+    
     Available report IDs (copy/paste for testing):
     - team-sprint-burndown
     - team-current-sprint-progress
@@ -211,127 +531,261 @@ async def get_report_instance(
     - wip-over-time
     - cycle-time-over-time
     """
-    definition = get_report_definition_by_id(report_id, conn)
+    definition = await get_report_definition(report_id)
     if not definition:
         raise HTTPException(status_code=404, detail=f"Report '{report_id}' not found")
+    _validate_result_format(result_format)
 
     default_filters = definition.get("default_filters") or {}
-    override_filters: Dict[str, Any] = {}
-
-    # Handle boolean parameter directly (FastAPI converts it)
-    if isGroup is not None:
-        override_filters["isGroup"] = isGroup
 
     # Gather all values for each query parameter
     # FastAPI automatically decodes URL-encoded values from query strings
     # Values like "AutoDesign%20Dev%2BTest" are automatically decoded to "AutoDesign Dev+Test"
     raw_params: Dict[str, List[str]] = {}
     for key, value in request.query_params.multi_items():
-        # Skip isGroup as it's already handled above
-        if key.lower() == "isgroup":
+        # Skip isGroup as it's already handled above, and format (not a filter)
+        if key.lower() in ("isgroup", "format"):
             continue
         # FastAPI's request.query_params already decodes URL-encoded values
         # Special characters like + (encoded as %2B) are properly decoded
         raw_params.setdefault(key, []).append(value)
 
-    # Normalize multi-value parameters and aliases
-    def _assign_multi(target_key: str, *source_keys: str) -> None:
-        collected: List[str] = []
-        for source_key in source_keys:
-            collected.extend(raw_params.pop(source_key, []))
-        normalized = _normalize_multi_value(collected or None)
-        if normalized:
-            override_filters[target_key] = normalized
-
-    _assign_multi("pi_names", "pi_names", "pi_name")
+    override_filters = _normalize_override_filters(raw_params)
 
-    # Remaining parameters: collapse repeated values, trim whitespace
-    for key, values in raw_params.items():
-        normalized_values = _normalize_multi_value(values)
-        if not normalized_values:
-            continue
-        if len(normalized_values) == 1:
-            override_filters[key] = normalized_values[0]
-        else:
-            override_filters[key] = normalized_values
+    # Handle boolean parameter directly (FastAPI converts it)
+    if isGroup is not None:
+        override_filters["isGroup"] = isGroup
 
     merged_filters = _merge_filters(default_filters, override_filters)
 
     # Ensure required filters present
     _validate_required_filters(definition, merged_filters)
 
-    # Generate cache key from report_id and merged filters
-    cache_key = generate_cache_key(report_id, merged_filters)
+    # Generate cache key from report_id, merged filters and result format
+    cache_key = generate_cache_key(report_id, merged_filters, result_format)
+
+    # Count this combination for the cache warm-up scheduler (L1 hits need no warming)
+    if bypass_cache or not is_report_cached_locally(cache_key):
+        record_report_request(report_id, merged_filters, result_format)
+    
+    if_none_match = request.headers.get("if-none-match")
     
     # Try cache first (unless bypassed)
     if not bypass_cache:
-        cached_data = get_cached_report(cache_key)
-        if cached_data:
-            # Add JIRA URL to cached response metadata (will retry if null)
-            jira_settings = get_jira_url(conn=conn)
-            if jira_settings.get("url") and "meta" in cached_data:
-                cached_data["meta"]["jira_url"] = jira_settings["url"]
+        cached_entry = get_cached_report_entry(cache_key)
+        if cached_entry is not None:
+            # Add JIRA URL to cached response metadata (in-memory; the DB retry happens on cache misses)
+            jira_url = get_jira_url().get("url")
             
-            return {
-                "success": True,
-                "data": cached_data,
-                "message": f"Retrieved report '{report_id}' (cached)",
+            # Past the soft TTL: serve it now and refresh in the background
+            stale = cached_entry.is_stale
+            if stale:
+                _schedule_report_refresh(report_id, definition, merged_filters, cache_key, cache_ttl, result_format)
+            
+            # Conditional GET: the client already has this exact data
+            etag = _report_etag(cached_entry, jira_url)
+            if etag:
+                if _etag_matches(if_none_match, etag):
+                    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+                response.headers["ETag"] = etag
+                response.headers["Cache-Control"] = "no-cache"
+            
+            age_seconds = cached_entry.age_seconds
+            fields = {
+                "message": f"Retrieved report '{report_id}' (cached{', stale' if stale else ''})",
                 "cached": True,
+                "stale": stale,
+                "age_seconds": round(age_seconds, 1) if age_seconds is not None else None,
             }
+            stored_response = _stored_body_response(cached_entry, jira_url, fields, request.headers.get("accept-encoding"), etag)
+            if stored_response is not None:
+                return stored_response
+            return {"success": True, "data": _with_jira_url(cached_entry.payload, jira_url), **fields}
+
+    async def _resolve() -> CachedReport:
+        # A pooled connection is only checked out on a cache miss
+        async with async_db_connection() as conn:
+            return await resolve_and_cache_report(
+                conn, report_id, definition, merged_filters, cache_key, cache_ttl, result_format
+            )
+
+    if bypass_cache:
+        entry, served_from_cache = await _resolve(), False
+    else:
+        # Only one resolver per cache key - concurrent misses (in any worker) share its result
+        entry, served_from_cache = await single_flight_report(cache_key, _resolve)
+
+    # Re-resolved data may be identical to what the client holds (e.g. after expiry)
+    etag = _report_etag(entry, _stored_jira_url(entry))
+    if etag:
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+
+    fields = {
+        "message": f"Retrieved report '{report_id}'" + (" (cached)" if served_from_cache else ""),
+        "cached": served_from_cache,
+        "stale": False,
+        "age_seconds": 0.0,
+    }
+    stored_response = _stored_body_response(entry, None, fields, request.headers.get("accept-encoding"), etag)
+    if stored_response is not None:
+        return stored_response
+    return {"success": True, "data": entry.payload, **fields}
 
-    try:
-        resolved_payload = resolve_report_data(definition["data_source"], merged_filters, conn)
-    except KeyError as err:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Report '{report_id}' has unsupported data source: {err}",
-        ) from err
-    except ValueError as err:
-        raise HTTPException(status_code=400, detail=str(err)) from err
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is (they already have proper status codes)
-        raise
-    except Exception as err:
-        # Log the full error for debugging, especially for URL encoding issues
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to resolve report '{report_id}': {type(err).__name__}: {err}", exc_info=True)
-        logger.error(f"Filters used: {merged_filters}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to resolve report '{report_id}': {type(err).__name__}: {str(err)}",
-        ) from err
 
-    response_payload = {
-        "definition": {
-            "report_id": definition["report_id"],
-            "report_name": definition["report_name"],
-            "chart_type": definition["chart_type"],
-            "description": definition.get("description"),
-            "data_source": definition.get("data_source"),
-            "default_filters": default_filters,
-            "meta_schema": definition.get("meta_schema"),
-        },
-        "filters": merged_filters,
-        "result": resolved_payload.get("data"),
-        "meta": resolved_payload.get("meta", {}),
-    }
+class BatchReportItem(BaseModel):
+    report_id: str = Field(..., description="Report ID")
+    filters: Dict[str, Any] = Field(default_factory=dict, description="Report-specific filters (override shared filters)")
+    format: Optional[str] = Field(None, description="Result format for this report (overrides the batch format)")
 
-    # Add JIRA URL to metadata (will retry from DB if null)
-    jira_settings = get_jira_url(conn=conn)
-    if jira_settings.get("url"):
-        response_payload["meta"]["jira_url"] = jira_settings["url"]
 
-    # Determine TTL: use custom if provided, otherwise use smart default
-    ttl = cache_ttl if cache_ttl is not None else get_report_cache_ttl(report_id)
+class BatchReportRequest(BaseModel):
+    reports: List[BatchReportItem] = Field(..., description="Reports to resolve")
+    filters: Dict[str, Any] = Field(default_factory=dict, description="Shared top-bar filters applied to every report")
+    cache_ttl: Optional[int] = Field(None, description="Cache TTL in seconds (overrides default)")
+    format: str = Field(RESULT_FORMAT_ROWS, description="Result format: rows (default) or columnar")
+
+
+@reports_router.post("/reports/batch")
+async def get_reports_batch(request: BatchReportRequest):
+    """
+    Resolve many reports in one request.
     
-    # Cache the result before returning
-    set_cached_report(cache_key, response_payload, ttl=ttl)
+    Filters are merged per report: definition defaults < shared filters < report filters.
+    Cache hits are read in a single Redis round trip; misses are resolved concurrently
+    (at most REPORT_BATCH_MAX_CONCURRENCY at a time). Each report gets its own status,
+    so one failing report does not fail the batch.
+    
+    Example body:
+        {"filters": {"team_name": "Team A"},
+         "reports": [{"report_id": "team-sprint-burndown"}, {"report_id": "wip-over-time", "filters": {"months": 3}}],
+         "format": "columnar"}
+    
+    Returns:
+        One result per requested report, in request order:
+        {report_id, status ("ok" | "not_found" | "error"), data, cached, stale, age_seconds, status_code, error}
+    """
+    if len(request.reports) > config.REPORT_BATCH_MAX_REPORTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many reports in batch ({len(request.reports)}), maximum is {config.REPORT_BATCH_MAX_REPORTS}",
+        )
 
+    results: List[Dict[str, Any]] = [{} for _ in request.reports]
+    # (index, report_id, definition, merged_filters, result_format, cache_key) for reports that passed validation
+    prepared: List[tuple] = []
+
+    for index, item in enumerate(request.reports):
+        definition = await get_report_definition(item.report_id)
+        if not definition:
+            results[index] = {
+                "report_id": item.report_id,
+                "status": "not_found",
+                "status_code": 404,
+                "error": f"Report '{item.report_id}' not found",
+            }
+            continue
+
+        # Same normalization and aliases as the GET endpoint, so both share cache entries
+        merged_filters = _merge_filters(
+            definition.get("default_filters") or {},
+            {**_normalize_body_filters(request.filters), **_normalize_body_filters(item.filters)},
+        )
+        result_format = item.format or request.format
+        try:
+            _validate_result_format(result_format)
+            _validate_required_filters(definition, merged_filters)
+        except HTTPException as err:
+            results[index] = {
+                "report_id": item.report_id,
+                "status": "error",
+                "status_code": err.status_code,
+                "error": err.detail,
+            }
+            continue
+
+        cache_key = generate_cache_key(item.report_id, merged_filters, result_format)
+        if not is_report_cached_locally(cache_key):
+            record_report_request(item.report_id, merged_filters, result_format)
+        prepared.append((index, item.report_id, definition, merged_filters, result_format, cache_key))
+
+    # Cache hits: one round trip for the whole batch
+    cached_entries = get_cached_report_entries([cache_key for *_, cache_key in prepared])
+    jira_url = get_jira_url().get("url")
+    misses = []
+    for (index, report_id, definition, merged_filters, result_format, cache_key), cached_entry in zip(prepared, cached_entries):
+        if cached_entry is None:
+            misses.append((index, report_id, definition, merged_filters, result_format, cache_key))
+            continue
+
+        stale = cached_entry.is_stale
+        if stale:
+            _schedule_report_refresh(report_id, definition, merged_filters, cache_key, request.cache_ttl, result_format)
+        age_seconds = cached_entry.age_seconds
+        results[index] = {
+            "report_id": report_id,
+            "status": "ok",
+            "data": _with_jira_url(cached_entry.payload, jira_url),
+            "cached": True,
+            "stale": stale,
+            "age_seconds": round(age_seconds, 1) if age_seconds is not None else None,
+        }
+
+    # Cache misses: resolve concurrently, one pooled connection each, de-duplicated per cache key
+    semaphore = asyncio.Semaphore(config.REPORT_BATCH_MAX_CONCURRENCY)
+
+    async def _resolve_miss(
+        index: int,
+        report_id: str,
+        definition: Mapping[str, Any],
+        merged_filters: Dict[str, Any],
+        result_format: str,
+        cache_key: str,
+    ) -> None:
+        async def _resolve() -> CachedReport:
+            async with async_db_connection() as conn:
+                return await resolve_and_cache_report(
+                    conn, report_id, definition, merged_filters, cache_key, request.cache_ttl, result_format
+                )
+
+        async with semaphore:
+            try:
+                entry, served_from_cache = await single_flight_report(cache_key, _resolve)
+                results[index] = {
+                    "report_id": report_id,
+                    "status": "ok",
+                    "data": entry.payload,
+                    "cached": served_from_cache,
+                    "stale": False,
+                    "age_seconds": 0.0,
+                }
+            except HTTPException as err:
+                results[index] = {
+                    "report_id": report_id,
+                    "status": "error",
+                    "status_code": err.status_code,
+                    "error": err.detail,
+                }
+            except Exception as err:
+                logging.getLogger(__name__).error(f"Batch resolve failed for report '{report_id}': {type(err).__name__}: {err}")
+                results[index] = {
+                    "report_id": report_id,
+                    "status": "error",
+                    "status_code": 500,
+                    "error": f"Failed to resolve report '{report_id}': {type(err).__name__}: {str(err)}",
+                }
+
+    if misses:
+        await asyncio.gather(*(_resolve_miss(*miss) for miss in misses))
+
+    ok_count = sum(1 for result in results if result.get("status") == "ok")
     return {
         "success": True,
-        "data": response_payload,
-        "message": f"Retrieved report '{report_id}'",
-        "cached": False,
+        "data": results,
+        "count": len(results),
+        "message": f"Resolved {ok_count}/{len(results)} reports ({len(prepared) - len(misses)} cached)",
     }
 
 
@@ -366,6 +820,72 @@ async def invalidate_cache(report_id: Optional[str] = Query(None)):
     }
 
 
+class ETLCompletionRequest(BaseModel):
+    tables: List[str] = Field(..., description="Tables refreshed by the ETL run (e.g. jira_issues, jira_sprints, jira_issue_history)")
+
+
+@reports_router.post("/reports/cache/invalidate/etl")
+async def invalidate_cache_for_etl(
+    request: ETLCompletionRequest,
+    conn: AsyncConnection = Depends(get_async_db_connection),
+):
+    """
+    ETL-completion hook: invalidate only the reports whose data source reads a refreshed table.
+    
+    Args:
+        request: Tables refreshed by the ETL run (schema prefix optional)
+    
+    Returns:
+        Success status, affected data sources and report IDs, and count of invalidated entries.
+    
+    Example:
+        - POST /reports/cache/invalidate/etl  {"tables": ["jira_issues", "jira_sprints"]}
+    """
+    known_tables = set(get_known_source_tables())
+    unknown_tables = [table for table in request.tables if table.strip().lower().removeprefix("public.") not in known_tables]
+    
+    data_sources = get_data_sources_for_tables(request.tables)
+    report_ids = await run_sync_db(conn, get_report_ids_for_data_sources, data_sources)
+    
+    # One keyspace scan and one broadcast for all affected reports
+    count = invalidate_report_caches(report_ids)
+    
+    logging.getLogger(__name__).info(
+        f"ETL invalidation for tables {request.tables}: {len(report_ids)} reports, {count} cache entries"
+    )
+    
+    return {
+        "success": True,
+        "message": f"Invalidated {count} cache entries for {len(report_ids)} reports",
+        "count": count,
+        "tables": request.tables,
+        "unknown_tables": unknown_tables,
+        "data_sources": data_sources,
+        "report_ids": report_ids,
+    }
+
+
+@reports_router.post("/reports/definitions/reload")
+async def reload_report_definitions(conn: AsyncConnection = Depends(get_async_db_connection)):
+    """
+    Reload the in-memory report definitions registry in every worker.
+    Call after changing rows in report_definitions.
+    
+    Returns:
+        Success status, number of definitions and the new version stamp.
+    """
+    registry = await run_sync_db(conn, load_report_registry)
+    publish_report_registry_reload()
+    invalidate_report_cache("definitions")
+    
+    return {
+        "success": True,
+        "message": f"Reloaded {len(registry.definitions)} report definitions",
+        "count": len(registry.definitions),
+        "version": registry.version,
+    }
+
+
 @reports_router.get("/reports/cache/stats")
 async def get_cache_stats():
     """
@@ -9,6 +9,7 @@ from fastapi import HTTPException
 from typing import Optional, Dict, Any, List
 import logging
 import config
+from http_clients import post_to_endpoint
 
 logger = logging.getLogger(__name__)
 
@@ -50,19 +51,18 @@ async def call_sparksai_sql_execute(
     logger.debug(f"Payload keys: {list(payload.keys())}")
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:  # Longer timeout for SQL generation and execution
-            response = await client.post(sql_service_url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            
-            # Log response summary
-            if result.get("success"):
-                data = result.get("data", {})
-                logger.info(f"SparksAI-SQL service returned: status={data.get('status')}, sql_length={len(data.get('sql', ''))}, results_count={len(data.get('results', []))}")
-            else:
-                logger.warning(f"SparksAI-SQL service returned error: {result.get('data', {}).get('error', 'Unknown error')}")
-            
-            return result
+        response = await post_to_endpoint("sql_execute", json=payload)  # Longer timeout for SQL generation and execution
+        response.raise_for_status()
+        result = response.json()
+        
+        # Log response summary
+        if result.get("success"):
+            data = result.get("data", {})
+            logger.info(f"SparksAI-SQL service returned: status={data.get('status')}, sql_length={len(data.get('sql', ''))}, results_count={len(data.get('results', []))}")
+        else:
+            logger.warning(f"SparksAI-SQL service returned error: {result.get('data', {}).get('error', 'Unknown error')}")
+        
+        return result
             
     except httpx.HTTPStatusError as e:
         logger.error(f"SparksAI-SQL service HTTP error: {e.response.status_code} - {e.response.text}")
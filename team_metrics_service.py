@@ -8,10 +8,11 @@ Uses FastAPI dependencies for clean connection management and SQL injection prot
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
 from typing import Dict, Any, Optional
 from datetime import date, datetime
 import logging
-from database_connection import get_db_connection
+from database_connection import get_async_db_connection, run_sync_db
 from database_team_metrics import (
     get_team_avg_sprint_metrics,
     get_team_count_in_progress,
@@ -296,7 +297,7 @@ async def get_avg_sprint_metrics(
     team_name: str = Query(..., description="Team name or group name (if isGroup=true)"),
     sprint_count: int = Query(5, description="Number of sprints to average (default: 5, max: 20)", ge=1, le=20),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get average sprint metrics for a specific team or group.
@@ -326,10 +327,10 @@ async def get_avg_sprint_metrics(
             validated_name = validate_team_name(team_name)
         
         # Resolve team names using shared helper function (same as other endpoints)
-        team_names_list = resolve_team_names_from_filter(validated_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, validated_name, isGroup)
         
         # Get raw metrics data from database function (team-by-team rows)
-        raw_data = get_team_avg_sprint_metrics(validated_sprint_count, team_names_list, conn)
+        raw_data = await run_sync_db(conn, get_team_avg_sprint_metrics, validated_sprint_count, team_names_list)
         
         # Calculate averages from all rows
         # Velocity: average of completed issues count per sprint
@@ -461,7 +462,7 @@ async def get_avg_sprint_metrics(
 async def get_count_in_progress(
     team_name: str = Query(..., description="Team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get count of issues currently in progress for a team or group with breakdown by issue type.
@@ -486,10 +487,10 @@ async def get_count_in_progress(
             validated_name = validate_team_name(team_name)
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(validated_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, validated_name, isGroup)
         
         # Get count breakdown from database function
-        count_data = get_team_count_in_progress(team_names_list, conn)
+        count_data = await run_sync_db(conn, get_team_count_in_progress, team_names_list)
         
         # Build response data
         response_data = {
@@ -526,7 +527,7 @@ async def get_count_in_progress(
 async def get_current_sprint_progress(
     team_name: str = Query(..., description="Team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get current sprint progress for a team or group with detailed breakdown.
@@ -562,10 +563,10 @@ async def get_current_sprint_progress(
             validated_name = validate_team_name(team_name)
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(validated_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, validated_name, isGroup)
         
         # Get sprint progress data from database function
-        progress_data = get_team_current_sprint_progress(team_names_list, conn)
+        progress_data = await run_sync_db(conn, get_team_current_sprint_progress, team_names_list)
         
         # Calculate status indicators based on aggregated data
         percent_completed_status = get_percent_completed_status(
@@ -634,7 +635,7 @@ async def get_sprint_burndown_data(
     issue_type: str = Query("all", description="Issue type filter (default: 'all')"),
     sprint_name: str = Query(None, description="Sprint name (optional, will auto-select ACTIVE Sprint if not provided)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get sprint burndown data for a specific team or group.
@@ -659,7 +660,7 @@ async def get_sprint_burndown_data(
             issue_type = "all"
         
         # Use shared helper for sprint selection
-        sprint_selection = select_sprint_for_teams(team_name, isGroup, sprint_name, conn)
+        sprint_selection = await run_sync_db(conn, select_sprint_for_teams, team_name, isGroup, sprint_name)
         team_names_list = sprint_selection['team_names_list']
         selected_sprint_name = sprint_selection['selected_sprint_name']
         selected_sprint_id = sprint_selection['selected_sprint_id']
@@ -676,7 +677,7 @@ async def get_sprint_burndown_data(
             }
         
         # Get burndown data for selected sprint
-        burndown_data = get_sprint_burndown_data_db(team_names_list, selected_sprint_name, issue_type, conn)
+        burndown_data = await run_sync_db(conn, get_sprint_burndown_data_db, team_names_list, selected_sprint_name, issue_type)
         
         # Calculate total issues in sprint and get start/end dates
         # Use dates from sprint selection first, fall back to burndown_data if needed
@@ -733,7 +734,7 @@ async def get_sprint_burndown_data(
 async def get_sprints(
     team_name: str = Query(..., description="Team name to get sprints for"),
     sprint_status: str = Query(None, description="Sprint status filter (optional: 'active', 'closed', or leave empty for all)"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get list of sprints for a specific team with total issues count.
@@ -754,7 +755,7 @@ async def get_sprints(
             raise HTTPException(status_code=400, detail="Sprint status must be 'active' or 'closed'")
         
         # Get sprints from database function
-        sprints = get_sprints_with_total_issues_db(validated_team_name, sprint_status, conn)
+        sprints = await run_sync_db(conn, get_sprints_with_total_issues_db, validated_team_name, sprint_status)
         
         return {
             "success": True,
@@ -880,7 +881,7 @@ async def get_closed_sprints(
     months: int = Query(3, description="Number of months to look back (1, 2, 3, 4, 6, 9)", ge=1, le=12),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     issue_type: Optional[str] = Query(None, description="Issue type filter (optional, e.g., 'Story', 'Bug', 'Task')"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get closed sprints data for a specific team(s) or group with detailed completion metrics.
@@ -916,7 +917,7 @@ async def get_closed_sprints(
             )
         
         # Resolve team names using shared helper function (handles single team, group, or None)
-        team_names_list = resolve_team_names_from_filter(team_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, team_name, isGroup)
         
         # Build filter description for logging and response
         filter_description = None
@@ -933,7 +934,7 @@ async def get_closed_sprints(
                 filter_description = f"team '{validated_name}'"
         
         # Get closed sprints from database function (supports multiple teams)
-        closed_sprints_all = get_closed_sprints_data_db(team_names_list if team_names_list else None, months, issue_type=issue_type, conn=conn)
+        closed_sprints_all = await run_sync_db(conn, get_closed_sprints_data_db, team_names_list if team_names_list else None, months, issue_type=issue_type)
         
         # Group closed sprints by team_name
         sprints_by_team = {}
@@ -994,7 +995,7 @@ async def get_sprint_velocity_advanced(
     months: int = Query(3, description="Number of months to look back (1, 2, 3, 4, 6, 9)", ge=1, le=12),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     issue_type: Optional[str] = Query(None, description="Issue type filter (optional, e.g., 'Story', 'Bug', 'Task')"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get closed sprints data sorted by start date (ascending) and team name (ascending) in a flat structure.
@@ -1017,7 +1018,7 @@ async def get_sprint_velocity_advanced(
         JSON response with closed sprints as flat array sorted by start_date ASC, team_name ASC
     """
     try:
-        result = _fetch_closed_sprints_flat(team_name, isGroup, months, issue_type, conn, sort_by="advanced")
+        result = await run_sync_db(conn, _fetch_closed_sprints_flat, team_name, isGroup, months, issue_type, sort_by="advanced")
         
         return {
             "success": True,
@@ -1042,7 +1043,7 @@ async def get_issues_trend(
     months: int = Query(6, description="Number of months to look back (1, 2, 3, 4, 6, 9, 12)", ge=1, le=12),
     issue_type: str = Query("all", description="Issue type filter (default: 'all')"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get issues created and resolved over time for a specific team(s) or group.
@@ -1087,10 +1088,10 @@ async def get_issues_trend(
             validated_name = validate_team_name(team_name)
         
         # Resolve team names using shared helper function
-        team_names_list = resolve_team_names_from_filter(validated_name, isGroup, conn)
+        team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, validated_name, isGroup)
         
         # Get issues trend data from database function (now accepts list of team names)
-        trend_data = get_issues_trend_data_db(team_names_list, months, issue_type, conn)
+        trend_data = await run_sync_db(conn, get_issues_trend_data_db, team_names_list, months, issue_type)
         
         # Build response data
         response_data = {
@@ -1131,7 +1132,7 @@ async def get_average_sprint_velocity_per_team_endpoint(
     team_name: Optional[str] = Query(None, description="Team name or group name (if isGroup=true)"),
     isGroup: bool = Query(False, description="If true, team_name is treated as a group name"),
     pi: Optional[str] = Query(None, description="Program Increment name - if provided, uses teams that participate in this PI"),
-    conn: Connection = Depends(get_db_connection)
+    conn: AsyncConnection = Depends(get_async_db_connection)
 ):
     """
     Get average sprint velocity per team using the get_average_sprint_velocity_per_team database function.
@@ -1160,7 +1161,7 @@ async def get_average_sprint_velocity_per_team_endpoint(
             validated_pi = validate_pi(pi)
             
             # Get teams that participate in the PI (reuse function to avoid duplication)
-            pi_teams = get_pi_participating_teams_db(validated_pi, conn)
+            pi_teams = await run_sync_db(conn, get_pi_participating_teams_db, validated_pi)
             
             if not pi_teams:
                 return {
@@ -1180,7 +1181,7 @@ async def get_average_sprint_velocity_per_team_endpoint(
                 if isGroup:
                     validated_name = validate_group_name(team_name)
                     # Resolve group to team names
-                    group_teams = resolve_team_names_from_filter(validated_name, True, conn)
+                    group_teams = await run_sync_db(conn, resolve_team_names_from_filter, validated_name, True)
                     # Intersection: teams that are both in PI and in the group
                     team_names_list = [t for t in pi_teams if t in group_teams]
                 else:
@@ -1202,13 +1203,13 @@ async def get_average_sprint_velocity_per_team_endpoint(
                 validated_name = validate_team_name(team_name)
             
             # Resolve team names using shared helper function
-            team_names_list = resolve_team_names_from_filter(validated_name, isGroup, conn)
+            team_names_list = await run_sync_db(conn, resolve_team_names_from_filter, validated_name, isGroup)
         else:
             # No filters - use all teams (pass None to database function)
             team_names_list = None
         
         # Get velocity data from database function
-        velocity_data = get_average_sprint_velocity_per_team(validated_num_sprints, team_names_list, conn)
+        velocity_data = await run_sync_db(conn, get_average_sprint_velocity_per_team, validated_num_sprints, team_names_list)
         
         # Build response data
         response_data = {
@@ -13,6 +13,7 @@ import logging
 from datetime import datetime
 import re
 from database_connection import get_db_connection
+from pagination import FORMAT_JSON, FORMAT_NDJSON, decode_cursor, ndjson_response, split_page, validate_response_format
 import config
 
 logger = logging.getLogger(__name__)
@@ -93,16 +94,67 @@ def parse_date_from_filename(filename: str) -> Optional[str]:
     
     return None
 
+def validate_limit(limit: int) -> int:
+    """
+    Validate limit parameter to prevent abuse.
+    """
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="Limit must be at least 1")
+    
+    if limit > 1000:  # Reasonable upper limit
+        raise HTTPException(status_code=400, detail="Limit cannot exceed 1000")
+    
+    return limit
+
+
+def _transcript_row_to_dict(row) -> Dict[str, Any]:
+    # Truncate raw_text to first 200 characters with ellipsis when longer
+    raw_text_content = row[5]
+    if isinstance(raw_text_content, str) and len(raw_text_content) > 200:
+        raw_text_content = raw_text_content[:200] + "..."
+
+    return {
+        "id": row[0],
+        "transcript_date_time": row[1],
+        "team_name": row[2],
+        "pi": row[7],
+        "type": row[3],
+        "file_name": row[4],
+        "raw_text": raw_text_content,
+        "origin": row[6]
+    }
+
+
 @transcripts_router.get("/transcripts")
-async def get_transcripts(conn: Connection = Depends(get_db_connection)):
+async def get_transcripts(
+    limit: int = Query(100, description="Number of transcripts to return (default: 100, max: 1000)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    response_format: str = Query(FORMAT_JSON, alias="format", description="json (paged) or ndjson (stream all transcripts)"),
+    conn: Connection = Depends(get_db_connection)
+):
     """
-    Get the latest 100 transcripts from transcripts table.
+    Get the latest transcripts from transcripts table (100 per page by default).
     Uses parameterized queries to prevent SQL injection.
     
+    Pages are keyset-paginated: pass data.next_cursor as cursor to get the next page (null on the last page).
+    With format=ndjson all transcripts are streamed, one JSON object per line (limit is ignored).
+    
     Returns:
-        JSON response with list of transcripts and count
+        JSON response with list of transcripts and count, or an NDJSON stream
     """
     try:
+        validated_limit = validate_limit(limit)
+        validate_response_format(response_format)
+        cursor_id = decode_cursor(cursor, {})
+        
+        # Keyset pagination: continue after the last transcript of the previous page
+        params: Dict[str, Any] = {"limit": validated_limit + 1}
+        where_clause = ""
+        if cursor_id is not None:
+            where_clause = "WHERE id < :cursor_id"
+            params["cursor_id"] = cursor_id
+        limit_clause = "" if response_format == FORMAT_NDJSON else "LIMIT :limit"
+        
         # SECURE: Parameterized query prevents SQL injection
         # Only return selected fields for the collection endpoint
         query = text(f"""
@@ -118,45 +170,36 @@ async def get_transcripts(conn: Connection = Depends(get_db_connection)):
                 created_at,
                 updated_at
             FROM {config.TRANSCRIPTS_TABLE}
+            {where_clause}
             ORDER BY id DESC 
-            LIMIT 100
+            {limit_clause}
         """)
         
-        logger.info(f"Executing query to get latest 100 transcripts from {config.TRANSCRIPTS_TABLE}")
+        if response_format == FORMAT_NDJSON:
+            logger.info(f"Streaming all transcripts from {config.TRANSCRIPTS_TABLE}")
+            return ndjson_response(query, params, _transcript_row_to_dict)
+        
+        logger.info(f"Executing query to get latest {validated_limit} transcripts from {config.TRANSCRIPTS_TABLE}")
         
         # Execute query with connection from dependency
-        result = conn.execute(query)
-        rows = result.fetchall()
+        result = conn.execute(query, params)
+        rows, next_cursor = split_page(result.fetchall(), validated_limit, 0, {})
         
         # Convert rows to list of dictionaries
-        transcripts = []
-        for row in rows:
-            # Truncate raw_text to first 200 characters with ellipsis when longer
-            raw_text_content = row[5]
-            if isinstance(raw_text_content, str) and len(raw_text_content) > 200:
-                raw_text_content = raw_text_content[:200] + "..."
-
-            transcript_dict = {
-                "id": row[0],
-                "transcript_date_time": row[1],
-                "team_name": row[2],
-                "pi": row[7],
-                "type": row[3],
-                "file_name": row[4],
-                "raw_text": raw_text_content,
-                "origin": row[6]
-            }
-            transcripts.append(transcript_dict)
+        transcripts = [_transcript_row_to_dict(row) for row in rows]
         
         return {
             "success": True,
             "data": {
                 "transcripts": transcripts,
-                "count": len(transcripts)
+                "count": len(transcripts),
+                "next_cursor": next_cursor
             },
             "message": f"Retrieved {len(transcripts)} transcripts"
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching transcripts: {e}")
         raise HTTPException(
@@ -164,6 +207,7 @@ async def get_transcripts(conn: Connection = Depends(get_db_connection)):
             detail=f"Failed to fetch transcripts: {str(e)}"
         )
 
+
 @transcripts_router.get("/transcripts/getLatest")
 async def get_latest_transcripts(
     type: Optional[str] = Query(None, description="Transcript type: 'Daily' or 'PI Sync'"),